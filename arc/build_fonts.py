@@ -0,0 +1,136 @@
+"""Build step that subsets Roboto into self-hosted WOFF2 files.
+
+Takes the directory holding the Roboto TTF files (Apache 2.0, from
+https://github.com/googlefonts/roboto) and keeps the weights and the Latin
+characters the app uses:
+
+    python -m arc.build_fonts path/to/roboto
+
+The subsets go to `assets/fonts/`, named after a hash of their content like the
+images. `assets/fonts.css` declares them with `font-display: swap`, and the
+`arc.font_data` module lists their URLs, so the app can preload them.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+from pathlib import Path
+
+from arc.build_images import ASSETS_DIR, asset_url, hashed_path
+
+OUTPUT_DIR = ASSETS_DIR / "fonts"
+FONTS_CSS_PATH = ASSETS_DIR / "fonts.css"
+MANIFEST_PATH = Path(__file__).resolve().parent / "font_data.py"
+
+FAMILY = "Roboto"
+
+# Source file of each weight the UI uses; semibold text is drawn with the bold face
+WEIGHTS = {
+    400: "Roboto-Regular.ttf",
+    500: "Roboto-Medium.ttf",
+    700: "Roboto-Bold.ttf",
+}
+
+# The Latin range Google Fonts serves Roboto in; symbols outside it, like →, come from system fonts
+UNICODE_RANGE = (
+    "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+0304, U+0308, U+0329, "
+    "U+2000-206F, U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD"
+)
+
+
+def _codepoints(unicode_range: str) -> list[int]:
+    codepoints = []
+    for part in unicode_range.split(","):
+        start, _, end = part.strip().removeprefix("U+").partition("-")
+        codepoints.extend(range(int(start, 16), int(end or start, 16) + 1))
+    return codepoints
+
+
+def subset_font(source: Path) -> bytes:
+    """Returns a WOFF2 of the font with only the Latin range, its kerning and ligatures."""
+    from fontTools import subset
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt"]
+    # Hinting is not needed on the web; of the names, keep the family, copyright and license
+    options.name_IDs = [0, 1, 2, 13, 14]
+    options.hinting = False
+    options.desubroutinize = True
+    font = subset.load_font(str(source), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=_codepoints(UNICODE_RANGE))
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    subset.save_font(font, buffer, options)
+    return buffer.getvalue()
+
+
+def write_fonts_css(urls: dict[int, str]) -> None:
+    """Writes the @font-face rules as `assets/fonts.css`."""
+    faces = "".join(
+        "@font-face {\n"
+        f'  font-family: "{FAMILY}";\n'
+        "  font-style: normal;\n"
+        f"  font-weight: {weight};\n"
+        "  font-display: swap;\n"
+        f'  src: url({url}) format("woff2");\n'
+        f"  unicode-range: {UNICODE_RANGE};\n"
+        "}\n"
+        for weight, url in urls.items()
+    )
+    FONTS_CSS_PATH.write_text(
+        f"/* Self-hosted {FAMILY} subsets. Generated by `python -m arc.build_fonts`; do not edit. */\n{faces}"
+    )
+
+
+def write_manifest(urls: dict[int, str]) -> None:
+    """Writes the font URLs as the `arc.font_data` module."""
+    entries = "".join(f"    {weight}: {json.dumps(url)},\n" for weight, url in urls.items())
+    MANIFEST_PATH.write_text(
+        f'"""Self-hosted {FAMILY} subsets.\n\n'
+        "Generated by `python -m arc.build_fonts`; do not edit.\n"
+        '"""\n\n'
+        "# WOFF2 file of each font weight, preloaded by the app\n"
+        f"FONT_URLS: dict[int, str] = {{\n{entries}}}\n"
+    )
+
+
+def main() -> int:
+    if len(sys.argv) != 2:
+        print("Usage: python -m arc.build_fonts path/to/roboto", file=sys.stderr)
+        return 1
+    try:
+        import brotli  # noqa: F401  WOFF2 compression
+        import fontTools  # noqa: F401
+    except ImportError:
+        print("The font subsetter needs fontTools and brotli: pip install fonttools brotli", file=sys.stderr)
+        return 1
+
+    source_dir = Path(sys.argv[1])
+    missing = [name for name in WEIGHTS.values() if not (source_dir / name).is_file()]
+    if missing:
+        print(f"Missing in {source_dir}:", *missing, sep="\n  ", file=sys.stderr)
+        return 1
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    urls = {}
+    for weight, name in WEIGHTS.items():
+        content = subset_font(source_dir / name)
+        path = hashed_path(OUTPUT_DIR, f"{FAMILY.lower()}-{weight}", ".woff2", content)
+        path.write_bytes(content)
+        urls[weight] = asset_url(path)
+        print(f"{name}: {(source_dir / name).stat().st_size} -> {len(content)} bytes")
+    for path in OUTPUT_DIR.iterdir():
+        if asset_url(path) not in urls.values():
+            path.unlink()
+
+    write_fonts_css(urls)
+    write_manifest(urls)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""Build step that generates responsive variants and sprite atlases of the catalog images.
+
+Every item image the catalog references is resized to the widths it is displayed
+at (1x and 2x) and encoded as AVIF and WebP, with all metadata stripped. The
+variants go to `assets/img/`, and their srcsets and the source's intrinsic size
+are written to `arc.image_data`, which the catalog reads. The catalog also
+rewrites each item's `image` to its largest WebP variant, which the loadout slots
+load.
+
+Symbols and resource icons are small and shown many at once, so instead of one
+file each they are packed into one atlas per folder. `assets/sprites.css` is the
+coordinate map: it points each icon URL, given as a `data-sprite` attribute, at
+its cell of the atlas.
+
+    python -m arc.build_images
+
+Every generated file is named after a hash of its content, so its URL never
+changes meaning and can be served as immutable. A variant's hash is taken over
+its source and encoder settings, so re-running only encodes what changed. Files
+that are no longer generated are removed.
+
+A reference to a missing file falls back to a source with the same name and
+another extension, since some art only exists as WebP.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import math
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+    from arc.state import ImageVariants
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+OUTPUT_DIR = ASSETS_DIR / "img"
+MANIFEST_PATH = Path(__file__).resolve().parent / "image_data.py"
+SPRITES_CSS_PATH = ASSETS_DIR / "sprites.css"
+
+SOURCE_EXTENSIONS = (".png", ".webp", ".jpg", ".jpeg")
+
+# Widths each asset folder is encoded at: its display width in CSS pixels, and double for HiDPI screens
+VARIANT_WIDTHS = {
+    "items": (140, 280),
+}
+
+# Cell size of each atlas in pixels, double the largest size its icons are displayed at
+ATLAS_CELLS = {
+    "symbols": 48,
+    "resources": 96,
+}
+
+# Encoder settings per output format, in the order a <picture> offers them to the browser
+FORMATS = {
+    "avif": {"quality": 55, "speed": 4},
+    "webp": {"quality": 80, "method": 6},
+}
+
+
+def referenced_images() -> list[str]:
+    """Returns the URL of every image and symbol in the catalog data, including older patches."""
+    from arc.items_data import ITEMS
+    from arc.patches_data import CATALOG_PATCHES
+    from arc.resource_data import RESOURCES
+    from arc.weapon_mods_data import WEAPON_MODS
+
+    entries = [*ITEMS, *WEAPON_MODS, *RESOURCES]
+    for patch in CATALOG_PATCHES.values():
+        entries += [*patch["items"], *patch["resources"]]
+    urls = {entry.get(field) for entry in entries for field in ("image", "symbol")}
+    return sorted(url for url in urls if url)
+
+
+def find_source(url: str) -> Path | None:
+    """Returns the file behind an asset URL, or one with the same name and another extension."""
+    path = ASSETS_DIR / url.lstrip("/")
+    if path.is_file():
+        return path
+    for extension in SOURCE_EXTENSIONS:
+        if path.with_suffix(extension).is_file():
+            return path.with_suffix(extension)
+    return None
+
+
+def _open_rgba(source: Path) -> Image:
+    from PIL import Image as PILImage
+
+    with PILImage.open(source) as opened:
+        return opened.convert("RGBA")
+
+
+def _variant_widths(folder: str, source_width: int) -> list[int]:
+    # Never upscale: widths past the source are served by the source's own width
+    return sorted({min(width, source_width) for width in VARIANT_WIDTHS[folder]})
+
+
+def _encode(image: Image, width: int, image_format: str) -> bytes:
+    from PIL import Image as PILImage
+
+    height = max(1, round(image.height * width / image.width))
+    variant = image if width == image.width else image.resize((width, height), PILImage.Resampling.LANCZOS)
+    # No exif, icc_profile or xmp is passed on, and the cleared info keeps encoders from copying them
+    variant.info = {}
+    buffer = io.BytesIO()
+    variant.save(buffer, image_format.upper(), **FORMATS[image_format])
+    return buffer.getvalue()
+
+
+def hashed_path(directory: Path, name: str, suffix: str, content: bytes) -> Path:
+    """Returns the path of a generated file, named after a hash of its content."""
+    return directory / f"{name}.{hashlib.sha256(content).hexdigest()[:12]}{suffix}"
+
+
+def asset_url(path: Path) -> str:
+    """Returns the URL an asset file is served at."""
+    return f"/{path.relative_to(ASSETS_DIR).as_posix()}"
+
+
+def build_variants(url: str, source: Path, generated: set[Path]) -> ImageVariants:
+    """Encodes the variants of one image that do not exist yet, adding their paths to `generated`."""
+    from PIL import Image as PILImage
+
+    folder = Path(url).parent.name
+    source_bytes = source.read_bytes()
+    with PILImage.open(source) as opened:
+        source_width, source_height = opened.size
+    widths = _variant_widths(folder, source_width)
+
+    image = None
+    variant_urls: dict[str, list[str]] = {}
+    for image_format in FORMATS:
+        variant_urls[image_format] = []
+        for width in widths:
+            recipe = source_bytes + json.dumps([image_format, width, FORMATS[image_format]]).encode()
+            path = hashed_path(OUTPUT_DIR / folder, f"{source.stem}-{width}w", f".{image_format}", recipe)
+            if not path.exists():
+                image = image or _open_rgba(source)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(_encode(image, width, image_format))
+            generated.add(path)
+            variant_urls[image_format].append(asset_url(path))
+    srcsets = {
+        image_format: ", ".join(f"{variant} {width}w" for variant, width in zip(urls, widths))
+        for image_format, urls in variant_urls.items()
+    }
+
+    return {
+        # The 1x WebP, for browsers that ignore srcset
+        "src": variant_urls["webp"][0],
+        "webp": srcsets["webp"],
+        "avif": srcsets["avif"],
+        "width": source_width,
+        "height": source_height,
+    }
+
+
+def build_atlas(folder: str, sources: dict[str, Path], generated: set[Path]) -> str:
+    """Packs the icons of one folder into an atlas and returns its CSS rules.
+
+    Icons are fitted into square cells of a grid, so each one is addressed by a
+    percentage background position that holds at any display size.
+    """
+    from PIL import Image as PILImage
+
+    cell = ATLAS_CELLS[folder]
+    paths = sorted(set(sources.values()))
+    columns = math.ceil(math.sqrt(len(paths)))
+    rows = math.ceil(len(paths) / columns)
+    atlas = PILImage.new("RGBA", (columns * cell, rows * cell))
+    positions = {}
+    for index, path in enumerate(paths):
+        row, column = divmod(index, columns)
+        icon = _open_rgba(path)
+        icon.thumbnail((cell, cell), PILImage.Resampling.LANCZOS)
+        atlas.paste(icon, (column * cell + (cell - icon.width) // 2, row * cell + (cell - icon.height) // 2))
+        positions[path] = (column, row)
+
+    urls = {}
+    for image_format in FORMATS:
+        content = _encode(atlas, atlas.width, image_format)
+        path = hashed_path(OUTPUT_DIR, f"{folder}-atlas", f".{image_format}", content)
+        if not path.exists():
+            path.write_bytes(content)
+        generated.add(path)
+        urls[image_format] = asset_url(path)
+
+    def percent(index: int, count: int) -> str:
+        return f"{index * 100 / (count - 1):g}%" if count > 1 else "0%"
+
+    image_set = ", ".join(f'url({url}) type("image/{image_format}")' for image_format, url in urls.items())
+    rules = [
+        f'[data-sprite^="/{folder}/"] {{\n'
+        f"  background-image: url({urls['webp']});\n"
+        f"  background-image: image-set({image_set});\n"
+        f"  background-size: {columns * 100}% {rows * 100}%;\n"
+        "}",
+    ]
+    for url, path in sorted(sources.items()):
+        column, row = positions[path]
+        rules.append(
+            f'[data-sprite="{url}"] {{\n  background-position: {percent(column, columns)} {percent(row, rows)};\n}}'
+        )
+    return "\n".join(rules)
+
+
+def write_manifest(image_urls: dict[str, str], images: dict[str, ImageVariants]) -> None:
+    """Writes the rewritten image URLs and the variants of every image as the `arc.image_data` module."""
+    url_entries = "".join(f"    {json.dumps(url)}: {json.dumps(rewritten)},\n" for url, rewritten in image_urls.items())
+    image_entries = "".join(f"    {json.dumps(url)}: {json.dumps(variants)},\n" for url, variants in images.items())
+    MANIFEST_PATH.write_text(
+        '"""Content-hashed URLs and responsive variants of the catalog images.\n\n'
+        "Generated by `python -m arc.build_images`; do not edit.\n"
+        '"""\n\n'
+        "from arc.state import ImageVariants\n\n"
+        "# What the catalog rewrites each image URL of the data modules to\n"
+        f"IMAGE_URLS: dict[str, str] = {{\n{url_entries}}}\n\n"
+        "# Variants of each image, keyed by its rewritten URL\n"
+        f"IMAGES: dict[str, ImageVariants] = {{\n{image_entries}}}\n"
+    )
+
+
+def write_sprites_css(atlas_rules: list[str]) -> None:
+    """Writes the atlas coordinate map as `assets/sprites.css`."""
+    SPRITES_CSS_PATH.write_text(
+        "/* Sprite atlases of the catalog icons. Generated by `python -m arc.build_images`; do not edit.\n"
+        "   An element with data-sprite set to an icon URL shows that icon's cell. */\n"
+        ".sprite {\n"
+        "  background-repeat: no-repeat;\n"
+        "  background-origin: content-box;\n"
+        "  background-clip: content-box;\n"
+        "}\n"
+        + "\n".join(atlas_rules) + "\n"
+    )
+
+
+def main() -> int:
+    try:
+        from PIL import features
+    except ImportError:
+        print("The image pipeline needs Pillow: pip install pillow", file=sys.stderr)
+        return 1
+    missing_formats = [image_format for image_format in FORMATS if not features.check(image_format)]
+    if missing_formats:
+        print(f"Pillow was built without {', '.join(missing_formats)} support", file=sys.stderr)
+        return 1
+
+    image_urls: dict[str, str] = {}
+    images: dict[str, ImageVariants] = {}
+    built: dict[Path, str] = {}
+    generated: set[Path] = set()
+    atlas_sources: dict[str, dict[str, Path]] = {folder: {} for folder in ATLAS_CELLS}
+    unresolved = []
+    for url in referenced_images():
+        source = find_source(url)
+        folder = Path(url).parent.name
+        if source is None or (folder not in VARIANT_WIDTHS and folder not in ATLAS_CELLS):
+            unresolved.append(url)
+        elif folder in ATLAS_CELLS:
+            atlas_sources[folder][url] = source
+        # Two URLs may resolve to the same source, and so share its variants
+        elif source in built:
+            image_urls[url] = image_urls[built[source]]
+        else:
+            built[source] = url
+            variants = build_variants(url, source, generated)
+            # The largest WebP, for the loadout slots, which show the image without a srcset
+            image_urls[url] = variants["webp"].split(", ")[-1].split(" ")[0]
+            images[image_urls[url]] = variants
+
+    write_manifest(image_urls, images)
+    write_sprites_css([
+        build_atlas(folder, sources, generated) for folder, sources in atlas_sources.items() if sources
+    ])
+    for path in OUTPUT_DIR.rglob("*"):
+        if path.is_file() and path not in generated:
+            path.unlink()
+    if unresolved:
+        print("No source image for:", *unresolved, sep="\n  ", file=sys.stderr)
+    atlas_count = sum(len(sources) for sources in atlas_sources.values())
+    print(f"Built variants of {len(built)} images and atlases of {atlas_count} icons to {OUTPUT_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Build step that writes the offline catalog and the service worker.
+
+Run it after the image and font build steps, since the worker precaches their
+output:
+
+    python -m arc.build_offline
+
+`assets/catalog.json` holds what the offline item grid in `assets/offline.js`
+needs to show and filter the current catalog. `assets/sw.js` precaches that
+catalog, the app shell, the icon atlases, the fonts and the 1x item images. It
+caches the page's bundles on the first visit and everything else as it is
+fetched. The cache is named after the catalog fingerprint and the precache list.
+Any change to the data or the assets therefore installs a new worker, which
+deletes the older caches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+
+from arc.build_images import ASSETS_DIR, OUTPUT_DIR, asset_url
+from arc.build_fonts import OUTPUT_DIR as FONTS_DIR
+from arc.catalog import DATA_MODULES, get_catalog
+from arc.catalog_store import catalog_fingerprint
+from arc.static_cache import IMMUTABLE_PREFIXES
+
+CATALOG_JSON_PATH = ASSETS_DIR / "catalog.json"
+SERVICE_WORKER_PATH = ASSETS_DIR / "sw.js"
+
+# Precached besides the generated assets: the page itself and its offline script
+APP_SHELL = ("/", "/offline.js", "/catalog.json", "/favicon.ico")
+
+SERVICE_WORKER = """\
+// Generated by `python -m arc.build_offline`; do not edit.
+const CACHE = "arc-%(version)s";
+const PRECACHE = %(precache)s;
+// Content-hashed, so a cached copy is always current
+const IMMUTABLE = %(immutable)s;
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches.open(CACHE)
+      .then((cache) => cache.addAll(PRECACHE.map((url) => new Request(url, { cache: "reload" }))))
+      .then(() => self.skipWaiting()),
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches.keys()
+      .then((keys) => Promise.all(keys.filter((key) => key.startsWith("arc-") && key !== CACHE).map((key) => caches.delete(key))))
+      .then(() => self.clients.claim()),
+  );
+});
+
+// The page sends the URLs it loaded before this worker controlled it
+self.addEventListener("message", (event) => {
+  if (Array.isArray(event.data?.cache)) {
+    event.waitUntil(caches.open(CACHE).then((cache) => Promise.all(event.data.cache.map(
+      (url) => cache.match(url).then((cached) => cached || cache.add(url).catch(() => undefined)),
+    ))));
+  }
+});
+
+const fetchAndCache = (request, cache) => fetch(request).then((response) => {
+  if (response.ok) cache.put(request, response.clone());
+  return response;
+});
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  const url = new URL(request.url);
+  // Leave the backend's event, upload and health endpoints to the network
+  if (request.method !== "GET" || url.origin !== location.origin || url.pathname.startsWith("/_") || url.pathname === "/ping") {
+    return;
+  }
+  const key = request.mode === "navigate" ? "/" : request;
+  event.respondWith(caches.open(CACHE).then((cache) => cache.match(key).then((cached) => {
+    if (cached && IMMUTABLE.some((prefix) => url.pathname.startsWith(prefix))) {
+      return cached;
+    }
+    // Serve the cached copy at once and refresh it in the background
+    const refreshed = fetchAndCache(request.mode === "navigate" ? "/" : request, cache);
+    if (cached) {
+      event.waitUntil(refreshed.catch(() => undefined));
+      return cached;
+    }
+    return refreshed;
+  })));
+});
+"""
+
+
+def write_catalog_json() -> None:
+    """Writes the current catalog's browsable items as `assets/catalog.json`."""
+    catalog = get_catalog()
+    items = [
+        {
+            "id": item["id"],
+            "name": item["name"],
+            "category": item["category"],
+            "rarity": item["rarity"],
+            "image": catalog.picture(item["image"])["src"] if item["image"] else None,
+            "symbol": item["symbol"],
+            "search": catalog.search_keys[item["id"]],
+        }
+        for item in catalog.items
+    ]
+    CATALOG_JSON_PATH.write_text(json.dumps(items, separators=(",", ":")))
+
+
+def precache_urls() -> list[str]:
+    """Returns the app shell, the atlases, the fonts and the 1x item images."""
+    catalog = get_catalog()
+    atlases = sorted(asset_url(path) for path in OUTPUT_DIR.glob("*-atlas.*"))
+    fonts = sorted(asset_url(path) for path in FONTS_DIR.glob("*.woff2"))
+    images = sorted({catalog.picture(item["image"])["src"] for item in catalog.items if item["image"]})
+    return [*APP_SHELL, *atlases, *fonts, *images]
+
+
+def main() -> int:
+    write_catalog_json()
+    precache = precache_urls()
+    missing = [url for url in precache if url != "/" and not (ASSETS_DIR / url.lstrip("/")).is_file()]
+    if missing:
+        print("Missing precached files, run the image and font build steps first:", *missing, sep="\n  ", file=sys.stderr)
+        return 1
+
+    fingerprint = catalog_fingerprint(DATA_MODULES)
+    # The precached files are hashed or listed by hash, except the shell files, whose content is added here
+    contents = hashlib.sha256(json.dumps(precache).encode())
+    for url in APP_SHELL[1:]:
+        contents.update((ASSETS_DIR / url.lstrip("/")).read_bytes())
+    SERVICE_WORKER_PATH.write_text(SERVICE_WORKER % {
+        "version": f"{fingerprint[:12]}-{contents.hexdigest()[:8]}",
+        "precache": json.dumps(precache, indent=2),
+        "immutable": json.dumps(list(IMMUTABLE_PREFIXES)),
+    })
+    size = sum((ASSETS_DIR / url.lstrip("/")).stat().st_size for url in precache if url != "/")
+    print(f"Wrote {SERVICE_WORKER_PATH} precaching {len(precache)} files ({size} bytes besides the page)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,623 @@
+"""Lazily loaded item and resource catalog.
+
+The data modules (`arc.items_data`, `arc.resource_data`, ...) are only imported
+the first time the catalog is accessed, so importing `arc.state` stays cheap.
+Workers can call `warm_catalog()` after forking to pay that cost up front.
+
+When a data module changes on disk, `watch_catalog()` reloads it and swaps in a
+new catalog that reuses every index entry of the items that did not change.
+
+Older game patches are stored in `arc.patches_data` as the entries that differ
+from the current data. `get_catalog(version)` builds each version once, sharing
+every unchanged entry with the current catalog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+import logging
+import re
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from arc.dnd_config import DRAG_TYPES, MOD_SLOT_TYPES
+
+if TYPE_CHECKING:
+    # arc.state imports this module, so its types are only needed for annotations
+    from arc.catalog_store import CatalogStore
+    from arc.state import CatalogPatch, ImageVariants, Item, Resource, ResourceCost, TierCost
+
+logger = logging.getLogger(__name__)
+
+# Data modules in dependency order: a module may only import modules listed before it
+DATA_MODULES = (
+    "arc.image_data", "arc.resource_data", "arc.augments_data", "arc.weapon_mods_data", "arc.items_data", "arc.salvage_data",
+    "arc.patches_data",
+)
+
+# Name of the version described by the data modules themselves
+DEFAULT_VERSION = "Current"
+
+# Tiers every weapon must define, matching the tier selectors
+WEAPON_TIERS = (1, 2, 3, 4)
+
+
+class CatalogError(ValueError):
+    """Raised when the catalog data fails its integrity checks."""
+
+
+def validate_catalog(items: list[Item], resources: list[Resource]) -> list[str]:
+    """Returns a description of every integrity problem in the catalog data."""
+    errors: list[str] = []
+    resource_ids = {r["id"] for r in resources}
+
+    def check_costs(owner: str, costs: list[ResourceCost]) -> None:
+        for cost in costs:
+            if cost["resource"] not in resource_ids:
+                errors.append(f"{owner}: unknown resource '{cost['resource']}'")
+
+    def check_unique(kind: str, ids: list[str]) -> None:
+        seen: set[str] = set()
+        for entry_id in ids:
+            if entry_id in seen:
+                errors.append(f"duplicate {kind} id '{entry_id}'")
+            seen.add(entry_id)
+
+    check_unique("resource", [r["id"] for r in resources])
+    check_unique("item", [i["id"] for i in items])
+
+    for resource in resources:
+        if resource["stack_size"] < 1:
+            errors.append(f"{resource['id']}: stack size must be at least 1")
+        if resource["resource_type"] == "refined" and not resource["resources"]:
+            errors.append(f"{resource['id']}: refined resource has no components")
+        check_costs(resource["id"], resource["resources"])
+
+    for item in items:
+        if item["category"] == "Weapon Mod":
+            if item.get("mod_type") not in MOD_SLOT_TYPES:
+                errors.append(f"{item['id']}: unknown mod type '{item.get('mod_type')}'")
+        elif item["category"] not in DRAG_TYPES:
+            errors.append(f"{item['id']}: category '{item['category']}' has no slot type")
+
+        if item["category"] == "Weapon":
+            tiers = sorted(item["tier_resources"])
+            if tiers != list(WEAPON_TIERS):
+                errors.append(f"{item['id']}: defines tiers {tiers}, expected {list(WEAPON_TIERS)}")
+            for tier, costs in item["tier_resources"].items():
+                check_costs(f"{item['id']} tier {tier}", costs)
+            for slot in item.get("weapon_mod_slots") or []:
+                if slot not in MOD_SLOT_TYPES:
+                    errors.append(f"{item['id']}: unknown weapon mod slot '{slot}'")
+        else:
+            check_costs(item["id"], item["resources"])
+
+    return errors
+
+
+def check_catalog(items: list[Item], resources: list[Resource]) -> None:
+    """Raises a CatalogError listing every integrity problem in the catalog data."""
+    errors = validate_catalog(items, resources)
+    if errors:
+        raise CatalogError("Invalid catalog data:\n  " + "\n  ".join(errors))
+
+
+# Costs are dense vectors with one entry per resource, in `Catalog.resource_ids` order.
+# Vectors are tuples, or read-only memoryview rows when loaded from a catalog store.
+CostVector = Sequence[int]
+
+# Cumulative costs of an item: index 0 is empty, index N sums tiers 1..N.
+# Non-weapon items have a single entry at index 1.
+ItemBom = tuple[CostVector, ...]
+
+
+def _with_image_url(item: Item, image_urls: dict[str, str]) -> Item:
+    """Returns the item with its image rewritten to the built URL, or the item itself if it has none."""
+    if item["image"] in image_urls:
+        return {**item, "image": image_urls[item["image"]]}
+    return item
+
+
+class Catalog:
+    """An immutable snapshot of the item and resource data with its derived indexes."""
+
+    def __init__(self, items: list[Item], resources: list[Resource], weapon_mods: list[Item], revision: int = 0):
+        check_catalog(items + weapon_mods, resources)
+        self._set_data(items, resources, weapon_mods, revision)
+
+        # Components each refined resource breaks down into
+        self.decomposition: dict[str, CostVector] = {
+            r["id"]: self._cost_vector(r["resources"]) for r in resources if r["resource_type"] == "refined"
+        }
+        self.decomposition_order = self._build_decomposition_order()
+
+        # Per-item bill of materials, search key and reverse index postings
+        self.item_bom: dict[str, ItemBom] = {}
+        self.search_keys: dict[str, str] = {}
+        self.items_by_resource: dict[str, frozenset[str]] = {}
+        for item in items + weapon_mods:
+            self._index_item(item)
+
+    @classmethod
+    def from_store(cls, items: list[Item], resources: list[Resource], weapon_mods: list[Item], store: CatalogStore) -> Catalog:
+        """Returns a catalog whose indexes and cost rows come from a compiled store.
+
+        The store is only written for data that passed `check_catalog`.
+        """
+        catalog = cls.__new__(cls)
+        catalog._set_data(items, resources, weapon_mods, revision=0)
+        if list(catalog.resource_ids) != store.header["resource_ids"]:
+            raise ValueError("Catalog store was compiled for different resources")
+
+        catalog.decomposition = {
+            resource_id: store.row(row) for resource_id, row in store.header["decomposition_rows"].items()
+        }
+        catalog.decomposition_order = tuple(store.header["decomposition_order"])
+        catalog.item_bom = {
+            item_id: tuple(store.row(start + tier) for tier in range(count))
+            for item_id, (start, count) in store.header["item_rows"].items()
+        }
+        catalog.search_keys = store.header["search_keys"]
+        catalog.items_by_resource = {
+            resource_id: frozenset(item_ids) for resource_id, item_ids in store.header["items_by_resource"].items()
+        }
+        return catalog
+
+    def _set_data(self, items: list[Item], resources: list[Resource], weapon_mods: list[Item], revision: int) -> None:
+        """Stores the raw data and the lookup tables derived directly from it."""
+        # Built by `python -m arc.build_images`, imported here so reloads are seen
+        from arc.image_data import IMAGE_URLS, IMAGES
+
+        # Point item images at their content-hashed files, which can be cached for good
+        items = [_with_image_url(item, IMAGE_URLS) for item in items]
+        weapon_mods = [_with_image_url(mod, IMAGE_URLS) for mod in weapon_mods]
+        self.images: dict[str, ImageVariants] = IMAGES
+
+        self.items = items
+        self.resources = resources
+        self.weapon_mods = weapon_mods
+        self.revision = revision
+
+        # Weapon mods are looked up and priced like items, but are not listed in the item browser
+        self.item_by_id: dict[str, Item] = {i["id"]: i for i in items + weapon_mods}
+        self.resource_by_id: dict[str, Resource] = {r["id"]: r for r in resources}
+        self.resource_name_to_id: dict[str, str] = {r["name"]: r["id"] for r in resources}
+
+        # Column order of every cost vector
+        self.resource_ids: tuple[str, ...] = tuple(r["id"] for r in resources)
+        self.resource_index: dict[str, int] = {rid: index for index, rid in enumerate(self.resource_ids)}
+        self.stack_sizes: tuple[int, ...] = tuple(r["stack_size"] for r in resources)
+
+        # Mods that fit each weapon mod slot, so a socket's options need no scan
+        mods_by_type: dict[str, list[str]] = {}
+        for mod in weapon_mods:
+            mods_by_type.setdefault(mod["mod_type"], []).append(mod["id"])
+        self.mods_by_type: dict[str, tuple[str, ...]] = {
+            mod_type: tuple(mod_ids) for mod_type, mod_ids in mods_by_type.items()
+        }
+
+        # max_craftable() results keyed by the owned vector
+        self._craftable_cache: dict[tuple[int, ...], dict[str, tuple[int, ...]]] = {}
+        # Per-tier cost of every item for the hover tooltip, built on first use
+        self._tier_costs: dict[str, list[TierCost]] | None = None
+
+    def _cost_vector(self, costs: list[ResourceCost], base: CostVector | None = None) -> CostVector:
+        """Returns base plus the given resource costs as a cost vector."""
+        vector = list(base) if base is not None else [0] * len(self.resource_ids)
+        for cost in costs:
+            vector[self.resource_index[cost["resource"]]] += cost["quantity"]
+        return tuple(vector)
+
+    def _build_item_bom(self, item: Item) -> ItemBom:
+        """Builds the cumulative per-tier bill of materials for an item."""
+        empty = self._cost_vector([])
+        if item["category"] != "Weapon":
+            return (empty, self._cost_vector(item["resources"]))
+
+        bom = [empty]
+        for tier in sorted(item["tier_resources"]):
+            bom.append(self._cost_vector(item["tier_resources"][tier], bom[-1]))
+        return tuple(bom)
+
+    def _build_decomposition_order(self) -> tuple[int, ...]:
+        """Orders the refined resources so each comes before the refined resources it is made from."""
+        order: list[int] = []
+        visited: set[str] = set()
+
+        def visit(resource_id: str) -> None:
+            if resource_id in visited:
+                return
+            visited.add(resource_id)
+            for index, quantity in enumerate(self.decomposition[resource_id]):
+                if quantity and self.resource_ids[index] in self.decomposition:
+                    visit(self.resource_ids[index])
+            order.append(self.resource_index[resource_id])
+
+        for resource_id in self.decomposition:
+            visit(resource_id)
+        return tuple(reversed(order))
+
+    def _index_item(self, item: Item) -> None:
+        """Adds the index entries for a single item."""
+        bom = self._build_item_bom(item)
+        self.item_bom[item["id"]] = bom
+        self.search_keys[item["id"]] = item["name"].lower()
+        for resource_id in self.to_resource_dict(bom[-1]):
+            postings = self.items_by_resource.get(resource_id, frozenset())
+            self.items_by_resource[resource_id] = postings | {item["id"]}
+
+    def _unindex_item(self, item_id: str) -> None:
+        """Removes the index entries for a single item."""
+        bom = self.item_bom.pop(item_id)
+        del self.search_keys[item_id]
+        for resource_id in self.to_resource_dict(bom[-1]):
+            postings = self.items_by_resource[resource_id] - {item_id}
+            if postings:
+                self.items_by_resource[resource_id] = postings
+            else:
+                del self.items_by_resource[resource_id]
+
+    def updated(
+        self, items: list[Item], resources: list[Resource], weapon_mods: list[Item], revision: int | None = None
+    ) -> Catalog:
+        """Returns a new catalog for the given data, rebuilding only the changed entries."""
+        revision = self.revision + 1 if revision is None else revision
+        check_catalog(items + weapon_mods, resources)
+        if [r["id"] for r in resources] != list(self.resource_ids):
+            # Every cost vector changes shape, so nothing can be shared
+            logger.info("Catalog revision %d: resource list changed, rebuilding all items", revision)
+            return Catalog(items, resources, weapon_mods, revision)
+
+        catalog = Catalog.__new__(Catalog)
+        catalog._set_data(items, resources, weapon_mods, revision)
+
+        # Start from shallow copies so the live catalog is never mutated
+        catalog.item_bom = dict(self.item_bom)
+        catalog.search_keys = dict(self.search_keys)
+        catalog.items_by_resource = dict(self.items_by_resource)
+        catalog.decomposition = dict(self.decomposition)
+
+        for resource in resources:
+            if resource != self.resource_by_id[resource["id"]] and resource["resource_type"] == "refined":
+                catalog.decomposition[resource["id"]] = catalog._cost_vector(resource["resources"])
+            elif resource["resource_type"] != "refined":
+                catalog.decomposition.pop(resource["id"], None)
+        catalog.decomposition_order = catalog._build_decomposition_order()
+
+        changed = [
+            item_id
+            for item_id in self.item_by_id.keys() | catalog.item_by_id.keys()
+            if self.item_by_id.get(item_id) != catalog.item_by_id.get(item_id)
+        ]
+        for item_id in changed:
+            if item_id in self.item_by_id:
+                catalog._unindex_item(item_id)
+            if item_id in catalog.item_by_id:
+                catalog._index_item(catalog.item_by_id[item_id])
+
+        logger.info("Catalog revision %d: rebuilt %d item(s)", catalog.revision, len(changed))
+        return catalog
+
+    def patched(self, patch: CatalogPatch) -> Catalog:
+        """Returns a catalog with the patch's entries replacing or extending this one's."""
+        removed = set(patch["removed_items"])
+        item_overrides = {i["id"]: i for i in patch["items"]}
+        added = [i for i in patch["items"] if i["id"] not in self.item_by_id]
+        items = [item_overrides.get(i["id"], i) for i in self.items if i["id"] not in removed]
+        items += [i for i in added if i["category"] != "Weapon Mod"]
+        weapon_mods = [item_overrides.get(m["id"], m) for m in self.weapon_mods if m["id"] not in removed]
+        weapon_mods += [i for i in added if i["category"] == "Weapon Mod"]
+
+        resource_overrides = {r["id"]: r for r in patch["resources"]}
+        resources = [resource_overrides.get(r["id"], r) for r in self.resources]
+        resources += [r for r in patch["resources"] if r["id"] not in self.resource_by_id]
+
+        return self.updated(items, resources, weapon_mods, revision=self.revision)
+
+    def item_cost(self, item_id: str | None, tier: int | None = None) -> CostVector:
+        """Returns the cumulative cost vector of an item, up to the given tier for weapons."""
+        bom = self.item_bom.get(item_id)
+        if not bom:
+            return ()
+        if self.item_by_id[item_id]["category"] != "Weapon":
+            return bom[1]
+        return bom[min(tier or 1, len(bom) - 1)]
+
+    def upgrade_cost(self, item_id: str | None, from_tier: int, to_tier: int) -> CostVector:
+        """Returns the cost to take a weapon from an owned tier up to a higher one.
+
+        The bill of materials holds cumulative per-tier sums, so any tier interval
+        is a single subtraction of two rows.
+        """
+        if not from_tier:
+            return self.item_cost(item_id, to_tier)
+        bom = self.item_bom.get(item_id)
+        if not bom:
+            return ()
+        to_tier = min(to_tier, len(bom) - 1)
+        from_tier = min(from_tier, to_tier)
+        return [high - low for high, low in zip(bom[to_tier], bom[from_tier])]
+
+    def tier_costs(self, item_id: str) -> list[TierCost]:
+        """Returns what each tier of an item costs on its own, by resource name.
+
+        Items other than weapons have a single row with tier 0. The table covers
+        every item and is built once per catalog, so hovering only looks it up.
+        """
+        if self._tier_costs is None:
+            table: dict[str, list[TierCost]] = {}
+            for entry_id, bom in self.item_bom.items():
+                rows = [(tier, self.upgrade_cost(entry_id, tier - 1, tier)) for tier in range(1, len(bom))]
+                if self.item_by_id[entry_id]["category"] != "Weapon":
+                    rows = [(0, bom[1])]
+                table[entry_id] = [
+                    {
+                        "tier": tier,
+                        "resources": [
+                            {"name": self.resource_by_id[resource_id]["name"], "quantity": quantity}
+                            for resource_id, quantity in self.to_resource_dict(vector).items()
+                        ],
+                    }
+                    for tier, vector in rows
+                ]
+            self._tier_costs = table
+        return self._tier_costs.get(item_id, [])
+
+    def decompose(self, vector: list[int], resource_ids: set[str], owned: CostVector = ()) -> list[int]:
+        """Replaces the given refined resources in a cost vector with their components, in place.
+
+        Owned quantities of a refined resource are used before decomposing it, so only
+        the part not covered by the owned vector is replaced with components.
+        """
+        for index in self.decomposition_order:
+            resource_id = self.resource_ids[index]
+            if not vector[index] or resource_id not in resource_ids:
+                continue
+            covered = min(vector[index], owned[index]) if owned else 0
+            quantity = vector[index] - covered
+            vector[index] = covered
+            if quantity:
+                for component_index, component_quantity in enumerate(self.decomposition[resource_id]):
+                    if component_quantity:
+                        vector[component_index] += component_quantity * quantity
+        return vector
+
+    def can_craft(self, vector: CostVector, owned: CostVector, count: int = 1) -> bool:
+        """Returns whether the owned resources cover count times a cost vector.
+
+        Missing refined resources are crafted from their components, in
+        decomposition order, before checking the remaining needs.
+        """
+        owned = self.full_vector(owned)
+        needed = [cost * count for cost in self.full_vector(vector)]
+        for index in self.decomposition_order:
+            missing = needed[index] - owned[index]
+            if missing > 0:
+                needed[index] = owned[index]
+                for component_index, component_quantity in enumerate(self.decomposition[self.resource_ids[index]]):
+                    if component_quantity:
+                        needed[component_index] += component_quantity * missing
+        return all(need <= have for need, have in zip(needed, owned))
+
+    def craftable_count(self, vector: CostVector, owned: CostVector) -> int:
+        """Returns how many times a cost vector can be crafted from the owned resources."""
+        owned = self.full_vector(owned)
+        if not any(vector) or not self.can_craft(vector, owned):
+            return 0
+        # Double until the count no longer fits, then bisect between the last two counts
+        low, high = 1, 2
+        while self.can_craft(vector, owned, high):
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.can_craft(vector, owned, middle):
+                low = middle
+            else:
+                high = middle
+        return low
+
+    def max_craftable(self, owned: CostVector) -> dict[str, tuple[int, ...]]:
+        """Returns how many of each item can be crafted from the owned resources.
+
+        Counts are per tier for weapons (index 0 is tier 1) and a single count
+        otherwise. Results are cached per owned vector.
+        """
+        key = tuple(self.full_vector(owned))
+        result = self._craftable_cache.get(key)
+        if result is None:
+            result = {
+                item_id: tuple(self.craftable_count(vector, key) for vector in bom[1:])
+                for item_id, bom in self.item_bom.items()
+            }
+            if len(self._craftable_cache) >= 64:
+                self._craftable_cache.pop(next(iter(self._craftable_cache)))
+            self._craftable_cache[key] = result
+        return result
+
+    def parse_inventory(self, text: str) -> tuple[dict[str, int], list[str]]:
+        """Parses a bulk inventory export into owned quantities keyed by resource id.
+
+        Each line holds a resource name or id and a quantity separated by ':', '=',
+        ',' or a tab, e.g. "Metal Parts: 120". Returns the quantities and the lines
+        that could not be read.
+        """
+        ids_by_key = {r["id"]: r["id"] for r in self.resources}
+        ids_by_key.update((r["name"].lower(), r["id"]) for r in self.resources)
+
+        inventory: dict[str, int] = {}
+        errors: list[str] = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            parts = re.split(r"\s*[:=,\t]\s*", line, maxsplit=1)
+            resource_id = ids_by_key.get(parts[0].lower()) if len(parts) == 2 else None
+            if resource_id is None or not parts[1].isdigit():
+                errors.append(line)
+                continue
+            inventory[resource_id] = inventory.get(resource_id, 0) + int(parts[1])
+        return inventory, errors
+
+    def stash_slots(self, vector: CostVector) -> list[int]:
+        """Returns how many stash slots each entry of a cost vector fills, one stack per slot."""
+        return [-(-quantity // size) if quantity > 0 else 0 for quantity, size in zip(vector, self.stack_sizes)]
+
+    def picture(self, url: str | None) -> ImageVariants:
+        """Returns the responsive variants of an image, or the image alone if it has none built."""
+        variants = self.images.get(url) if url else None
+        if variants is None:
+            return {"src": url or "", "webp": "", "avif": "", "width": None, "height": None}
+        return variants
+
+    def full_vector(self, vector: CostVector) -> CostVector:
+        """Returns a vector padded with zeros to one column per resource, e.g. an empty stash."""
+        missing = len(self.resource_ids) - len(vector)
+        return [*vector, *[0] * missing] if missing > 0 else vector
+
+    def to_resource_dict(self, vector: CostVector) -> dict[str, int]:
+        """Returns the non-zero entries of a cost vector keyed by resource id."""
+        return {self.resource_ids[index]: quantity for index, quantity in enumerate(vector) if quantity}
+
+    def search(self, query: str, category: str = "All") -> list[Item]:
+        """Returns the items in a category whose name contains the query."""
+        query = query.lower().strip()
+        return [
+            item for item in self.items
+            if (category == "All" or item["category"] == category)
+            and query in self.search_keys[item["id"]]
+        ]
+
+
+_catalog: Catalog | None = None
+_catalog_lock = threading.Lock()
+
+# Patched versions built from the current catalog, dropped whenever it is reloaded
+_versions: dict[str, Catalog] = {}
+
+
+def _load_catalog() -> Catalog:
+    """Imports the data modules and attaches to the compiled catalog store.
+
+    The first worker to find no store for the current sources compiles one, so
+    later workers only map the file instead of rebuilding the indexes.
+    """
+    from arc.catalog_store import CatalogStore, catalog_fingerprint, catalog_store_path, write_catalog_store
+    from arc.items_data import ITEMS
+    from arc.resource_data import RESOURCES
+    from arc.weapon_mods_data import WEAPON_MODS
+
+    try:
+        path = catalog_store_path(catalog_fingerprint(DATA_MODULES))
+    except OSError:
+        logger.warning("No catalog store directory, using an in-process catalog", exc_info=True)
+        return Catalog(ITEMS, RESOURCES, WEAPON_MODS)
+    try:
+        return Catalog.from_store(ITEMS, RESOURCES, WEAPON_MODS, CatalogStore(path))
+    except (OSError, ValueError):
+        pass
+
+    catalog = Catalog(ITEMS, RESOURCES, WEAPON_MODS)
+    try:
+        write_catalog_store(catalog, path)
+        return Catalog.from_store(ITEMS, RESOURCES, WEAPON_MODS, CatalogStore(path))
+    except (OSError, ValueError):
+        logger.warning("Could not write catalog store %s, using an in-process catalog", path, exc_info=True)
+        return catalog
+
+
+def get_catalog(version: str = DEFAULT_VERSION) -> Catalog:
+    """Returns the catalog for a game version, loading it on first access.
+
+    Unknown versions fall back to the current catalog.
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = _load_catalog()
+    if version == DEFAULT_VERSION:
+        return _catalog
+
+    catalog = _versions.get(version)
+    if catalog is None or catalog.revision != _catalog.revision:
+        from arc.patches_data import CATALOG_PATCHES
+
+        patch = CATALOG_PATCHES.get(version)
+        if patch is None:
+            return _catalog
+        with _catalog_lock:
+            catalog = _catalog.patched(patch)
+            _versions[version] = catalog
+    return catalog
+
+
+def catalog_versions() -> list[str]:
+    """Returns the names of all available catalog versions, current first."""
+    from arc.patches_data import CATALOG_PATCHES
+
+    return [DEFAULT_VERSION, *CATALOG_PATCHES]
+
+
+def warm_catalog() -> None:
+    """Loads the catalog eagerly, e.g. from a worker's startup hook."""
+    start = time.perf_counter()
+    get_catalog()
+    logger.info("Catalog loaded in %.1f ms", (time.perf_counter() - start) * 1000)
+
+
+def _data_module_mtimes() -> dict[str, float]:
+    """Returns the modification time of each data module's source file.
+
+    Modules are looked up without importing them, since some are only imported
+    on first use; a module seen for the first time must not look edited.
+    """
+    mtimes = {}
+    for name in DATA_MODULES:
+        spec = importlib.util.find_spec(name)
+        if spec and spec.origin:
+            mtimes[name] = Path(spec.origin).stat().st_mtime
+    return mtimes
+
+
+def reload_catalog(changed_modules: list[str]) -> Catalog:
+    """Reloads the changed data modules and atomically swaps in an updated catalog."""
+    global _catalog
+    with _catalog_lock:
+        # Modules after the first changed one may import from it, so reload them too
+        first = min(DATA_MODULES.index(name) for name in changed_modules)
+        for name in DATA_MODULES[first:]:
+            if name in sys.modules:
+                importlib.reload(sys.modules[name])
+
+        from arc.items_data import ITEMS
+        from arc.resource_data import RESOURCES
+        from arc.weapon_mods_data import WEAPON_MODS
+
+        current = _catalog or _load_catalog()
+        _catalog = current.updated(ITEMS, RESOURCES, WEAPON_MODS)
+        _versions.clear()
+    return _catalog
+
+
+async def watch_catalog(interval: float = 2.0) -> None:
+    """Polls the data modules and reloads the catalog when one of them changes."""
+    get_catalog()
+    mtimes = _data_module_mtimes()
+    while True:
+        await asyncio.sleep(interval)
+        current = _data_module_mtimes()
+        changed = [name for name, mtime in current.items() if mtimes.get(name) != mtime]
+        if not changed:
+            continue
+        mtimes = current
+        try:
+            reload_catalog(changed)
+        except Exception:
+            # Keep serving the previous catalog until the data is fixed
+            logger.exception("Failed to reload catalog after changes to %s", ", ".join(changed))
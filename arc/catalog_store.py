@@ -0,0 +1,132 @@
+"""Compiled catalog file shared by all worker processes.
+
+The first worker to start compiles the catalog's indexes and cost vectors into a
+file; every worker then maps that file read-only. The cost rows are read straight
+from the mapped pages, so they are shared between processes instead of being
+rebuilt and copied into each one.
+
+File layout: an 8 byte magic, a little-endian uint32 header length, a JSON header
+padded to a multiple of 4 bytes, then the cost rows as native int32 values.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import mmap
+import os
+import stat
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from arc.catalog import Catalog
+
+MAGIC = b"ARCCAT01"
+
+# Source files whose contents determine the compiled catalog
+_SOURCE_MODULES = ("arc.catalog", "arc.catalog_store", "arc.dnd_config")
+
+
+def catalog_fingerprint(data_modules: tuple[str, ...]) -> str:
+    """Hashes the data and catalog sources without importing the data modules."""
+    digest = hashlib.sha256(sys.byteorder.encode())
+    for name in (*data_modules, *_SOURCE_MODULES):
+        spec = importlib.util.find_spec(name)
+        if spec and spec.origin:
+            digest.update(Path(spec.origin).read_bytes())
+    return digest.hexdigest()
+
+
+def catalog_store_path(fingerprint: str) -> Path:
+    """Returns where the store for a fingerprint lives, creating its directory.
+
+    The directory defaults to the user's cache dir (`$XDG_CACHE_HOME/arc` or
+    `~/.cache/arc`), not the shared temp dir, where another user could plant the
+    file. It can be set with `ARC_CATALOG_STORE_DIR`, e.g. to a tmpfs mount shared
+    by the workers.
+    """
+    directory = os.environ.get("ARC_CATALOG_STORE_DIR")
+    if not directory:
+        directory = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "arc"
+    directory = Path(directory)
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return directory / f"arc_catalog_{fingerprint[:16]}.bin"
+
+
+def _check_owner(fd: int, path: Path) -> None:
+    """Refuses a store file that another user owns or could have written."""
+    if not hasattr(os, "getuid"):
+        return
+    info = os.fstat(fd)
+    if info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise ValueError(f"{path} is not owned by and private to the current user")
+
+
+def write_catalog_store(catalog: Catalog, path: Path) -> None:
+    """Compiles a catalog into a store file, replacing any existing one atomically."""
+    matrix = array("i")
+    row_count = 0
+
+    def add_row(vector) -> int:
+        nonlocal row_count
+        matrix.extend(vector)
+        row_count += 1
+        return row_count - 1
+
+    item_rows = {}
+    for item_id, bom in catalog.item_bom.items():
+        item_rows[item_id] = [row_count, len(bom)]
+        for vector in bom:
+            add_row(vector)
+    decomposition_rows = {
+        resource_id: add_row(vector) for resource_id, vector in catalog.decomposition.items()
+    }
+
+    header = json.dumps({
+        "resource_ids": list(catalog.resource_ids),
+        "item_rows": item_rows,
+        "decomposition_rows": decomposition_rows,
+        "decomposition_order": list(catalog.decomposition_order),
+        "search_keys": catalog.search_keys,
+        "items_by_resource": {rid: sorted(ids) for rid, ids in catalog.items_by_resource.items()},
+    }).encode()
+    # Pad the header so the int32 rows start 4 byte aligned
+    header += b" " * (-len(header) % 4)
+
+    # Write to a private file first so other workers never map a partial store
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    # Private to the user whatever the umask, so the owner check accepts it
+    with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(matrix.tobytes())
+    os.replace(tmp_path, path)
+
+
+class CatalogStore:
+    """A read-only mapping of a compiled catalog file."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            # Checked on the open file, so it cannot be swapped between the check and the mapping
+            _check_owner(f.fileno(), path)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a catalog store")
+
+        offset = len(MAGIC)
+        (header_length,) = struct.unpack_from("<I", self._mmap, offset)
+        offset += 4
+        self.header = json.loads(self._mmap[offset:offset + header_length])
+        self.width = len(self.header["resource_ids"])
+        self._rows = memoryview(self._mmap)[offset + header_length:].cast("i")
+
+    def row(self, index: int) -> memoryview:
+        """Returns a cost row as a read-only view into the mapped file."""
+        return self._rows[index * self.width:(index + 1) * self.width]
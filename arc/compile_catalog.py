@@ -0,0 +1,52 @@
+"""Build step that checks the catalog data and compiles the shared catalog store.
+
+Every resource reference is resolved to its column in the cost vectors, so the
+app can index them directly at runtime. Any unresolved resource id, missing
+weapon tier, unknown slot type, recipe cycle or salvage that yields more than
+its crafting cost fails the build, for the current catalog and every patch:
+
+    python -m arc.compile_catalog
+"""
+
+import sys
+
+from arc.catalog import DATA_MODULES, Catalog, CatalogError, validate_catalog
+from arc.catalog_store import catalog_fingerprint, catalog_store_path, write_catalog_store
+from arc.recipe_graph import RecipeGraph, version_salvage
+
+
+def main() -> int:
+    from arc.items_data import ITEMS
+    from arc.patches_data import CATALOG_PATCHES
+    from arc.resource_data import RESOURCES
+    from arc.salvage_data import SALVAGE_YIELDS
+    from arc.weapon_mods_data import WEAPON_MODS
+
+    errors = validate_catalog(ITEMS + WEAPON_MODS, RESOURCES)
+    if errors:
+        print("Invalid catalog data:", *errors, sep="\n  ", file=sys.stderr)
+        return 1
+
+    catalog = Catalog(ITEMS, RESOURCES, WEAPON_MODS)
+    try:
+        RecipeGraph(catalog, SALVAGE_YIELDS)
+    except CatalogError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    for version, patch in CATALOG_PATCHES.items():
+        try:
+            patched = catalog.patched(patch)
+            RecipeGraph(patched, version_salvage(patched, SALVAGE_YIELDS))
+        except CatalogError as e:
+            print(f"Patch '{version}': {e}", file=sys.stderr)
+            return 1
+
+    path = catalog_store_path(catalog_fingerprint(DATA_MODULES))
+    write_catalog_store(catalog, path)
+    print(f"Compiled {len(catalog.items)} items, {len(catalog.weapon_mods)} weapon mods and {len(catalog.resources)} resources to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
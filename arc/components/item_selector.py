@@ -1,6 +1,48 @@
+import dataclasses
+
 import reflex as rx
-from arc.state import CalculatorState
+from reflex.components.core.banner import has_connection_errors
+from reflex.vars import ObjectVar
+from arc.state import ITEM_CARD_HEIGHT, ITEM_CARD_MIN_WIDTH, ITEM_GRID_GAP, CalculatorState, GridViewport
 from arc.components.item_card import item_card
+from arc.components.item_tooltip import item_tooltip
+
+# Reads the item grid's scroll position and size, in the shape of GridViewport
+MEASURE_ITEM_GRID = (
+    "(() => { const grid = document.getElementById('item-grid'); "
+    "return {scroll_top: grid.scrollTop, height: grid.clientHeight, width: grid.clientWidth}; })()"
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class _ScrollElement:
+    """The parts of a scrolled HTMLElement the grid reads."""
+
+    scrollTop: int = 0  # noqa: N815
+    clientHeight: int = 0  # noqa: N815
+    clientWidth: int = 0  # noqa: N815
+
+
+@dataclasses.dataclass(frozen=True)
+class _ScrollEvent:
+    target: _ScrollElement = _ScrollElement()
+
+
+def _grid_viewport_spec(e: ObjectVar[_ScrollEvent]) -> tuple[rx.Var[GridViewport]]:
+    """Passes the scrolled element's position and size to the handler."""
+    return (
+        rx.Var.create({
+            "scroll_top": e.target.scrollTop,
+            "height": e.target.clientHeight,
+            "width": e.target.clientWidth,
+        }).to(GridViewport),
+    )
+
+
+class ItemGridViewport(rx.el.Div):
+    """The item grid's scroll container, reporting its viewport on scroll."""
+
+    on_scroll: rx.EventHandler[_grid_viewport_spec]
 
 
 def category_button(category: str) -> rx.Component:
@@ -9,6 +51,8 @@ def category_button(category: str) -> rx.Component:
     return rx.el.button(
         category,
         on_click=lambda: CalculatorState.select_category(category),
+        # Read by the offline item grid in assets/offline.js
+        custom_attrs={"data-category": category},
         class_name=rx.cond(
             is_active,
             "px-4 py-2 text-sm font-semibold text-white bg-[#22BFFB] rounded-lg shadow-sm",
@@ -45,19 +89,69 @@ def item_selector() -> rx.Component:
             ),
             class_name="p-6 pb-4 bg-[#2a2a2a] border-b border-[#5D605D] flex-shrink-0",
         ),
+        rx.cond(
+            has_connection_errors,
+            offline_item_grid(),
+            item_grid(),
+        ),
+        item_tooltip(),
+        class_name="flex flex-col lg:flex-1 bg-[#2a2a2a] lg:overflow-hidden",
+    )
+
+
+def offline_item_grid() -> rx.Component:
+    """Stands in for the item grid while the backend is unreachable.
+
+    `assets/offline.js` fills it from the cached catalog and filters it as the
+    search box and category buttons change.
+    """
+    return rx.el.div(
+        rx.el.p(id="offline-status", class_name="text-xs text-gray-400 mb-3"),
         rx.el.div(
-            rx.grid(
-                rx.foreach(
-                    CalculatorState.filtered_items,
-                    lambda item: item_card(item, key=item["id"]),
-                ),
-                columns="1",
-                gap="4",
-                width="100%",
-                class_name="grid-cols-[repeat(auto-fit,minmax(140px,1fr))] gap-4",
+            id="offline-grid",
+            custom_attrs={"data-active-category": CalculatorState.active_category},
+            style={
+                "display": "grid",
+                "grid_template_columns": f"repeat(auto-fill, minmax({ITEM_CARD_MIN_WIDTH}px, 1fr))",
+                "grid_auto_rows": f"{ITEM_CARD_HEIGHT}px",
+                "gap": f"{ITEM_GRID_GAP}px",
+            },
+        ),
+        class_name="w-full p-6 pt-4 overflow-y-auto max-h-[70vh] lg:max-h-none lg:flex-1 bg-[#2a2a2a]",
+    )
+
+
+def item_grid() -> rx.Component:
+    """The item grid, with only the visible rows plus an overscan buffer mounted."""
+    # Padding stands in for the rows that are not mounted
+    return ItemGridViewport.create(
+        rx.el.div(
+            rx.foreach(
+                CalculatorState.visible_items,
+                lambda item: item_card(item, key=item["id"]),
             ),
-            class_name="w-full p-6 pt-4 lg:overflow-y-auto lg:flex-1 bg-[#2a2a2a]",
+            style={
+                "display": "grid",
+                "grid_template_columns": f"repeat({CalculatorState.item_grid_columns}, minmax(0, 1fr))",
+                "grid_auto_rows": f"{ITEM_CARD_HEIGHT}px",
+                "gap": f"{ITEM_GRID_GAP}px",
+                "padding_top": f"{CalculatorState.item_grid_offsets['top']}px",
+                "padding_bottom": f"{CalculatorState.item_grid_offsets['bottom']}px",
+            },
+            width="100%",
         ),
-        class_name="flex flex-col lg:flex-1 bg-[#2a2a2a] lg:overflow-hidden",
+        rx.window_event_listener(
+            on_resize=lambda width, height: rx.call_script(
+                MEASURE_ITEM_GRID, callback=CalculatorState.set_item_grid_viewport
+            ),
+        ),
+        id="item-grid",
+        # The throttle only fires on the leading edge, so the debounce reports where a fast scroll stopped
+        on_scroll=[
+            CalculatorState.set_item_grid_viewport.throttle(100),
+            CalculatorState.set_item_grid_viewport.debounce(100),
+        ],
+        on_mount=rx.call_script(MEASURE_ITEM_GRID, callback=CalculatorState.set_item_grid_viewport),
+        class_name="w-full p-6 pt-4 overflow-y-auto max-h-[70vh] lg:max-h-none lg:flex-1 bg-[#2a2a2a]",
     )
 
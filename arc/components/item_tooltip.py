@@ -0,0 +1,77 @@
+import reflex as rx
+from arc.state import CalculatorState, ResourceAmount, TierCost
+
+
+def resource_amount(resource: ResourceAmount) -> rx.Component:
+    """A single resource line in the tooltip."""
+    return rx.el.div(
+        rx.el.p(
+            resource["quantity"],
+            class_name="font-semibold text-xs text-white",
+        ),
+        rx.el.p(
+            resource["name"],
+            class_name="text-xs text-gray-300",
+        ),
+        class_name="flex items-center gap-1.5 bg-[#5D605D] px-2 py-1 rounded-md",
+    )
+
+
+def tier_cost(tier: TierCost) -> rx.Component:
+    """The resources one tier of an item costs, labelled with the tier for weapons."""
+    selected_tier = CalculatorState.selected_weapon_tiers.get(CalculatorState.item_tooltip["id"], 1)
+    return rx.el.div(
+        rx.cond(
+            tier["tier"] > 0,
+            rx.el.p(
+                rx.match(tier["tier"], (1, "Tier I"), (2, "Tier II"), (3, "Tier III"), "Tier IV"),
+                class_name=rx.cond(
+                    tier["tier"] <= selected_tier,
+                    "text-xs font-semibold text-[#22BFFB] mb-1",
+                    "text-xs font-semibold text-gray-400 mb-1",
+                ),
+            ),
+            rx.el.p(
+                "Resources:",
+                class_name="text-xs font-semibold text-white mb-2",
+            ),
+        ),
+        rx.el.div(
+            rx.foreach(tier["resources"], resource_amount),
+            class_name="flex flex-wrap gap-1.5",
+        ),
+        class_name="mb-2",
+    )
+
+
+def item_tooltip() -> rx.Component:
+    """The hover popup shared by every item card, mounted only while an item is hovered."""
+    tooltip = CalculatorState.item_tooltip
+    position = CalculatorState.hovered_item_position
+    return rx.cond(
+        tooltip["id"] != "",
+        rx.el.div(
+            rx.el.h3(
+                tooltip["name"],
+                class_name="font-semibold text-base text-white mb-1",
+            ),
+            rx.el.p(
+                rx.el.span(tooltip["rarity"], class_name="rarity-text"),
+                class_name="text-sm font-medium text-gray-400 mb-2",
+            ),
+            rx.el.p(
+                tooltip["category"],
+                class_name="text-xs text-gray-400 mb-3",
+            ),
+            rx.foreach(tooltip["tiers"], tier_cost),
+            # Next to the pointer, but kept inside the viewport
+            style={
+                "left": f"min({position['x']}px + 16px, 100vw - 272px)",
+                "top": f"min({position['y']}px + 16px, 100vh - 320px)",
+                "z-index": "9999",
+            },
+            custom_attrs={"data-rarity": tooltip["rarity"]},
+            class_name="fixed w-64 p-3 bg-[#1a1a1a] border-2 border-[#5D605D] rounded-lg shadow-xl pointer-events-none",
+        ),
+        rx.fragment(),
+    )
@@ -1,15 +1,53 @@
+import os
+
 import reflex as rx
 import reflex_enterprise as rxe
-from arc.state import CalculatorState, Item, LoadoutItem
+from reflex.components.component import field
+from arc.state import CalculatorState, Item, LoadoutItem, SlotView, WeaponModSocket
 from arc.dnd_config import DRAG_TYPES, SLOT_ACCEPTANCE_RULES
+from arc.components.picture import sprite
+
+# Compile with ARC_RENDER_COUNTS=1 to count renders per slot in window.__arcRenderCounts
+RENDER_COUNTS = bool(os.environ.get("ARC_RENDER_COUNTS"))
+
+
+class RenderCounter(rx.Fragment):
+    """Adds one to a render count each time the component it sits in renders."""
+
+    label: rx.Var[str] = field(is_javascript_property=False)
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        counts = "window.__arcRenderCounts"
+        return [f"{counts} = {counts} || {{}}; {counts}[{self.label!s}] = ({counts}[{self.label!s}] || 0) + 1;"]
+
+
+def render_counter(label: str) -> rx.Component:
+    """A render counter when ARC_RENDER_COUNTS is set at compile time, otherwise nothing."""
+    return RenderCounter.create(label=label) if RENDER_COUNTS else rx.fragment()
+
 
+def loadout_tier_selector(slot: str, current_tier: int, index: int | None = None, interactive: bool = True, from_tier: int = 0) -> rx.Component:
+    """A component to select the tier for a weapon in the loadout.
 
-def loadout_tier_selector(slot: str, current_tier: int, index: int | None = None, interactive: bool = True) -> rx.Component:
-    """A component to select the tier for a weapon in the loadout."""
+    The "from" select marks the tier the weapon is already owned at, so only the
+    upgrade to the selected tier is priced.
+    """
     tiers = ["I", "II", "III", "IV"]
+    from_tier = rx.Var.create(from_tier).to(int)
     
     if interactive:
         return rx.el.div(
+            rx.el.select(
+                rx.el.option("New", value="0"),
+                rx.foreach(
+                    tiers[:-1],
+                    lambda tier, tier_index: rx.el.option(tier, "→", value=(tier_index + 1).to_string()),
+                ),
+                value=from_tier.to_string(),
+                on_change=lambda value: CalculatorState.set_loadout_weapon_from_tier(slot, value, index),
+                title="Owned tier",
+                class_name="h-5 sm:h-6 px-0.5 text-[10px] sm:text-xs text-white bg-[#1a1a1a] border border-[#5D605D] rounded-md",
+            ),
             rx.foreach(
                 tiers,
                 lambda tier, tier_index: rx.el.button(
@@ -20,7 +58,11 @@ def loadout_tier_selector(slot: str, current_tier: int, index: int | None = None
                     class_name=rx.cond(
                         current_tier == tier_index + 1,
                         "w-5 h-5 sm:w-6 sm:h-6 md:w-6 md:h-6 text-[10px] sm:text-xs font-bold text-white bg-[#22BFFB] rounded-md",
-                        "w-5 h-5 sm:w-6 sm:h-6 md:w-6 md:h-6 text-[10px] sm:text-xs font-semibold text-white bg-[#5D605D] rounded-md hover:bg-[#3DEB58]",
+                        rx.cond(
+                            tier_index + 1 <= from_tier,
+                            "w-5 h-5 sm:w-6 sm:h-6 md:w-6 md:h-6 text-[10px] sm:text-xs font-semibold text-gray-500 bg-[#2a2a2a] rounded-md hover:bg-[#3DEB58]",
+                            "w-5 h-5 sm:w-6 sm:h-6 md:w-6 md:h-6 text-[10px] sm:text-xs font-semibold text-white bg-[#5D605D] rounded-md hover:bg-[#3DEB58]",
+                        ),
                     ),
                     size="1",
                 ),
@@ -46,6 +88,36 @@ def loadout_tier_selector(slot: str, current_tier: int, index: int | None = None
         )
 
 
+def compact_tier_selector(slot: str, current_tier: int, index: int | None = None, from_tier: int = 0) -> rx.Component:
+    """Owned and target tier selects for a weapon in a slot too small for the tier buttons."""
+    select_class = "h-4 px-0 text-[10px] text-white bg-[#1a1a1a] border border-[#5D605D] rounded"
+    return rx.el.div(
+        rx.el.select(
+            rx.el.option("New", value="0"),
+            rx.foreach(
+                ["I", "II", "III"],
+                lambda tier, tier_index: rx.el.option(tier, "→", value=(tier_index + 1).to_string()),
+            ),
+            value=rx.Var.create(from_tier).to(int).to_string(),
+            on_change=lambda value: CalculatorState.set_loadout_weapon_from_tier(slot, value, index),
+            title="Owned tier",
+            class_name=select_class,
+        ),
+        rx.el.select(
+            rx.foreach(
+                ["I", "II", "III", "IV"],
+                lambda tier, tier_index: rx.el.option(tier, value=(tier_index + 1).to_string()),
+            ),
+            value=rx.cond(current_tier, current_tier, 1).to_string(),
+            on_change=lambda value: CalculatorState.set_loadout_weapon_tier(slot, value, index),
+            title="Tier",
+            class_name=select_class,
+        ),
+        on_click=rx.stop_propagation,
+        class_name="flex items-center justify-center gap-0.5 flex-shrink-0",
+    )
+
+
 def empty_slot(label: str, slot_size: str = "standard") -> rx.Component:
     """An empty slot placeholder."""
     if slot_size == "augment_shield":
@@ -61,7 +133,7 @@ def empty_slot(label: str, slot_size: str = "standard") -> rx.Component:
     )
 
 
-def draggable_loadout_item(item: Item, slot_type: str, position: int, index: int | None = None, slot_size: str = "standard", quantity: int = 1, tier: int | None = None) -> rx.Component:
+def draggable_loadout_item(item: Item, slot_type: str, position: int, index: int | None = None, slot_size: str = "standard", quantity: int = 1, tier: int | None = None, from_tier: int = 0) -> rx.Component:
     """A draggable item that's already in the loadout."""
     drag_params = rxe.dnd.Draggable.collected_params
     
@@ -72,27 +144,8 @@ def draggable_loadout_item(item: Item, slot_type: str, position: int, index: int
     else:  # standard - square aspect ratio
         size_class = "w-full aspect-square"
     
-    border_color_solid = rx.match(
-        item["rarity"],
-        ("Common", "#5D605D"),
-        ("Uncommon", "#3DEB58"),
-        ("Rare", "#22BFFB"),
-        ("Epic", "#CB008A"),
-        ("Legendary", "#F9BC0A"),
-        "#5D605D",
-    )
-    
-    border_color = rx.match(
-        item["rarity"],
-        ("Common", "border-[#5D605D]"),
-        ("Uncommon", "border-[#3DEB58]"),
-        ("Rare", "border-[#22BFFB]"),
-        ("Epic", "border-[#CB008A]"),
-        ("Legendary", "border-[#F9BC0A]"),
-        "border-[#5D605D]",
-    )
-    
-    item_content = item_slot_with_item_content(item, slot_type, index, slot_size, quantity, tier, border_color)
+    # The border color comes from the rarity tokens in assets/rarity.css
+    item_content = item_slot_with_item_content(item, slot_type, index, slot_size, quantity, tier, "rarity-border", from_tier)
     
     # Use rx.match to dynamically determine drag type based on item category
     drag_type = rx.match(
@@ -118,12 +171,14 @@ def draggable_loadout_item(item: Item, slot_type: str, position: int, index: int
             "source_slot_type": slot_type,
             "source_position": position,
             "tier": tier,
+            "from_tier": from_tier,
             "quantity": quantity,
         },
+        custom_attrs={"data-rarity": item["rarity"]},
     )
 
 
-def item_slot_with_item_content(item: Item, slot_type: str, index: int | None = None, slot_size: str = "standard", quantity: int = 1, tier: int | None = None, border_color: str = "border-gray-400") -> rx.Component:
+def item_slot_with_item_content(item: Item, slot_type: str, index: int | None = None, slot_size: str = "standard", quantity: int = 1, tier: int | None = None, border_color: str = "border-gray-400", from_tier: int = 0) -> rx.Component:
     """Displays an item in a slot with click to remove (content only, no drag wrapper)."""
     if slot_size == "augment_shield":
         size_class = "w-full aspect-[3/2]"
@@ -150,7 +205,7 @@ def item_slot_with_item_content(item: Item, slot_type: str, index: int | None =
                 rx.el.div(
                     rx.cond(
                         tier,
-                        loadout_tier_selector(slot_type, tier, index, interactive=True),
+                        loadout_tier_selector(slot_type, tier, index, interactive=True, from_tier=from_tier),
                         rx.el.span("Tier I", class_name="text-xs font-semibold text-white"),
                     ),
                     on_click=rx.stop_propagation,
@@ -164,17 +219,22 @@ def item_slot_with_item_content(item: Item, slot_type: str, index: int | None =
                 rx.el.div(
                     rx.cond(
                         item["symbol"],
-                        rx.image(
-                            src=item["symbol"],
-                            alt="symbol",
-                            class_name="h-full w-auto object-contain p-0.5",
-                        ),
+                        sprite(item["symbol"], "symbol", class_name="h-full aspect-square p-0.5"),
                         rx.fragment(),
                     ),
                     class_name="h-full aspect-square flex items-center justify-center flex-shrink-0",
                 ),
-                # Right side: tier display (non-interactive text)
+                # Right side: tier display (non-interactive text), with the owned tier when upgrading
                 rx.el.div(
+                    rx.cond(
+                        from_tier,
+                        rx.el.span(
+                            rx.match(from_tier, (1, "I"), (2, "II"), (3, "III"), "I"),
+                            " → ",
+                            class_name="text-xs font-semibold text-gray-400",
+                        ),
+                        rx.fragment(),
+                    ),
                     rx.el.span(
                         rx.match(
                             rx.cond(tier, tier, 1),
@@ -198,16 +258,20 @@ def item_slot_with_item_content(item: Item, slot_type: str, index: int | None =
     elif slot_type == "backpack":
         return rx.cond(
             item["category"] == "Weapon",
-            # Weapon in backpack - show tier display in black bar
+            # Weapon in backpack - show tier selects under the image and the tier in the black bar
             rx.el.div(
-                # Image area (top 80%)
+                # Image and tier selects (top 80%)
                 rx.el.div(
-                    rx.image(
-                        src=item["image"],
-                        alt=item["name"],
-                        class_name="w-full h-full object-contain",
+                    rx.el.div(
+                        rx.image(
+                            src=item["image"],
+                            alt=item["name"],
+                            class_name="w-full h-full object-contain",
+                        ),
+                        class_name="flex-1 flex items-center justify-center min-h-0",
                     ),
-                    class_name="h-[80%] flex items-center justify-center",
+                    compact_tier_selector(slot_type, tier, index, from_tier=from_tier),
+                    class_name="h-[80%] flex flex-col",
                 ),
                 # Black bar at bottom (20%) with symbol and tier display
                 rx.el.div(
@@ -215,17 +279,22 @@ def item_slot_with_item_content(item: Item, slot_type: str, index: int | None =
                     rx.el.div(
                         rx.cond(
                             item["symbol"],
-                            rx.image(
-                                src=item["symbol"],
-                                alt="symbol",
-                                class_name="h-full w-auto object-contain p-0.5",
-                            ),
+                            sprite(item["symbol"], "symbol", class_name="h-full aspect-square p-0.5"),
                             rx.fragment(),
                         ),
                         class_name="h-full aspect-square flex items-center justify-center flex-shrink-0",
                     ),
-                    # Right side: tier display as roman numerals
+                    # Right side: tier display as roman numerals, with the owned tier when upgrading
                     rx.el.div(
+                        rx.cond(
+                            from_tier,
+                            rx.el.span(
+                                rx.match(from_tier, (1, "I"), (2, "II"), (3, "III"), "I"),
+                                " → ",
+                                class_name="text-xs font-semibold text-gray-400",
+                            ),
+                            rx.fragment(),
+                        ),
                         rx.el.span(
                             rx.match(
                                 rx.cond(tier, tier, 1),
@@ -261,11 +330,7 @@ def item_slot_with_item_content(item: Item, slot_type: str, index: int | None =
                     rx.el.div(
                         rx.cond(
                             item["symbol"],
-                            rx.image(
-                                src=item["symbol"],
-                                alt="symbol",
-                                class_name="h-full w-auto object-contain p-0.5",
-                            ),
+                            sprite(item["symbol"], "symbol", class_name="h-full aspect-square p-0.5"),
                             rx.fragment(),
                         ),
                         class_name="h-full aspect-square flex items-center justify-center flex-shrink-0",
@@ -314,11 +379,7 @@ def item_slot_with_item_content(item: Item, slot_type: str, index: int | None =
                 rx.el.div(
                     rx.cond(
                         item["symbol"],
-                        rx.image(
-                            src=item["symbol"],
-                            alt="symbol",
-                            class_name="h-full w-auto object-contain p-0.5",
-                        ),
+                        sprite(item["symbol"], "symbol", class_name="h-full aspect-square p-0.5"),
                         rx.fragment(),
                     ),
                     class_name="h-full aspect-square flex items-center justify-center flex-shrink-0",
@@ -366,11 +427,7 @@ def item_slot_with_item_content(item: Item, slot_type: str, index: int | None =
                 rx.el.div(
                     rx.cond(
                         item["symbol"],
-                        rx.image(
-                            src=item["symbol"],
-                            alt="symbol",
-                            class_name="h-full w-auto object-contain p-0.5",
-                        ),
+                        sprite(item["symbol"], "symbol", class_name="h-full aspect-square p-0.5"),
                         rx.fragment(),
                     ),
                     class_name="h-full aspect-square flex items-center justify-center flex-shrink-0",
@@ -463,7 +520,8 @@ def drop_target_weapon(position: int) -> rx.Component:
                 weapon_slot,
                 position,
                 slot_size="weapon",
-                tier=rx.cond(weapon_data, weapon_data.get("tier", 1), 1)
+                tier=rx.cond(weapon_data, weapon_data.get("tier", 1), 1),
+                from_tier=rx.cond(weapon_data, weapon_data.get("from_tier", 0), 0),
             ),
             empty_slot(f"Weapon {position + 1}", slot_size="weapon"),
         ),
@@ -485,6 +543,37 @@ def drop_target_weapon(position: int) -> rx.Component:
     )
 
 
+def weapon_mod_sockets(position: int) -> rx.Component:
+    """Mod selectors for each mod slot of weapon 1 or 2."""
+    weapon_slot = f"weapon_{position + 1}"
+    sockets = CalculatorState.loadout_weapon_1_mod_sockets if position == 0 else CalculatorState.loadout_weapon_2_mod_sockets
+
+    def socket_select(socket: WeaponModSocket) -> rx.Component:
+        return rx.el.select(
+            rx.el.option(socket["label"], value=""),
+            rx.foreach(
+                socket["options"],
+                lambda option: rx.el.option(option["name"], value=option["id"]),
+            ),
+            value=socket["mod_id"],
+            on_change=lambda mod_id: CalculatorState.attach_weapon_mod(weapon_slot, socket["mod_slot"], mod_id),
+            class_name=rx.cond(
+                socket["mod_id"] != "",
+                "w-full px-2 py-1 text-[10px] sm:text-xs text-white bg-[#1a1a1a] border border-[#22BFFB] rounded-md",
+                "w-full px-2 py-1 text-[10px] sm:text-xs text-gray-400 bg-[#1a1a1a] border border-[#5D605D] rounded-md",
+            ),
+        )
+
+    return rx.cond(
+        sockets.length() > 0,
+        rx.el.div(
+            rx.foreach(sockets, socket_select),
+            class_name="grid grid-cols-2 sm:grid-cols-4 gap-1",
+        ),
+        rx.fragment(),
+    )
+
+
 def equipment_section() -> rx.Component:
     """The Equipment section with augment, shield, and weapon slots."""
     return rx.el.div(
@@ -498,35 +587,55 @@ def equipment_section() -> rx.Component:
             class_name="grid grid-cols-2 gap-2 mb-2",
         ),
         drop_target_weapon(0),
+        weapon_mod_sockets(0),
         drop_target_weapon(1),
+        weapon_mod_sockets(1),
         class_name="flex flex-col gap-2 flex-[3]",
     )
 
 
-def drop_target_backpack_slot(position: int) -> rx.Component:
-    """Drop target for a specific backpack slot position."""
+def drop_target_slot(
+    slot_type: str,
+    position: int,
+    item_id: str,
+    name: str,
+    category: str,
+    rarity: str,
+    image: str,
+    symbol: str,
+    quantity: int,
+    tier: int,
+    from_tier: int,
+) -> rx.Component:
+    """Drop target for one backpack, quick use or safe pocket slot, built from its own payload only."""
     drop_params = rxe.dnd.DropTarget.collected_params
-    
-    # Check if slot has an actual item (not just a None placeholder)
-    has_item = (position < CalculatorState.loadout_backpack.length()) & (
-        CalculatorState.loadout_backpack[position]["item_id"] != None
-    )
-    
+    # The item fields are read straight from the props
+    item = {
+        "id": item_id,
+        "name": name,
+        "category": category,
+        "rarity": rarity,
+        "image": image,
+        "symbol": symbol,
+    }
+
     return rxe.dnd.drop_target(
+        render_counter(f"{slot_type}_{position}"),
         rx.cond(
-            has_item,
+            item_id,
             draggable_loadout_item(
-                CalculatorState.loadout_backpack_items[position],
-                "backpack",
+                item,
+                slot_type,
                 position,
                 index=position,
-                quantity=CalculatorState.loadout_backpack[position]["quantity"],
-                tier=CalculatorState.loadout_backpack[position].get("tier")
+                quantity=quantity,
+                tier=tier,
+                from_tier=from_tier,
             ),
             empty_slot(""),
         ),
-        accept=SLOT_ACCEPTANCE_RULES["backpack"],
-        on_drop=lambda item: CalculatorState.handle_drop_to_slot("backpack", position, item),
+        accept=SLOT_ACCEPTANCE_RULES[slot_type],
+        on_drop=lambda item: CalculatorState.handle_drop_to_slot(slot_type, position, item),
         border="2px solid",
         border_color=rx.cond(
             drop_params.is_over & drop_params.can_drop,
@@ -543,9 +652,61 @@ def drop_target_backpack_slot(position: int) -> rx.Component:
     )
 
 
+def slot_memo(slot_type: str):
+    """Returns a memoized slot component for a slot group.
+
+    Every prop is a primitive, so React skips a slot whose own payload did not
+    change even though the whole slot list is replaced on each update.
+    """
+    def slot(
+        position: rx.Var[int],
+        item_id: rx.Var[str],
+        name: rx.Var[str],
+        category: rx.Var[str],
+        rarity: rx.Var[str],
+        image: rx.Var[str],
+        symbol: rx.Var[str],
+        quantity: rx.Var[int],
+        tier: rx.Var[int],
+        from_tier: rx.Var[int],
+    ) -> rx.Component:
+        return drop_target_slot(slot_type, position, item_id, name, category, rarity, image, symbol, quantity, tier, from_tier)
+
+    slot.__name__ = slot.__qualname__ = f"{slot_type}_slot"
+    return rx.memo(slot)
+
+
+backpack_slot = slot_memo("backpack")
+quick_use_slot = slot_memo("quick_use")
+safe_pocket_slot = slot_memo("safe_pocket")
+
+
+def slot_props(views: rx.Var[list[SlotView]], position: rx.Var[int]) -> dict[str, rx.Var]:
+    """Returns the memoized slot props for a position, empty past the end of the list."""
+    view = views[position]
+    return {
+        "position": position,
+        "item_id": view["item_id"].to(str),
+        "name": view["name"].to(str),
+        "category": view["category"].to(str),
+        "rarity": view["rarity"].to(str),
+        "image": view["image"].to(str),
+        "symbol": view["symbol"].to(str),
+        "quantity": view["quantity"].to(int),
+        "tier": view["tier"].to(int),
+        "from_tier": view["from_tier"].to(int),
+    }
+
+
+def drop_target_backpack_slot(position: rx.Var[int]) -> rx.Component:
+    """Drop target for a specific backpack slot position."""
+    return backpack_slot(**slot_props(CalculatorState.backpack_slot_views, position))
+
+
 def backpack_section() -> rx.Component:
     """The Backpack section with a grid of slots."""
     return rx.el.div(
+        render_counter("backpack_section"),
         rx.el.div(
             rx.el.h3(
                 "BACKPACK",
@@ -559,20 +720,7 @@ def backpack_section() -> rx.Component:
         ),
         rx.el.div(
             rx.grid(
-                drop_target_backpack_slot(0),
-                rx.cond(CalculatorState.max_backpack_slots >= 2, drop_target_backpack_slot(1)),
-                rx.cond(CalculatorState.max_backpack_slots >= 3, drop_target_backpack_slot(2)),
-                rx.cond(CalculatorState.max_backpack_slots >= 4, drop_target_backpack_slot(3)),
-                rx.cond(CalculatorState.max_backpack_slots >= 5, drop_target_backpack_slot(4)),
-                rx.cond(CalculatorState.max_backpack_slots >= 6, drop_target_backpack_slot(5)),
-                rx.cond(CalculatorState.max_backpack_slots >= 7, drop_target_backpack_slot(6)),
-                rx.cond(CalculatorState.max_backpack_slots >= 8, drop_target_backpack_slot(7)),
-                rx.cond(CalculatorState.max_backpack_slots >= 9, drop_target_backpack_slot(8)),
-                rx.cond(CalculatorState.max_backpack_slots >= 10, drop_target_backpack_slot(9)),
-                rx.cond(CalculatorState.max_backpack_slots >= 11, drop_target_backpack_slot(10)),
-                rx.cond(CalculatorState.max_backpack_slots >= 12, drop_target_backpack_slot(11)),
-                rx.cond(CalculatorState.max_backpack_slots >= 13, drop_target_backpack_slot(12)),
-                rx.cond(CalculatorState.max_backpack_slots >= 14, drop_target_backpack_slot(13)),
+                rx.foreach(rx.Var.range(CalculatorState.max_backpack_slots), drop_target_backpack_slot),
                 columns="1",
                 spacing="2",
                 class_name="grid-cols-4 gap-2",
@@ -582,48 +730,15 @@ def backpack_section() -> rx.Component:
     )
 
 
-def drop_target_quick_use_slot(position: int) -> rx.Component:
+def drop_target_quick_use_slot(position: rx.Var[int]) -> rx.Component:
     """Drop target for a specific quick use slot position."""
-    drop_params = rxe.dnd.DropTarget.collected_params
-    
-    # Check if slot has an actual item (not just a None placeholder)
-    has_item = (position < CalculatorState.loadout_quick_use.length()) & (
-        CalculatorState.loadout_quick_use[position]["item_id"] != None
-    )
-    
-    return rxe.dnd.drop_target(
-        rx.cond(
-            has_item,
-            draggable_loadout_item(
-                CalculatorState.loadout_quick_use_items[position],
-                "quick_use",
-                position,
-                index=position,
-                quantity=CalculatorState.loadout_quick_use[position]["quantity"]
-            ),
-            empty_slot(""),
-        ),
-        accept=SLOT_ACCEPTANCE_RULES["quick_use"],
-        on_drop=lambda item: CalculatorState.handle_drop_to_slot("quick_use", position, item),
-        border="2px solid",
-        border_color=rx.cond(
-            drop_params.is_over & drop_params.can_drop,
-            "#3DEB58",
-            rx.cond(drop_params.is_over, "#CB008A", "transparent")
-        ),
-        bg=rx.cond(
-            drop_params.is_over & drop_params.can_drop,
-            "rgba(61, 235, 88, 0.1)",
-            rx.cond(drop_params.is_over, "rgba(203, 0, 138, 0.1)", "transparent")
-        ),
-        border_radius="8px",
-        width="100%",
-    )
+    return quick_use_slot(**slot_props(CalculatorState.quick_use_slot_views, position))
 
 
 def quick_use_section() -> rx.Component:
     """The Quick Use section."""
     return rx.el.div(
+        render_counter("quick_use_section"),
         rx.el.div(
             rx.el.h3(
                 "QUICK USE",
@@ -636,10 +751,7 @@ def quick_use_section() -> rx.Component:
             class_name="flex items-center gap-2 mb-2",
         ),
         rx.grid(
-            drop_target_quick_use_slot(0),
-            rx.cond(CalculatorState.max_quick_use_slots >= 2, drop_target_quick_use_slot(1)),
-            rx.cond(CalculatorState.max_quick_use_slots >= 3, drop_target_quick_use_slot(2)),
-            rx.cond(CalculatorState.max_quick_use_slots >= 4, drop_target_quick_use_slot(3)),
+            rx.foreach(rx.Var.range(CalculatorState.max_quick_use_slots), drop_target_quick_use_slot),
             columns="1",
             spacing="2",
             class_name="grid-cols-3 gap-2",
@@ -647,48 +759,15 @@ def quick_use_section() -> rx.Component:
     )
 
 
-def drop_target_safe_pocket_slot(position: int) -> rx.Component:
+def drop_target_safe_pocket_slot(position: rx.Var[int]) -> rx.Component:
     """Drop target for a specific safe pocket slot position."""
-    drop_params = rxe.dnd.DropTarget.collected_params
-    
-    # Check if slot has an actual item (not just a None placeholder)
-    has_item = (position < CalculatorState.loadout_safe_pocket.length()) & (
-        CalculatorState.loadout_safe_pocket[position]["item_id"] != None
-    )
-    
-    return rxe.dnd.drop_target(
-        rx.cond(
-            has_item,
-            draggable_loadout_item(
-                CalculatorState.loadout_safe_pocket_items[position],
-                "safe_pocket",
-                position,
-                index=position,
-                quantity=CalculatorState.loadout_safe_pocket[position]["quantity"]
-            ),
-            empty_slot(""),
-        ),
-        accept=SLOT_ACCEPTANCE_RULES["safe_pocket"],
-        on_drop=lambda item: CalculatorState.handle_drop_to_slot("safe_pocket", position, item),
-        border="2px solid",
-        border_color=rx.cond(
-            drop_params.is_over & drop_params.can_drop,
-            "#3DEB58",
-            rx.cond(drop_params.is_over, "#CB008A", "transparent")
-        ),
-        bg=rx.cond(
-            drop_params.is_over & drop_params.can_drop,
-            "rgba(61, 235, 88, 0.1)",
-            rx.cond(drop_params.is_over, "rgba(203, 0, 138, 0.1)", "transparent")
-        ),
-        border_radius="8px",
-        width="100%",
-    )
+    return safe_pocket_slot(**slot_props(CalculatorState.safe_pocket_slot_views, position))
 
 
 def safe_pocket_section() -> rx.Component:
     """The Safe Pocket section."""
     return rx.el.div(
+        render_counter("safe_pocket_section"),
         rx.el.div(
             rx.el.h3(
                 "SAFE POCKET",
@@ -703,8 +782,7 @@ def safe_pocket_section() -> rx.Component:
         rx.cond(
             CalculatorState.max_safe_pocket_slots > 0,
             rx.grid(
-                drop_target_safe_pocket_slot(0),
-                rx.cond(CalculatorState.max_safe_pocket_slots >= 2, drop_target_safe_pocket_slot(1)),
+                rx.foreach(rx.Var.range(CalculatorState.max_safe_pocket_slots), drop_target_safe_pocket_slot),
                 columns="1",
                 spacing="2",
                 class_name="grid-cols-3 gap-2",
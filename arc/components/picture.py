@@ -0,0 +1,35 @@
+import reflex as rx
+from arc.state import ImageVariants
+
+
+def picture(variants: ImageVariants, sizes: str, alt: rx.Var[str] | str = "", class_name: str = "") -> rx.Component:
+    """A lazily loaded catalog image that lets the browser pick the smallest adequate variant.
+
+    `sizes` is the width the image is displayed at. The intrinsic width and height
+    reserve the image's box before it loads, so the grid does not shift.
+    """
+    return rx.el.picture(
+        rx.el.source(type="image/avif", src_set=variants["avif"], sizes=sizes),
+        rx.el.img(
+            src=variants["src"],
+            src_set=variants["webp"],
+            sizes=sizes,
+            alt=alt,
+            loading="lazy",
+            decoding="async",
+            custom_attrs={"width": variants["width"], "height": variants["height"]},
+            class_name=class_name,
+        ),
+        # The <img> is laid out as if it were a direct child of the card
+        class_name="contents",
+    )
+
+
+def sprite(url: rx.Var[str] | str, label: rx.Var[str] | str, class_name: str = "") -> rx.Component:
+    """A catalog icon drawn from its sprite atlas; `assets/sprites.css` maps the URL to its cell."""
+    return rx.el.span(
+        role="img",
+        aria_label=label,
+        custom_attrs={"data-sprite": url},
+        class_name=f"sprite block {class_name}",
+    )
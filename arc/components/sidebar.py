@@ -1,5 +1,14 @@
 import reflex as rx
-from arc.state import CalculatorState, ResourceDisplay
+from arc.state import (
+    SLOT_GROUPS,
+    CalculatorState,
+    CampaignRow,
+    CraftableItem,
+    ResourceDisplay,
+    SalvageOption,
+    SquadMemberTotal,
+)
+from arc.components.picture import sprite
 
 
 def tooltip_wrapper(content: rx.Component, tooltip_text: str) -> rx.Component:
@@ -16,23 +25,6 @@ def tooltip_wrapper(content: rx.Component, tooltip_text: str) -> rx.Component:
 
 def resource_card(resource: ResourceDisplay) -> rx.Component:
     """A single resource card with decompose button for refined resources."""
-    # Determine colors based on rarity using rx.match for reactive values
-    text_color = rx.match(
-        resource["rarity"],
-        ("Common", "font-semibold text-white"),
-        ("Uncommon", "font-semibold text-[#3DEB58]"),
-        ("Rare", "font-semibold text-[#22BFFB]"),
-        "font-semibold text-[#CB008A]",
-    )
-    
-    icon_color = rx.match(
-        resource["rarity"],
-        ("Common", "text-white"),
-        ("Uncommon", "text-[#3DEB58]"),
-        ("Rare", "text-[#22BFFB]"),
-        "text-[#CB008A]",
-    )
-    
     # Check if this resource is decomposed (reactive)
     is_decomposed = CalculatorState.decomposed_resources.contains(resource["id"])
     
@@ -41,21 +33,23 @@ def resource_card(resource: ResourceDisplay) -> rx.Component:
             rx.el.div(
                 rx.cond(
                     resource["image"],
-                    rx.image(
-                        src=resource["image"],
-                        width="48px",
-                        height="48px",
-                        class_name="object-contain",
-                    ),
+                    sprite(resource["image"], resource["name"], class_name="w-12 h-12 flex-shrink-0"),
                     rx.icon(
                         "package",
                         size=36,
-                        class_name=icon_color,
+                        class_name="rarity-text",
                     ),
                 ),
-                rx.el.p(
-                    resource["name"],
-                    class_name=text_color,
+                rx.el.div(
+                    rx.el.p(
+                        resource["name"],
+                        class_name="font-semibold rarity-text",
+                    ),
+                    rx.el.p(
+                        resource["slots"],
+                        rx.cond(resource["slots"] == 1, " slot", " slots"),
+                        class_name="text-xs text-gray-400",
+                    ),
                 ),
                 class_name="flex items-center gap-3 flex-1",
             ),
@@ -80,7 +74,201 @@ def resource_card(resource: ResourceDisplay) -> rx.Component:
             ),
             class_name="flex items-center justify-between gap-2",
         ),
-        class_name="p-4 bg-[#1a1a1a] rounded-lg border border-[#5D605D]",
+        rx.cond(
+            CalculatorState.has_inventory,
+            stash_row(resource),
+            rx.fragment(),
+        ),
+        # Name and icon colors come from the rarity tokens in assets/rarity.css
+        custom_attrs={"data-rarity": resource["rarity"]},
+        class_name="p-4 text-white bg-[#1a1a1a] rounded-lg border border-[#5D605D]",
+    )
+
+
+def storage_footprint() -> rx.Component:
+    """Shows how many stash slots the totals fill, and the count before expanding if it differs."""
+    footprint = CalculatorState.storage_footprint
+    return rx.el.div(
+        rx.el.p("Stash slots", class_name="text-xs text-gray-400 uppercase tracking-wide"),
+        rx.el.p(
+            footprint["after"],
+            rx.cond(
+                footprint["before"] != footprint["after"],
+                rx.el.span(" (", footprint["before"], " before expanding)", class_name="text-xs font-normal text-gray-400"),
+                rx.fragment(),
+            ),
+            class_name="text-sm font-bold text-white",
+        ),
+        class_name="mb-3 flex items-center justify-between",
+    )
+
+
+def stash_row(resource: ResourceDisplay) -> rx.Component:
+    """Shows how many of a resource are in the stash and how many are missing."""
+    return rx.el.div(
+        rx.el.label(
+            "Have",
+            rx.el.input(
+                type="number",
+                min=0,
+                value=resource["owned"].to_string(),
+                on_change=lambda quantity: CalculatorState.set_owned_quantity(resource["id"], quantity),
+                class_name="w-16 px-2 py-0.5 text-xs text-white bg-[#2a2a2a] border border-[#5D605D] rounded",
+            ),
+            class_name="flex items-center gap-2 text-xs text-gray-400",
+        ),
+        rx.cond(
+            resource["salvaged"] > 0,
+            rx.el.p("+", resource["salvaged"], " salvage", class_name="text-xs text-gray-400"),
+            rx.fragment(),
+        ),
+        rx.cond(
+            resource["missing"] > 0,
+            rx.el.p(
+                "Missing ",
+                resource["missing"],
+                class_name="text-xs font-semibold text-[#CB008A]",
+            ),
+            rx.el.p("Covered", class_name="text-xs font-semibold text-[#3DEB58]"),
+        ),
+        class_name="mt-3 flex items-center justify-between gap-2",
+    )
+
+
+def stash_import() -> rx.Component:
+    """A form to paste the stash contents, one "resource: quantity" per line."""
+    return rx.el.details(
+        rx.el.summary("Stash", class_name="text-xs text-gray-400 cursor-pointer"),
+        rx.el.form(
+            rx.el.textarea(
+                name="inventory",
+                placeholder="Metal Parts: 120\nRubber Parts: 40",
+                rows=4,
+                class_name="w-full px-3 py-2 text-xs text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg",
+            ),
+            rx.el.div(
+                rx.el.button(
+                    "Import",
+                    type="submit",
+                    class_name="flex-1 px-3 py-1.5 text-xs font-medium text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg hover:bg-[#2a2a2a] transition-colors",
+                ),
+                rx.el.button(
+                    "Clear",
+                    type="button",
+                    on_click=CalculatorState.clear_inventory,
+                    class_name="flex-1 px-3 py-1.5 text-xs font-medium text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg hover:bg-[#2a2a2a] transition-colors",
+                ),
+                class_name="mt-2 flex gap-2",
+            ),
+            on_submit=CalculatorState.import_inventory,
+            reset_on_submit=True,
+            class_name="mt-2",
+        ),
+        rx.foreach(
+            CalculatorState.inventory_import_errors,
+            lambda line: rx.el.p("Skipped: ", line, class_name="text-xs text-[#CB008A] mt-1"),
+        ),
+        rx.cond(
+            CalculatorState.salvage_options.length() > 0,
+            salvage_list(),
+            rx.fragment(),
+        ),
+        rx.cond(
+            CalculatorState.has_inventory,
+            craftable_summary(),
+            rx.fragment(),
+        ),
+        class_name="mt-4 w-full",
+    )
+
+
+def salvage_entry(option: SalvageOption) -> rx.Component:
+    """A quantity input for one thing to scrap, with what one unit yields."""
+    return rx.el.div(
+        rx.el.div(
+            rx.el.p(option["name"], class_name="text-xs text-white"),
+            rx.el.p(option["yields"], class_name="text-xs text-gray-400"),
+            rx.cond(
+                option["verified"],
+                rx.fragment(),
+                rx.el.p("Unverified yield, not counted", class_name="text-xs italic text-gray-500"),
+            ),
+        ),
+        rx.el.input(
+            type="number",
+            min=0,
+            value=option["quantity"].to_string(),
+            on_change=lambda quantity: CalculatorState.set_salvage_quantity(option["id"], quantity),
+            class_name="w-16 px-2 py-0.5 text-xs text-white bg-[#2a2a2a] border border-[#5D605D] rounded",
+        ),
+        class_name="flex items-center justify-between gap-2",
+    )
+
+
+def salvage_list() -> rx.Component:
+    """Lets the player plan what to scrap; the yields count toward the stash."""
+    return rx.el.details(
+        rx.el.summary("Salvage", class_name="text-xs text-gray-400 cursor-pointer"),
+        rx.el.div(
+            rx.foreach(CalculatorState.salvage_options, salvage_entry),
+            class_name="mt-2 flex flex-col gap-2 max-h-48 overflow-y-auto",
+        ),
+        class_name="mt-2",
+    )
+
+
+def craftable_entry(entry: CraftableItem) -> rx.Component:
+    """A single line of the craftable list."""
+    return rx.el.li(
+        rx.el.span(
+            entry["name"],
+            rx.cond(entry["tier"], rx.el.span(" T", entry["tier"], class_name="text-gray-500"), rx.fragment()),
+        ),
+        rx.el.span(entry["count"], "x", class_name="font-semibold text-white"),
+        class_name="flex justify-between text-xs text-gray-400",
+    )
+
+
+def craftable_summary() -> rx.Component:
+    """What the stash can build: the current loadout and each item or weapon tier."""
+    return rx.el.div(
+        rx.el.p(
+            "Current loadout craftable: ",
+            rx.el.span(CalculatorState.loadout_craftable_count, "x", class_name="font-semibold text-white"),
+            class_name="text-xs text-gray-400",
+        ),
+        rx.el.ul(
+            rx.foreach(CalculatorState.craftable_items, craftable_entry),
+            class_name="mt-2 space-y-1 max-h-48 overflow-y-auto",
+        ),
+        rx.cond(
+            CalculatorState.optimizer_running,
+            rx.el.div(
+                rx.el.div(
+                    class_name="h-1 bg-[#22BFFB] rounded transition-all",
+                    style={"width": CalculatorState.optimizer_progress.to_string() + "%"},
+                ),
+                rx.el.button(
+                    rx.icon("circle-stop", size=14, class_name="mr-2"),
+                    "Cancel",
+                    on_click=CalculatorState.cancel_optimizer,
+                    class_name="mt-2 w-full flex items-center justify-center px-3 py-2 text-xs font-medium text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg hover:bg-[#2a2a2a] transition-colors",
+                ),
+                class_name="mt-3",
+            ),
+            rx.el.button(
+                rx.icon("sparkles", size=14, class_name="mr-2"),
+                "Best Loadout From Stash",
+                on_click=CalculatorState.optimize_loadout,
+                class_name="mt-3 w-full flex items-center justify-center px-3 py-2 text-xs font-medium text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg hover:bg-[#2a2a2a] transition-colors",
+            ),
+        ),
+        rx.cond(
+            CalculatorState.optimizer_status != "",
+            rx.el.p(CalculatorState.optimizer_status, class_name="text-xs text-gray-400 mt-1"),
+            rx.fragment(),
+        ),
+        class_name="mt-3",
     )
 
 
@@ -91,12 +279,7 @@ def decomposed_resource_card(resource: ResourceDisplay) -> rx.Component:
             rx.el.div(
                 rx.cond(
                     resource["image"],
-                    rx.image(
-                        src=resource["image"],
-                        width="48px",
-                        height="48px",
-                        class_name="object-contain opacity-50",
-                    ),
+                    sprite(resource["image"], resource["name"], class_name="w-12 h-12 flex-shrink-0 opacity-50"),
                     rx.icon(
                         "package",
                         size=36,
@@ -130,6 +313,151 @@ def decomposed_resource_card(resource: ResourceDisplay) -> rx.Component:
     )
 
 
+def squad_member_chip(member: SquadMemberTotal) -> rx.Component:
+    """A squad member button; the active member's loadout is the one being edited."""
+    return rx.el.div(
+        rx.el.button(
+            member["name"],
+            on_click=CalculatorState.switch_squad_member(member["index"]),
+            class_name="px-2 py-1 text-xs font-medium",
+        ),
+        # The last member leaves squad mode through its own button instead
+        rx.cond(
+            CalculatorState.squad.length() > 1,
+            rx.el.button(
+                rx.icon("x", size=12),
+                on_click=CalculatorState.remove_squad_member(member["index"]),
+                class_name="pr-2 text-gray-500 hover:text-white",
+            ),
+        ),
+        class_name=rx.cond(
+            member["active"],
+            "flex items-center text-white bg-[#5D605D] border border-[#22BFFB] rounded-lg",
+            "flex items-center text-gray-400 bg-[#1a1a1a] border border-[#5D605D] rounded-lg hover:bg-[#2a2a2a]",
+        ),
+    )
+
+
+def squad_controls() -> rx.Component:
+    """Squad mode toggle, member switcher and add button."""
+    return rx.cond(
+        CalculatorState.squad.length() > 0,
+        rx.el.div(
+            rx.el.div(
+                rx.foreach(CalculatorState.squad_member_totals, squad_member_chip),
+                rx.el.button(
+                    rx.icon("user-plus", size=14),
+                    on_click=CalculatorState.add_squad_member,
+                    class_name="px-2 py-1 text-xs text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg hover:bg-[#2a2a2a]",
+                ),
+                class_name="flex flex-wrap items-center gap-2",
+            ),
+            rx.el.button(
+                "Leave Squad",
+                on_click=CalculatorState.leave_squad,
+                class_name="mt-2 text-xs text-gray-400 hover:text-white",
+            ),
+            class_name="mt-4 w-full",
+        ),
+        rx.el.button(
+            rx.icon("users", size=14, class_name="mr-2"),
+            "Plan For A Squad",
+            on_click=CalculatorState.start_squad,
+            class_name="mt-2 w-full flex items-center justify-center px-3 py-2 text-xs font-medium text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg hover:bg-[#2a2a2a] transition-colors",
+        ),
+    )
+
+
+def squad_member_summary(member: SquadMemberTotal) -> rx.Component:
+    """One member's resource totals, collapsed by default."""
+    return rx.el.details(
+        rx.el.summary(member["name"], class_name="text-xs text-gray-400 cursor-pointer"),
+        rx.el.ul(
+            rx.foreach(
+                member["resources"],
+                lambda resource: rx.el.li(
+                    rx.el.span(resource["name"]),
+                    rx.el.span(resource["quantity"], class_name="font-semibold text-white"),
+                    class_name="flex justify-between text-xs text-gray-400",
+                ),
+            ),
+            class_name="mt-1 space-y-1",
+        ),
+    )
+
+
+def squad_totals() -> rx.Component:
+    """The whole squad's resources, followed by each member's."""
+    return rx.el.div(
+        rx.el.hr(class_name="border-[#5D605D] my-6"),
+        rx.el.h3(
+            "Squad Total",
+            class_name="text-sm font-bold text-gray-400 uppercase tracking-wide mb-3",
+        ),
+        rx.el.div(
+            rx.foreach(CalculatorState.squad_total_resources, resource_card),
+            class_name="space-y-3",
+        ),
+        rx.el.div(
+            rx.foreach(CalculatorState.squad_member_totals, squad_member_summary),
+            class_name="mt-4 space-y-2",
+        ),
+    )
+
+
+def campaign_row(row: CampaignRow) -> rx.Component:
+    """Raid count input for one campaign loadout."""
+    return rx.el.label(
+        rx.el.span(row["name"]),
+        rx.el.input(
+            type="number",
+            min=0,
+            value=row["raids"].to_string(),
+            on_change=lambda raids: CalculatorState.set_campaign_raids(row["index"], raids),
+            class_name="w-16 px-2 py-0.5 text-xs text-white bg-[#2a2a2a] border border-[#5D605D] rounded",
+        ),
+        class_name="flex items-center justify-between text-xs text-gray-400",
+    )
+
+
+def campaign_loss_rate(group: str) -> rx.Component:
+    """Loss rate input for one slot group."""
+    return rx.el.label(
+        rx.el.span(group.replace("_", " ").title(), " lost %"),
+        rx.el.input(
+            type="number",
+            min=0,
+            max=100,
+            value=CalculatorState.campaign_loss_rates[group].to_string(),
+            on_change=lambda rate: CalculatorState.set_campaign_loss_rate(group, rate),
+            class_name="w-16 px-2 py-0.5 text-xs text-white bg-[#2a2a2a] border border-[#5D605D] rounded",
+        ),
+        class_name="flex items-center justify-between text-xs text-gray-400",
+    )
+
+
+def campaign_planner() -> rx.Component:
+    """Resources for a schedule of raids, replacing lost gear after each one."""
+    return rx.el.details(
+        rx.el.summary(
+            "Campaign",
+            class_name="text-sm font-bold text-gray-400 uppercase tracking-wide cursor-pointer",
+        ),
+        rx.el.div(
+            rx.el.p("Raids per loadout", class_name="text-xs text-gray-500"),
+            rx.foreach(CalculatorState.campaign_rows, campaign_row),
+            rx.el.p("Lost per raid", class_name="mt-2 text-xs text-gray-500"),
+            *[campaign_loss_rate(group) for group in SLOT_GROUPS],
+            class_name="mt-3 space-y-2",
+        ),
+        rx.el.div(
+            rx.foreach(CalculatorState.campaign_resources, resource_card),
+            class_name="mt-4 space-y-3",
+        ),
+        class_name="mt-6",
+    )
+
+
 def resource_summary_sidebar() -> rx.Component:
     """The sidebar component to display the resource summary."""
     return rx.el.aside(
@@ -140,6 +468,23 @@ def resource_summary_sidebar() -> rx.Component:
             rx.el.p(
                 "Expand refined resources to view crafting materials.", class_name="text-sm text-gray-400 mt-1"
             ),
+            rx.cond(
+                CalculatorState.catalog_versions.length() > 1,
+                rx.el.div(
+                    rx.el.p("Game patch", class_name="text-xs text-gray-400"),
+                    rx.el.select(
+                        rx.foreach(
+                            CalculatorState.catalog_versions,
+                            lambda version: rx.el.option(version, value=version),
+                        ),
+                        value=CalculatorState.catalog_version,
+                        on_change=CalculatorState.set_catalog_version,
+                        class_name="flex-1 px-3 py-1.5 text-xs text-white bg-[#1a1a1a] border border-[#5D605D] rounded-lg",
+                    ),
+                    class_name="mt-4 w-full flex items-center gap-2",
+                ),
+                rx.fragment(),
+            ),
             rx.el.div(
                 rx.el.button(
                     rx.icon("trash-2", size=14, class_name="mr-2"),
@@ -169,12 +514,15 @@ def resource_summary_sidebar() -> rx.Component:
                 ),
                 class_name="mt-2 w-full flex gap-2",
             ),
+            squad_controls(),
+            stash_import(),
             class_name="p-6 border-b border-[#5D605D]",
         ),
         rx.el.div(
             rx.cond(
-                CalculatorState.has_loadout_items,
+                CalculatorState.has_loadout_items | (CalculatorState.squad.length() > 0),
                 rx.el.div(
+                    storage_footprint(),
                     rx.el.div(
                         rx.foreach(
                             CalculatorState.sorted_total_resources,
@@ -200,6 +548,12 @@ def resource_summary_sidebar() -> rx.Component:
                         ),
                         rx.el.span(),
                     ),
+                    rx.cond(
+                        CalculatorState.squad.length() > 0,
+                        squad_totals(),
+                        rx.fragment(),
+                    ),
+                    campaign_planner(),
                     class_name="p-6",
                 ),
                 rx.el.div(
@@ -24,3 +24,5 @@ SLOT_ACCEPTANCE_RULES: dict[str, list[str]] = {
     "safe_pocket": ["ITEM_HEALING", "ITEM_TRAP", "ITEM_GEAR", "ITEM_GADGET", "ITEM_TOOL", "ITEM_AUGMENT", "ITEM_SHIELD"],
 }
 
+# Weapon mod slots a weapon can declare and a mod can fit into
+MOD_SLOT_TYPES = ["muzzle", "shotgun_muzzle", "underbarrel", "light_mag", "medium_mag", "shotgun_mag", "stock", "tech_mod"]
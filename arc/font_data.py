@@ -0,0 +1,11 @@
+"""Self-hosted Roboto subsets.
+
+Generated by `python -m arc.build_fonts`; do not edit.
+"""
+
+# WOFF2 file of each font weight, preloaded by the app
+FONT_URLS: dict[int, str] = {
+    400: "/fonts/roboto-400.1a3bfd2d3dcf.woff2",
+    500: "/fonts/roboto-500.dcf05715d9ff.woff2",
+    700: "/fonts/roboto-700.a9a26fd49f4d.woff2",
+}
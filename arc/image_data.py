@@ -0,0 +1,74 @@
+"""Content-hashed URLs and responsive variants of the catalog images.
+
+Generated by `python -m arc.build_images`; do not edit.
+"""
+
+from arc.state import ImageVariants
+
+# What the catalog rewrites each image URL of the data modules to
+IMAGE_URLS: dict[str, str] = {
+    "/items/a_combat_mk_1.png": "/img/items/a_combat_mk_1-280w.e69f3fe33f4b.webp",
+    "/items/a_looting_mk_1.png": "/img/items/a_looting_mk_1-280w.a29f23362aea.webp",
+    "/items/a_tactical_mk_1.png": "/img/items/a_tactical_mk_1-280w.64ef6f845014.webp",
+    "/items/h_bandage.png": "/img/items/h_bandage-280w.c876276ebe5f.webp",
+    "/items/m_angled_grip_1.png": "/img/items/m_angled_grip_1-256w.92a5631e529a.webp",
+    "/items/m_compensator_1.png": "/img/items/m_compensator_1-280w.1c76ad3528c6.webp",
+    "/items/m_light_mag_1.png": "/img/items/m_light_mag_1-256w.2801a706f06d.webp",
+    "/items/m_muzzle_brake_1.png": "/img/items/m_muzzle_brake_1-256w.c75aea0a84e5.webp",
+    "/items/m_shotgun_choke_1.png": "/img/items/m_shotgun_choke_1-256w.0fd6d25657e7.webp",
+    "/items/m_stock_1.png": "/img/items/m_stock_1-256w.732a533ac0b4.webp",
+    "/items/sh_light_shield.png": "/img/items/sh_light_shield-280w.c0fd6b93b39f.webp",
+    "/items/t_jolt_mine.png": "/img/items/t_jolt_mine-280w.9beee92630a5.webp",
+    "/items/w_anvil.webp": "/img/items/w_anvil-280w.35fa4817ce95.webp",
+    "/items/w_arpeggio.webp": "/img/items/w_arpeggio-280w.f2bb3fabf0b7.webp",
+    "/items/w_bettina.webp": "/img/items/w_bettina-280w.3998740e4edf.webp",
+    "/items/w_bobcat.webp": "/img/items/w_bobcat-280w.fbf4a6ad26b8.webp",
+    "/items/w_burletta.webp": "/img/items/w_burletta-280w.91bc5d096e50.webp",
+    "/items/w_ferro.webp": "/img/items/w_ferro-280w.9dceb0c2903c.webp",
+    "/items/w_hairpin.webp": "/img/items/w_hairpin-280w.c0f016553b9d.webp",
+    "/items/w_hullcracker.webp": "/img/items/w_hullcracker-280w.94bfc512eecf.webp",
+    "/items/w_il_toro.webp": "/img/items/w_il_toro-280w.355743239e34.webp",
+    "/items/w_kettle.webp": "/img/items/w_kettle-280w.9b1a18891542.webp",
+    "/items/w_osprey.webp": "/img/items/w_osprey-280w.fdaaefbb19e1.webp",
+    "/items/w_rattler.webp": "/img/items/w_rattler-280w.6ca234b3ec28.webp",
+    "/items/w_renegade.webp": "/img/items/w_renegade-280w.135820afd628.webp",
+    "/items/w_stitcher.webp": "/img/items/w_stitcher-280w.26ed813f6b6b.webp",
+    "/items/w_tempest.webp": "/img/items/w_tempest-280w.dccfaaae4620.webp",
+    "/items/w_torrente.png": "/img/items/w_torrente-280w.6b4d9c6f1d18.webp",
+    "/items/w_venator.png": "/img/items/w_venator-280w.cd91219e2094.webp",
+    "/items/w_vulcano.webp": "/img/items/w_vulcano-280w.45d33c516b35.webp",
+}
+
+# Variants of each image, keyed by its rewritten URL
+IMAGES: dict[str, ImageVariants] = {
+    "/img/items/a_combat_mk_1-280w.e69f3fe33f4b.webp": {"src": "/img/items/a_combat_mk_1-140w.76fbd5d53ee3.webp", "webp": "/img/items/a_combat_mk_1-140w.76fbd5d53ee3.webp 140w, /img/items/a_combat_mk_1-280w.e69f3fe33f4b.webp 280w", "avif": "/img/items/a_combat_mk_1-140w.986ac09c7453.avif 140w, /img/items/a_combat_mk_1-280w.afff6ddab289.avif 280w", "width": 512, "height": 512},
+    "/img/items/a_looting_mk_1-280w.a29f23362aea.webp": {"src": "/img/items/a_looting_mk_1-140w.4e2c8f253706.webp", "webp": "/img/items/a_looting_mk_1-140w.4e2c8f253706.webp 140w, /img/items/a_looting_mk_1-280w.a29f23362aea.webp 280w", "avif": "/img/items/a_looting_mk_1-140w.ec22f1f20700.avif 140w, /img/items/a_looting_mk_1-280w.83252258b032.avif 280w", "width": 512, "height": 512},
+    "/img/items/a_tactical_mk_1-280w.64ef6f845014.webp": {"src": "/img/items/a_tactical_mk_1-140w.92285003a92e.webp", "webp": "/img/items/a_tactical_mk_1-140w.92285003a92e.webp 140w, /img/items/a_tactical_mk_1-280w.64ef6f845014.webp 280w", "avif": "/img/items/a_tactical_mk_1-140w.42d1551aa146.avif 140w, /img/items/a_tactical_mk_1-280w.9e8dfe593d54.avif 280w", "width": 512, "height": 512},
+    "/img/items/h_bandage-280w.c876276ebe5f.webp": {"src": "/img/items/h_bandage-140w.49ed3c3ad3cf.webp", "webp": "/img/items/h_bandage-140w.49ed3c3ad3cf.webp 140w, /img/items/h_bandage-280w.c876276ebe5f.webp 280w", "avif": "/img/items/h_bandage-140w.b5551d0d9fc0.avif 140w, /img/items/h_bandage-280w.b1d8e7eccf55.avif 280w", "width": 512, "height": 512},
+    "/img/items/m_angled_grip_1-256w.92a5631e529a.webp": {"src": "/img/items/m_angled_grip_1-140w.dd743d403786.webp", "webp": "/img/items/m_angled_grip_1-140w.dd743d403786.webp 140w, /img/items/m_angled_grip_1-256w.92a5631e529a.webp 256w", "avif": "/img/items/m_angled_grip_1-140w.0218eea602b5.avif 140w, /img/items/m_angled_grip_1-256w.5bb51f7466a2.avif 256w", "width": 256, "height": 256},
+    "/img/items/m_compensator_1-280w.1c76ad3528c6.webp": {"src": "/img/items/m_compensator_1-140w.386e3f3c6808.webp", "webp": "/img/items/m_compensator_1-140w.386e3f3c6808.webp 140w, /img/items/m_compensator_1-280w.1c76ad3528c6.webp 280w", "avif": "/img/items/m_compensator_1-140w.fed78d93e486.avif 140w, /img/items/m_compensator_1-280w.1398e30d029f.avif 280w", "width": 512, "height": 512},
+    "/img/items/m_light_mag_1-256w.2801a706f06d.webp": {"src": "/img/items/m_light_mag_1-140w.b9d2120c7727.webp", "webp": "/img/items/m_light_mag_1-140w.b9d2120c7727.webp 140w, /img/items/m_light_mag_1-256w.2801a706f06d.webp 256w", "avif": "/img/items/m_light_mag_1-140w.2c13d3cb3b05.avif 140w, /img/items/m_light_mag_1-256w.b67f1b0e964d.avif 256w", "width": 256, "height": 256},
+    "/img/items/m_muzzle_brake_1-256w.c75aea0a84e5.webp": {"src": "/img/items/m_muzzle_brake_1-140w.fd4e58d9719e.webp", "webp": "/img/items/m_muzzle_brake_1-140w.fd4e58d9719e.webp 140w, /img/items/m_muzzle_brake_1-256w.c75aea0a84e5.webp 256w", "avif": "/img/items/m_muzzle_brake_1-140w.bc812caedc30.avif 140w, /img/items/m_muzzle_brake_1-256w.7fec9e23301c.avif 256w", "width": 256, "height": 256},
+    "/img/items/m_shotgun_choke_1-256w.0fd6d25657e7.webp": {"src": "/img/items/m_shotgun_choke_1-140w.50ff660043ac.webp", "webp": "/img/items/m_shotgun_choke_1-140w.50ff660043ac.webp 140w, /img/items/m_shotgun_choke_1-256w.0fd6d25657e7.webp 256w", "avif": "/img/items/m_shotgun_choke_1-140w.df4b6fbe21a0.avif 140w, /img/items/m_shotgun_choke_1-256w.f884cfd7154b.avif 256w", "width": 256, "height": 256},
+    "/img/items/m_stock_1-256w.732a533ac0b4.webp": {"src": "/img/items/m_stock_1-140w.3fffe4e67efa.webp", "webp": "/img/items/m_stock_1-140w.3fffe4e67efa.webp 140w, /img/items/m_stock_1-256w.732a533ac0b4.webp 256w", "avif": "/img/items/m_stock_1-140w.42e5b23b49b7.avif 140w, /img/items/m_stock_1-256w.9e1d8471447e.avif 256w", "width": 256, "height": 256},
+    "/img/items/sh_light_shield-280w.c0fd6b93b39f.webp": {"src": "/img/items/sh_light_shield-140w.ad3503166eb9.webp", "webp": "/img/items/sh_light_shield-140w.ad3503166eb9.webp 140w, /img/items/sh_light_shield-280w.c0fd6b93b39f.webp 280w", "avif": "/img/items/sh_light_shield-140w.424fbeea8c9e.avif 140w, /img/items/sh_light_shield-280w.542fbdc3110d.avif 280w", "width": 512, "height": 512},
+    "/img/items/t_jolt_mine-280w.9beee92630a5.webp": {"src": "/img/items/t_jolt_mine-140w.e56a36dafcb0.webp", "webp": "/img/items/t_jolt_mine-140w.e56a36dafcb0.webp 140w, /img/items/t_jolt_mine-280w.9beee92630a5.webp 280w", "avif": "/img/items/t_jolt_mine-140w.123d22c5c167.avif 140w, /img/items/t_jolt_mine-280w.f0ef37561322.avif 280w", "width": 512, "height": 512},
+    "/img/items/w_anvil-280w.35fa4817ce95.webp": {"src": "/img/items/w_anvil-140w.1aac0aa713cb.webp", "webp": "/img/items/w_anvil-140w.1aac0aa713cb.webp 140w, /img/items/w_anvil-280w.35fa4817ce95.webp 280w", "avif": "/img/items/w_anvil-140w.e850691ee2c2.avif 140w, /img/items/w_anvil-280w.cf1e40aa1515.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_arpeggio-280w.f2bb3fabf0b7.webp": {"src": "/img/items/w_arpeggio-140w.aabc5f0977ef.webp", "webp": "/img/items/w_arpeggio-140w.aabc5f0977ef.webp 140w, /img/items/w_arpeggio-280w.f2bb3fabf0b7.webp 280w", "avif": "/img/items/w_arpeggio-140w.d2fb86d00b0c.avif 140w, /img/items/w_arpeggio-280w.1ce34a10d52b.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_bettina-280w.3998740e4edf.webp": {"src": "/img/items/w_bettina-140w.f4ca7828cf3d.webp", "webp": "/img/items/w_bettina-140w.f4ca7828cf3d.webp 140w, /img/items/w_bettina-280w.3998740e4edf.webp 280w", "avif": "/img/items/w_bettina-140w.ca009bb868e8.avif 140w, /img/items/w_bettina-280w.9d0de659d2e0.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_bobcat-280w.fbf4a6ad26b8.webp": {"src": "/img/items/w_bobcat-140w.7cc8639c00ba.webp", "webp": "/img/items/w_bobcat-140w.7cc8639c00ba.webp 140w, /img/items/w_bobcat-280w.fbf4a6ad26b8.webp 280w", "avif": "/img/items/w_bobcat-140w.3701cabebeac.avif 140w, /img/items/w_bobcat-280w.570542a98b27.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_burletta-280w.91bc5d096e50.webp": {"src": "/img/items/w_burletta-140w.e688995ce686.webp", "webp": "/img/items/w_burletta-140w.e688995ce686.webp 140w, /img/items/w_burletta-280w.91bc5d096e50.webp 280w", "avif": "/img/items/w_burletta-140w.283d0ce33d42.avif 140w, /img/items/w_burletta-280w.235c79d3fd21.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_ferro-280w.9dceb0c2903c.webp": {"src": "/img/items/w_ferro-140w.fa453e0a6a1e.webp", "webp": "/img/items/w_ferro-140w.fa453e0a6a1e.webp 140w, /img/items/w_ferro-280w.9dceb0c2903c.webp 280w", "avif": "/img/items/w_ferro-140w.e2e0d6adb566.avif 140w, /img/items/w_ferro-280w.0eb2452c4e30.avif 280w", "width": 360, "height": 180},
+    "/img/items/w_hairpin-280w.c0f016553b9d.webp": {"src": "/img/items/w_hairpin-140w.c230930e7d4d.webp", "webp": "/img/items/w_hairpin-140w.c230930e7d4d.webp 140w, /img/items/w_hairpin-280w.c0f016553b9d.webp 280w", "avif": "/img/items/w_hairpin-140w.11d0bdcb9622.avif 140w, /img/items/w_hairpin-280w.965d3e1a907d.avif 280w", "width": 360, "height": 180},
+    "/img/items/w_hullcracker-280w.94bfc512eecf.webp": {"src": "/img/items/w_hullcracker-140w.f41b7849d965.webp", "webp": "/img/items/w_hullcracker-140w.f41b7849d965.webp 140w, /img/items/w_hullcracker-280w.94bfc512eecf.webp 280w", "avif": "/img/items/w_hullcracker-140w.ac6637aea4d1.avif 140w, /img/items/w_hullcracker-280w.4e3af1b4c65c.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_il_toro-280w.355743239e34.webp": {"src": "/img/items/w_il_toro-140w.271880bca856.webp", "webp": "/img/items/w_il_toro-140w.271880bca856.webp 140w, /img/items/w_il_toro-280w.355743239e34.webp 280w", "avif": "/img/items/w_il_toro-140w.adc9be3057cd.avif 140w, /img/items/w_il_toro-280w.b5e28f52973a.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_kettle-280w.9b1a18891542.webp": {"src": "/img/items/w_kettle-140w.8f15441efd1f.webp", "webp": "/img/items/w_kettle-140w.8f15441efd1f.webp 140w, /img/items/w_kettle-280w.9b1a18891542.webp 280w", "avif": "/img/items/w_kettle-140w.61002246c411.avif 140w, /img/items/w_kettle-280w.7683dec10c07.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_osprey-280w.fdaaefbb19e1.webp": {"src": "/img/items/w_osprey-140w.809cc23ff9de.webp", "webp": "/img/items/w_osprey-140w.809cc23ff9de.webp 140w, /img/items/w_osprey-280w.fdaaefbb19e1.webp 280w", "avif": "/img/items/w_osprey-140w.4b2f4259b192.avif 140w, /img/items/w_osprey-280w.a5a82c8a4818.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_rattler-280w.6ca234b3ec28.webp": {"src": "/img/items/w_rattler-140w.c30fba74445b.webp", "webp": "/img/items/w_rattler-140w.c30fba74445b.webp 140w, /img/items/w_rattler-280w.6ca234b3ec28.webp 280w", "avif": "/img/items/w_rattler-140w.d007a1bd5619.avif 140w, /img/items/w_rattler-280w.97169cf4cdb3.avif 280w", "width": 360, "height": 180},
+    "/img/items/w_renegade-280w.135820afd628.webp": {"src": "/img/items/w_renegade-140w.336c457d532f.webp", "webp": "/img/items/w_renegade-140w.336c457d532f.webp 140w, /img/items/w_renegade-280w.135820afd628.webp 280w", "avif": "/img/items/w_renegade-140w.20ed11ed1e41.avif 140w, /img/items/w_renegade-280w.bb3de35c99e8.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_stitcher-280w.26ed813f6b6b.webp": {"src": "/img/items/w_stitcher-140w.cee71bf9ce15.webp", "webp": "/img/items/w_stitcher-140w.cee71bf9ce15.webp 140w, /img/items/w_stitcher-280w.26ed813f6b6b.webp 280w", "avif": "/img/items/w_stitcher-140w.cb049b9ea9ea.avif 140w, /img/items/w_stitcher-280w.25f5722d72d5.avif 280w", "width": 360, "height": 180},
+    "/img/items/w_tempest-280w.dccfaaae4620.webp": {"src": "/img/items/w_tempest-140w.457002c5eda2.webp", "webp": "/img/items/w_tempest-140w.457002c5eda2.webp 140w, /img/items/w_tempest-280w.dccfaaae4620.webp 280w", "avif": "/img/items/w_tempest-140w.3320db53e9af.avif 140w, /img/items/w_tempest-280w.cf776054025b.avif 280w", "width": 696, "height": 348},
+    "/img/items/w_torrente-280w.6b4d9c6f1d18.webp": {"src": "/img/items/w_torrente-140w.0ca7de41183c.webp", "webp": "/img/items/w_torrente-140w.0ca7de41183c.webp 140w, /img/items/w_torrente-280w.6b4d9c6f1d18.webp 280w", "avif": "/img/items/w_torrente-140w.d9cb3da2e6e2.avif 140w, /img/items/w_torrente-280w.0e6b7eee4b22.avif 280w", "width": 512, "height": 256},
+    "/img/items/w_venator-280w.cd91219e2094.webp": {"src": "/img/items/w_venator-140w.73859ff37dfc.webp", "webp": "/img/items/w_venator-140w.73859ff37dfc.webp 140w, /img/items/w_venator-280w.cd91219e2094.webp 280w", "avif": "/img/items/w_venator-140w.84536c9fc568.avif 140w, /img/items/w_venator-280w.23dd878a04ac.avif 280w", "width": 512, "height": 256},
+    "/img/items/w_vulcano-280w.45d33c516b35.webp": {"src": "/img/items/w_vulcano-140w.333ab7dc1022.webp", "webp": "/img/items/w_vulcano-140w.333ab7dc1022.webp 140w, /img/items/w_vulcano-280w.45d33c516b35.webp 280w", "avif": "/img/items/w_vulcano-140w.ff257cd1c8d3.avif 140w, /img/items/w_vulcano-280w.5eba9d065007.avif 280w", "width": 696, "height": 348},
+}
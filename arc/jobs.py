@@ -0,0 +1,89 @@
+"""Long-running computations for background event handlers.
+
+A background handler starts a `Job`, runs the CPU-bound work in a thread with
+`run_job()` and gets called back with the job's progress at most once per
+interval. That keeps state updates (and websocket pushes) bounded no matter how
+often the work reports progress. The work itself may fan out to a process pool.
+
+Jobs are keyed by client token and job name, so a client can run one job of each
+kind at a time and cancel it from a separate event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# Seconds between progress updates pushed into state
+PROGRESS_INTERVAL = 0.25
+
+_jobs: dict[tuple[str, str], Job] = {}
+_jobs_lock = threading.Lock()
+
+
+class Job:
+    """Progress and cancellation shared between a background handler and its worker thread."""
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self.done = 0
+        self.total = 0
+        self.partial: Any = None
+
+    def report(self, done: int, total: int, partial: Any = None) -> None:
+        """Records progress from the worker; read by the handler on its next tick."""
+        self.done, self.total, self.partial = done, total, partial
+
+    @property
+    def percent(self) -> int:
+        return self.done * 100 // self.total if self.total else 0
+
+
+def start_job(owner: str, name: str) -> Job | None:
+    """Registers a new job, or returns None if the owner already runs one with that name."""
+    with _jobs_lock:
+        if (owner, name) in _jobs:
+            return None
+        job = _jobs[owner, name] = Job()
+        return job
+
+
+def cancel_job(owner: str, name: str) -> None:
+    """Asks a running job to stop; the worker checks at its next step."""
+    with _jobs_lock:
+        job = _jobs.get((owner, name))
+    if job:
+        job.cancelled.set()
+
+
+def finish_job(owner: str, name: str) -> None:
+    """Releases a job's registration so the owner can start another; safe to call twice."""
+    with _jobs_lock:
+        _jobs.pop((owner, name), None)
+
+
+async def run_job(
+    owner: str,
+    name: str,
+    job: Job,
+    work: Callable[..., Any],
+    *args: Any,
+    on_progress: Callable[[Job], Awaitable[None]],
+    interval: float = PROGRESS_INTERVAL,
+) -> Any:
+    """Runs work(*args, job=job) in a thread, calling on_progress every interval until it returns."""
+    future = asyncio.get_running_loop().run_in_executor(None, functools.partial(work, *args, job=job))
+    try:
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=interval)
+            await on_progress(job)
+            if done:
+                return future.result()
+    finally:
+        if not future.done():
+            # The handler itself was cancelled, e.g. on disconnect, so stop the worker too
+            job.cancelled.set()
+        finish_job(owner, name)
@@ -0,0 +1,238 @@
+"""Budget-constrained loadout optimizer.
+
+Finds the loadout the stash can craft with the highest total weapon tier, then
+the most quick-use units, then a shield. Candidates are searched branch-and-bound:
+weapon pairs are tried in descending tier order, a pair the stash cannot cover
+prunes every loadout built on it, and the search stops once no remaining pair
+can beat the best tier total found.
+
+The search is split by augment and first weapon across a process pool. Each
+subtree is searched in a fixed order and the results are merged in task order,
+so the same stash always gives the same loadout.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from arc.catalog import DEFAULT_VERSION, WEAPON_TIERS, Catalog, get_catalog
+from arc.dnd_config import DRAG_TYPES, SLOT_ACCEPTANCE_RULES
+
+if TYPE_CHECKING:
+    from arc.jobs import Job
+    from arc.state import LoadoutItem, OptimizedLoadout
+
+logger = logging.getLogger(__name__)
+
+# Shield sizes from smallest to largest; an augment fits shields up to its max_shield
+SHIELD_SIZES = ("light_shield", "medium_shield", "heavy_shield")
+
+# (weapon id, tier), or None for an empty weapon slot
+WeaponChoice = tuple[str, int] | None
+
+_executor: ProcessPoolExecutor | None = None
+# Catalog revision the pool's workers loaded their data at
+_executor_revision = 0
+
+
+def _get_executor(revision: int) -> ProcessPoolExecutor:
+    """Returns the shared worker pool, starting it on first use or after a catalog reload.
+
+    Workers load the catalog once, so a pool started before `reload_catalog` would
+    search stale data with stash vectors laid out for the new resource list.
+    """
+    global _executor, _executor_revision
+    if _executor is not None and _executor_revision != revision:
+        # Subtrees already running finish on the old pool; new ones go to fresh workers
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    if _executor is None:
+        # Spawned workers attach to the shared catalog store instead of inheriting server state
+        _executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        _executor_revision = revision
+    return _executor
+
+
+def _fits_shield(augment: dict, shield_id: str) -> bool:
+    """Returns whether a shield is no larger than the augment's max shield."""
+    size = shield_id.removeprefix("sh_")
+    max_shield = augment.get("max_shield")
+    if size not in SHIELD_SIZES or max_shield not in SHIELD_SIZES:
+        return False
+    return SHIELD_SIZES.index(size) <= SHIELD_SIZES.index(max_shield)
+
+
+def _weapon_choices(catalog: Catalog) -> list[WeaponChoice]:
+    """Returns every weapon slot choice in search order."""
+    weapon_ids = sorted(i["id"] for i in catalog.items if i["category"] == "Weapon")
+    return [None] + [(weapon_id, tier) for weapon_id in weapon_ids for tier in WEAPON_TIERS]
+
+
+def _add(vector: list[int], costs) -> list[int]:
+    """Returns a new vector with the costs added."""
+    return [a + b for a, b in zip(vector, costs)] if costs else list(vector)
+
+
+def _best_quick_use(
+    catalog: Catalog, cost: list[int], owned: list[int], consumables: list[dict], slots: int
+) -> tuple[int, list[LoadoutItem]]:
+    """Returns the most quick-use units that fit in the slots and the stash on top of a cost."""
+    best_units, best_stacks = 0, []
+
+    def search(index: int, cost: list[int], slots_left: int, units: int, stacks: list[LoadoutItem]) -> None:
+        nonlocal best_units, best_stacks
+        if units > best_units:
+            best_units, best_stacks = units, list(stacks)
+        if index == len(consumables) or slots_left == 0:
+            return
+        # Every remaining slot filled with the largest stack bounds what this branch can add
+        if units + slots_left * max(c["stack_size"] for c in consumables[index:]) <= best_units:
+            return
+        item = consumables[index]
+        unit_cost = catalog.item_cost(item["id"])
+        for quantity in range(slots_left * item["stack_size"], 0, -1):
+            total = [c + u * quantity for c, u in zip(cost, unit_cost)]
+            if not catalog.can_craft(total, owned):
+                continue
+            full, rest = divmod(quantity, item["stack_size"])
+            new_stacks = [{"item_id": item["id"], "quantity": item["stack_size"], "tier": None} for _ in range(full)]
+            if rest:
+                new_stacks.append({"item_id": item["id"], "quantity": rest, "tier": None})
+            search(index + 1, total, slots_left - len(new_stacks), units + quantity, stacks + new_stacks)
+            # Fewer units of this item only help if they free budget for later items
+            if index == len(consumables) - 1:
+                break
+        search(index + 1, cost, slots_left, units, stacks)
+
+    search(0, cost, slots, 0, [])
+    return best_units, best_stacks
+
+
+def _search_subtree(
+    version: str, owned: list[int], augment_id: str, weapon_1_index: int, deadline: float
+) -> tuple[OptimizedLoadout | None, bool]:
+    """Returns the best loadout with the given augment and first weapon, and whether the search finished."""
+    catalog = get_catalog(version)
+    augment = catalog.item_by_id[augment_id]
+    weapons = _weapon_choices(catalog)
+    weapon_1 = weapons[weapon_1_index]
+
+    shields = [None] + sorted(
+        i["id"] for i in catalog.items if i["category"] == "Shield" and _fits_shield(augment, i["id"])
+    )
+    consumables = sorted(
+        (i for i in catalog.items if DRAG_TYPES.get(i["category"]) in SLOT_ACCEPTANCE_RULES["quick_use"]),
+        key=lambda i: i["id"],
+    )
+    slots = augment.get("quick_use_slots") or 0
+
+    base = _add([0] * len(catalog.resource_ids), catalog.item_cost(augment_id))
+    if weapon_1:
+        base = _add(base, catalog.item_cost(*weapon_1))
+    if not catalog.can_craft(base, owned):
+        return None, True
+
+    # The second weapon never sorts after the first, so each pair is searched once
+    pairs = [(weapon_2, (weapon_1[1] if weapon_1 else 0) + (weapon_2[1] if weapon_2 else 0))
+             for weapon_2 in weapons[:weapon_1_index + 1] if weapon_1 or weapon_2 is None]
+    pairs.sort(key=lambda pair: -pair[1])
+
+    best: OptimizedLoadout | None = None
+    for weapon_2, tier_total in pairs:
+        if time.time() > deadline:
+            return best, False
+        if best and tier_total < best["score"][0]:
+            break
+        weapons_cost = _add(base, catalog.item_cost(*weapon_2) if weapon_2 else ())
+        if not catalog.can_craft(weapons_cost, owned):
+            continue
+        for shield_id in shields:
+            cost = _add(weapons_cost, catalog.item_cost(shield_id) if shield_id else ())
+            if not catalog.can_craft(cost, owned):
+                continue
+            units, quick_use = _best_quick_use(catalog, cost, owned, consumables, slots)
+            score = [tier_total, units, 1 if shield_id else 0]
+            if best is None or score > best["score"]:
+                best = {
+                    "augment": augment_id,
+                    "shield": shield_id,
+                    "weapon_1": {"item_id": weapon_1[0], "quantity": 1, "tier": weapon_1[1]} if weapon_1 else None,
+                    "weapon_2": {"item_id": weapon_2[0], "quantity": 1, "tier": weapon_2[1]} if weapon_2 else None,
+                    "quick_use": quick_use,
+                    "score": score,
+                }
+    return best, True
+
+
+def _merge(futures: list) -> tuple[OptimizedLoadout | None, bool]:
+    """Merges the finished subtrees in submission order, which keeps ties deterministic."""
+    global _executor
+    best: OptimizedLoadout | None = None
+    complete = True
+    for future in futures:
+        if not future.done() or future.cancelled():
+            complete = False
+            continue
+        try:
+            result, finished = future.result()
+        except BrokenProcessPool:
+            # A worker died; release the broken pool and start a fresh one for the next search
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+            raise
+        complete = complete and finished
+        if result and (best is None or result["score"] > best["score"]):
+            best = result
+    return best, complete
+
+
+def optimize_loadout(
+    owned: list[int],
+    version: str = DEFAULT_VERSION,
+    augment_id: str | None = None,
+    time_limit: float = 5.0,
+    job: Job | None = None,
+) -> tuple[OptimizedLoadout | None, bool]:
+    """Returns the best loadout the stash can craft, and whether the whole space was searched.
+
+    Searches every augment unless one is given. Subtrees still running when the
+    time limit passes return the best loadout they found so far. With a job, the
+    best loadout so far is reported as each subtree finishes, and cancelling the
+    job drops the subtrees that have not started.
+    """
+    catalog = get_catalog(version)
+    # An empty stash comes in as an empty vector
+    owned = list(catalog.full_vector(owned))
+    augment_ids = [augment_id] if augment_id else sorted(
+        i["id"] for i in catalog.items if i["category"] == "Augment"
+    )
+    weapon_count = len(_weapon_choices(catalog))
+    deadline = time.time() + time_limit
+
+    executor = _get_executor(catalog.revision)
+    futures = [
+        executor.submit(_search_subtree, version, owned, augment, weapon_1_index, deadline)
+        for augment in augment_ids
+        for weapon_1_index in range(weapon_count)
+    ]
+    # Workers stop at the deadline on their own; the grace period covers their last check
+    pending = set(futures)
+    while pending and time.time() < deadline + 1.0:
+        if job and job.cancelled.is_set():
+            break
+        _, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+        if job:
+            job.report(len(futures) - len(pending), len(futures), _merge(futures)[0])
+    for future in pending:
+        future.cancel()
+
+    best, complete = _merge(futures)
+    if not complete:
+        logger.info("Loadout optimizer stopped early after %d of %d subtrees", len(futures) - len(pending), len(futures))
+    return best, complete
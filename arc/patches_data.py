@@ -0,0 +1,11 @@
+from arc.state import CatalogPatch
+
+# Catalog versions for other game patches, keyed by the name shown to players.
+# Each patch only lists the entries that differ from the current data modules:
+#
+#     "Patch 1.0": {
+#         "items": [...],           # items whose data differed in that patch
+#         "resources": [...],       # resources whose data differed in that patch
+#         "removed_items": [...],   # ids of current items that did not exist yet
+#     },
+CATALOG_PATCHES: dict[str, CatalogPatch] = {}
@@ -0,0 +1,174 @@
+"""Recipe graph over resources and items, in both directions.
+
+Forward edges are crafting recipes: a node points at the components one unit is
+made from. Reverse edges are recycling yields from `SALVAGE_YIELDS`: a node points
+at what scrapping one unit gives back. Both directions are checked for cycles when
+the graph is built, so expanding a node always terminates, and no salvage may give
+back more basic resources than crafting the node costs. Expansions are
+memoized per node, so netting salvage against a loadout is a sum of cached vectors
+however deep the graph grows. Unverified yields are part of the graph, but are
+left out of what the salvage list recovers.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+from arc.catalog import DEFAULT_VERSION, CatalogError, get_catalog
+
+if TYPE_CHECKING:
+    from arc.catalog import Catalog, CostVector
+    from arc.state import ResourceCost
+
+Direction = Literal["forward", "reverse"]
+
+# Graph per catalog version, replaced when get_catalog() returns a new catalog
+_graphs: dict[str, RecipeGraph] = {}
+
+
+def find_cycle(edges: dict[str, dict[str, int]]) -> list[str] | None:
+    """Returns the nodes of a cycle in the graph, first node repeated at the end, or None."""
+    # 1 while a node is on the DFS path, 2 once all of its descendants are done
+    state: dict[str, int] = {}
+    for root in edges:
+        if root in state:
+            continue
+        path = [root]
+        stack = [iter(edges[root])]
+        state[root] = 1
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                state[path.pop()] = 2
+                stack.pop()
+            elif state.get(node) == 1:
+                return path[path.index(node):] + [node]
+            elif node not in state:
+                state[node] = 1
+                path.append(node)
+                stack.append(iter(edges.get(node, ())))
+    return None
+
+
+def _edge_dict(costs: list[ResourceCost]) -> dict[str, int]:
+    edges: dict[str, int] = {}
+    for cost in costs:
+        edges[cost["resource"]] = edges.get(cost["resource"], 0) + cost["quantity"]
+    return edges
+
+
+class RecipeGraph:
+    """Crafting and recycling edges between the items and resources of one catalog."""
+
+    def __init__(
+        self, catalog: Catalog, salvage: dict[str, list[ResourceCost]], unverified: frozenset[str] = frozenset()
+    ):
+        self.catalog = catalog
+        # Salvage nodes whose yields are placeholders, not counted as recovered
+        self.unverified = unverified
+
+        # Weapons are crafted at tier 1; higher tiers are upgrades of an existing weapon
+        self.forward: dict[str, dict[str, int]] = {
+            r["id"]: _edge_dict(r["resources"]) for r in catalog.resources if r["resource_type"] == "refined"
+        }
+        for item in catalog.items + catalog.weapon_mods:
+            self.forward[item["id"]] = catalog.to_resource_dict(catalog.item_cost(item["id"], 1))
+        self.reverse: dict[str, dict[str, int]] = {node: _edge_dict(yields) for node, yields in salvage.items()}
+        self._expansions: dict[tuple[str, Direction, bool], CostVector] = {}
+
+        errors = self._validate()
+        if errors:
+            raise CatalogError("Invalid recipe graph:\n  " + "\n  ".join(errors))
+
+    def _validate(self) -> list[str]:
+        errors = []
+        for node, yields in self.reverse.items():
+            if node not in self.catalog.item_by_id and node not in self.catalog.resource_index:
+                errors.append(f"salvage {node}: unknown item or resource")
+            errors.extend(
+                f"salvage {node}: unknown resource {resource_id}"
+                for resource_id in yields if resource_id not in self.catalog.resource_index
+            )
+        for direction, edges in (("crafting", self.forward), ("salvage", self.reverse)):
+            cycle = find_cycle(edges)
+            if cycle:
+                errors.append(f"{direction} cycle: {' -> '.join(cycle)}")
+        if errors:
+            # Expanding would not terminate, or would index unknown resources
+            return errors
+
+        # Crafting a node and scrapping it again must not create resources
+        for node, yields in self.reverse.items():
+            cost = self.expand(node, "forward")
+            recovered = self._expand_edges(yields, "forward", recursive=True)
+            errors.extend(
+                f"salvage {node}: yields {amount} {self.catalog.resource_ids[index]}, crafting costs {cost[index]}"
+                for index, amount in enumerate(recovered) if amount > cost[index]
+            )
+        return errors
+
+    def edges(self, node: str, direction: Direction) -> dict[str, int]:
+        """Returns a node's direct edges in one direction."""
+        return (self.forward if direction == "forward" else self.reverse).get(node, {})
+
+    def expand(self, node: str, direction: Direction, recursive: bool = True) -> CostVector:
+        """Returns what one unit of a node expands to as a resource vector.
+
+        Forward, that is its crafting cost; in reverse, its salvage yield. With
+        recursive expansion, every yielded node that has edges in the same
+        direction is expanded in turn, down to the leaves.
+        """
+        key = (node, direction, recursive)
+        vector = self._expansions.get(key)
+        if vector is None:
+            vector = self._expansions[key] = self._expand_edges(self.edges(node, direction), direction, recursive)
+        return vector
+
+    def _expand_edges(self, edges: dict[str, int], direction: Direction, recursive: bool) -> CostVector:
+        """Returns the resource vector of a set of edges, expanding their targets like `expand`."""
+        result = [0] * len(self.catalog.resource_ids)
+        for target, quantity in edges.items():
+            if recursive and self.edges(target, direction):
+                for index, amount in enumerate(self.expand(target, direction)):
+                    if amount:
+                        result[index] += amount * quantity
+            else:
+                result[self.catalog.resource_index[target]] += quantity
+        return tuple(result)
+
+    def salvage_vector(self, quantities: dict[str, int]) -> list[int]:
+        """Returns the resources recovered by scrapping the given quantities of each node.
+
+        Only the direct yields are counted, since recovered refined parts are
+        worth more kept whole: decomposition already uses them before expanding.
+        Unverified nodes recover nothing until their yields are confirmed.
+        """
+        totals = [0] * len(self.catalog.resource_ids)
+        for node, quantity in quantities.items():
+            if quantity and node in self.reverse and node not in self.unverified:
+                for index, amount in enumerate(self.expand(node, "reverse", recursive=False)):
+                    if amount:
+                        totals[index] += amount * quantity
+        return totals
+
+
+def version_salvage(catalog: Catalog, salvage: dict[str, list[ResourceCost]]) -> dict[str, list[ResourceCost]]:
+    """Returns the salvage entries for nodes a catalog version has.
+
+    Patches may remove items, and an item a version does not have cannot be
+    scrapped in it. Unknown nodes in the current catalog are still errors.
+    """
+    return {node: yields for node, yields in salvage.items() if node in catalog.item_by_id or node in catalog.resource_index}
+
+
+def get_recipe_graph(version: str = DEFAULT_VERSION) -> RecipeGraph:
+    """Returns the recipe graph for a catalog version, rebuilt whenever that catalog changes."""
+    catalog = get_catalog(version)
+    graph = _graphs.get(version)
+    if graph is None or graph.catalog is not catalog:
+        # Imported here so the data module is only loaded with the catalog, and reloads are seen
+        from arc.salvage_data import SALVAGE_YIELDS, UNVERIFIED_SALVAGE
+
+        salvage = SALVAGE_YIELDS if catalog is get_catalog() else version_salvage(catalog, SALVAGE_YIELDS)
+        graph = _graphs[version] = RecipeGraph(catalog, salvage, UNVERIFIED_SALVAGE)
+    return graph
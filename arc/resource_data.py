@@ -131,6 +131,36 @@ BASIC_RESOURCES: list[Resource] = [
         "rarity": "Uncommon",
         "stack_size": 10,
     },
+    {
+        "id": "r_canister",
+        "name": "Canister",
+        "category": "resource",
+        "resource_type": "basic",
+        "image": None,
+        "resources": [],
+        "rarity": "Uncommon",
+        "stack_size": 15,
+    },
+    {
+        "id": "r_exodus_modules",
+        "name": "Exodus Modules",
+        "category": "resource",
+        "resource_type": "basic",
+        "image": None,
+        "resources": [],
+        "rarity": "Epic",
+        "stack_size": 5,
+    },
+    {
+        "id": "r_magnetic_accelerator",
+        "name": "Magnetic Accelerator",
+        "category": "resource",
+        "resource_type": "basic",
+        "image": None,
+        "resources": [],
+        "rarity": "Epic",
+        "stack_size": 5,
+    },
 ]
 
 REFINED_RESOURCES: list[Resource] = [
@@ -225,10 +255,3 @@ REFINED_RESOURCES: list[Resource] = [
 ]
 
 RESOURCES: list[Resource] = BASIC_RESOURCES + REFINED_RESOURCES
-
-# Create a mapping from resource ID to resource object for easy lookup
-RESOURCE_BY_ID: dict[str, Resource] = {r["id"]: r for r in RESOURCES}
-
-# Create a mapping from resource name to resource ID for migration
-RESOURCE_NAME_TO_ID: dict[str, str] = {r["name"]: r["id"] for r in RESOURCES}
-
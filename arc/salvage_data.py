@@ -0,0 +1,46 @@
+from arc.state import ResourceCost
+
+# Recycling yields: what scrapping one unit of an item, weapon mod or refined
+# resource gives back, keyed by its id. Anything not listed cannot be salvaged in
+# the planner. Recycling returns about half of a recipe, so the refined parts
+# below give back half their components, rounded down. Replace an entry with the
+# in-game yield once it has been checked, and drop it from UNVERIFIED_SALVAGE.
+SALVAGE_YIELDS: dict[str, list[ResourceCost]] = {
+    "r_mechanical_components": [
+        {"resource": "r_metal_parts", "quantity": 3},
+        {"resource": "r_rubber_parts", "quantity": 1},
+    ],
+    "r_electrical_components": [
+        {"resource": "r_plastic_parts", "quantity": 4},
+        {"resource": "r_rubber_parts", "quantity": 2},
+    ],
+    "r_advanced_mechanical_components": [
+        {"resource": "r_mechanical_components", "quantity": 1},
+        {"resource": "r_steel_spring", "quantity": 1},
+    ],
+    "r_advanced_electrical_components": [
+        {"resource": "r_electrical_components", "quantity": 1},
+        {"resource": "r_wires", "quantity": 1},
+    ],
+    "r_light_gun_parts": [
+        {"resource": "r_simple_gun_parts", "quantity": 2},
+    ],
+    "r_medium_gun_parts": [
+        {"resource": "r_simple_gun_parts", "quantity": 2},
+    ],
+    "r_heavy_gun_parts": [
+        {"resource": "r_simple_gun_parts", "quantity": 2},
+    ],
+}
+
+# Entries whose yields are estimates, not checked in game. They can still be
+# planned, but their yields do not count toward the stash until confirmed.
+UNVERIFIED_SALVAGE: frozenset[str] = frozenset({
+    "r_mechanical_components",
+    "r_electrical_components",
+    "r_advanced_mechanical_components",
+    "r_advanced_electrical_components",
+    "r_light_gun_parts",
+    "r_medium_gun_parts",
+    "r_heavy_gun_parts",
+})
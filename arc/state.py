@@ -1,5 +1,8 @@
+import copy
+from concurrent.futures.process import BrokenProcessPool
+
 import reflex as rx
-from typing import TypedDict, Literal, cast
+from typing import NotRequired, TypedDict, Literal, cast
 from arc.dnd_config import DRAG_TYPES, SLOT_ACCEPTANCE_RULES, SlotType
 
 Rarity = Literal["Common", "Uncommon", "Rare", "Epic", "Legendary"]
@@ -19,12 +22,26 @@ class Resource(TypedDict):
     image: str | None
     resources: list[ResourceCost]
     rarity: Rarity
+    stack_size: int
+
+
+# Responsive variants of one catalog image, from `python -m arc.build_images`
+class ImageVariants(TypedDict):
+    src: str
+    webp: str
+    avif: str
+    width: int | None
+    height: int | None
 
 
 class ResourceDisplay(TypedDict):
     id: str
     name: str
     quantity: int
+    owned: int
+    salvaged: int
+    missing: int
+    slots: int
     resource_type: ResourceType
     rarity: Rarity
     image: str | None
@@ -33,24 +50,137 @@ class ResourceDisplay(TypedDict):
 class Item(TypedDict):
     id: str
     name: str
-    category: Literal["Weapon", "Augment", "Shield", "Healing", "Trap", "Gear", "Gadget", "Tool"]
+    category: Literal["Weapon", "Augment", "Shield", "Healing", "Trap", "Gear", "Gadget", "Tool", "Weapon Mod"]
     icon: str
     image: str | None
     symbol: str | None
     resources: list[ResourceCost]
     tier_resources: dict[int, list[ResourceCost]]
     rarity: Rarity
+    mod_type: str | None
+    weapon_mod_slots: list[str] | None
     backpack_slots: int | None
     safe_pocket_slots: int | None
     quick_use_slots: int | None
     max_shield: str | None
     stack_size: int
+    # Only on the items sent to the item grid
+    picture: NotRequired[ImageVariants]
+
+
+class CatalogPatch(TypedDict):
+    items: list[Item]
+    resources: list[Resource]
+    removed_items: list[str]
+
+
+class ModOption(TypedDict):
+    id: str
+    name: str
+
+
+class WeaponModSocket(TypedDict):
+    mod_slot: str
+    label: str
+    mod_id: str
+    options: list[ModOption]
+
+
+class CraftableItem(TypedDict):
+    id: str
+    name: str
+    tier: int | None
+    count: int
 
 
 class LoadoutItem(TypedDict):
     item_id: str
     quantity: int
     tier: int | None
+    from_tier: NotRequired[int]
+
+
+class SquadMember(TypedDict):
+    name: str
+    loadout: dict
+    costs: list[int]
+
+
+class SquadMemberTotal(TypedDict):
+    index: int
+    name: str
+    active: bool
+    resources: list[ResourceDisplay]
+
+
+# One loadout slot flattened to primitives, so memoized slot components compare cheaply
+class SlotView(TypedDict):
+    item_id: str
+    name: str
+    category: str
+    rarity: Rarity
+    image: str | None
+    symbol: str | None
+    quantity: int
+    tier: int | None
+    from_tier: int
+
+
+class ResourceAmount(TypedDict):
+    name: str
+    quantity: int
+
+
+class TierCost(TypedDict):
+    tier: int
+    resources: list[ResourceAmount]
+
+
+class ItemTooltip(TypedDict):
+    id: str
+    name: str
+    rarity: Rarity
+    category: str
+    tiers: list[TierCost]
+
+
+class GridViewport(TypedDict):
+    scroll_top: int
+    height: int
+    width: int
+
+
+class ItemGridOffsets(TypedDict):
+    top: int
+    bottom: int
+
+
+class StorageFootprint(TypedDict):
+    before: int
+    after: int
+
+
+class SalvageOption(TypedDict):
+    id: str
+    name: str
+    quantity: int
+    yields: str
+    verified: bool
+
+
+class CampaignRow(TypedDict):
+    index: int
+    name: str
+    raids: int
+
+
+class OptimizedLoadout(TypedDict):
+    augment: str
+    shield: str | None
+    weapon_1: LoadoutItem | None
+    weapon_2: LoadoutItem | None
+    quick_use: list[LoadoutItem]
+    score: list[int]
 
 
 from pydantic import BaseModel
@@ -65,15 +195,26 @@ class LoadoutSlot(BaseModel):
     position: int = 0
 
 
-from arc.items_data import ITEMS
-from arc.resource_data import RESOURCES, RESOURCE_BY_ID
+from arc.catalog import DEFAULT_VERSION, catalog_versions, get_catalog
+from arc.jobs import Job, cancel_job, finish_job, run_job, start_job
+from arc.recipe_graph import get_recipe_graph
+
+# Loadout slot groups that campaign loss rates apply to
+SLOT_GROUPS = ("equipment", "backpack", "quick_use", "safe_pocket")
+
+# Item grid layout in pixels, matching the card and grid classes in item_selector
+ITEM_CARD_HEIGHT = 160
+ITEM_CARD_MIN_WIDTH = 140
+ITEM_GRID_GAP = 16
+ITEM_GRID_PADDING = 48
+ITEM_GRID_ROW_HEIGHT = ITEM_CARD_HEIGHT + ITEM_GRID_GAP
+# Rows mounted above and below the visible ones, so scrolling shows no blank rows
+ITEM_GRID_OVERSCAN_ROWS = 2
 
 
 class CalculatorState(rx.State):
     """Manages the state for the resource calculator."""
 
-    all_items: list[Item] = ITEMS
-    all_resources: list[Resource] = RESOURCES
     active_category: str = "All"
     search_query: str = ""
     selected_weapon_tiers: dict[str, int] = {}
@@ -81,11 +222,44 @@ class CalculatorState(rx.State):
     
     loadout_augment: str | None = None
     loadout_shield: str | None = None
-    loadout_weapon_1: dict[str, int | str | None] | None = None
-    loadout_weapon_2: dict[str, int | str | None] | None = None
+    # Equipped weapons also carry their attached mods as {"mods": {mod_slot: mod_id}}
+    loadout_weapon_1: dict[str, int | str | dict[str, str] | None] | None = None
+    loadout_weapon_2: dict[str, int | str | dict[str, str] | None] | None = None
     loadout_backpack: list[dict[str, int | str | None]] = []
     loadout_quick_use: list[dict[str, int | str | None]] = []
     loadout_safe_pocket: list[dict[str, int | str | None]] = []
+    catalog_revision: int = 0
+    catalog_version: str = DEFAULT_VERSION
+
+    # Stash contents as resource id -> owned quantity
+    inventory: dict[str, int] = {}
+    inventory_import_errors: list[str] = []
+    # Items and refined parts to scrap, as id -> quantity; their yields count as owned
+    salvage: dict[str, int] = {}
+    optimizer_status: str = ""
+
+    # Squad members; the loadout_* fields above hold the active member's loadout
+    squad: list[SquadMember] = []
+    squad_active: int = 0
+    # Sum of every inactive member's cost vector, and the catalog it was priced with
+    squad_others_costs: list[int] = []
+    squad_costs_key: str = ""
+
+    # Raids planned per loadout (squad member, or just the current loadout), and the
+    # percentage of each slot group lost per raid
+    campaign_raids: list[int] = []
+    campaign_loss_rates: dict[str, int] = {"equipment": 100, "backpack": 100, "quick_use": 100, "safe_pocket": 0}
+    optimizer_running: bool = False
+    optimizer_progress: int = 0
+
+    # Item grid window: first visible row, visible row count and column count
+    item_grid_first_row: int = 0
+    item_grid_rows: int = 4
+    item_grid_columns: int = 4
+
+    # Item under the pointer in the item grid, and where the pointer entered it
+    hovered_item: str = ""
+    hovered_item_position: dict[str, int] = {"x": 0, "y": 0}
     
     resource_icons: dict[str, str] = {
         "Scrap Metal": "gem",
@@ -93,23 +267,81 @@ class CalculatorState(rx.State):
         "Electronics": "cpu",
         "Chemicals": "flask-conical",
     }
-    rarity_colors: dict[str, str] = {
-        "Common": "text-gray-400",
-        "Uncommon": "text-[#3DEB58]",
-        "Rare": "text-[#22BFFB]",
-        "Epic": "text-[#CB008A]",
-        "Legendary": "text-[#F9BC0A]",
-    }
+
+    @rx.event
+    def sync_catalog(self):
+        """Picks up a reloaded catalog so the cached costs are recomputed."""
+        revision = get_catalog(self.catalog_version).revision
+        if self.catalog_revision != revision:
+            self.catalog_revision = revision
+
+    @rx.event
+    def set_catalog_version(self, version: str):
+        """Switches the game version used to price the loadout."""
+        if version in catalog_versions():
+            self.catalog_version = version
 
     @rx.event
     def set_search_query(self, query: str):
         """Sets the search query for filtering items."""
         self.search_query = query
+        return self._scroll_item_grid_to_top()
 
     @rx.event
     def select_category(self, category: str):
         """Sets the active category for filtering items."""
         self.active_category = category
+        return self._scroll_item_grid_to_top()
+
+    def _scroll_item_grid_to_top(self):
+        """Moves the item grid window back to the first row after the filter changes."""
+        self.item_grid_first_row = 0
+        return rx.call_script("document.getElementById('item-grid').scrollTop = 0")
+
+    @rx.event
+    def show_item_tooltip(self, item_id: str, pointer: dict):
+        """Shows the shared item tooltip for an item, next to the pointer."""
+        self.hovered_item = item_id
+        self.hovered_item_position = {"x": int(pointer["client_x"]), "y": int(pointer["client_y"])}
+
+    @rx.event
+    def hide_item_tooltip(self, item_id: str):
+        """Hides the item tooltip, unless the pointer has already entered another item."""
+        if self.hovered_item == item_id:
+            self.hovered_item = ""
+
+    @rx.var(deps=["catalog_revision"])
+    def item_tooltip(self) -> ItemTooltip:
+        """Returns the hovered item's details and per-tier costs for the shared tooltip."""
+        catalog = get_catalog(self.catalog_version)
+        item = catalog.item_by_id.get(self.hovered_item)
+        if item is None:
+            return {"id": "", "name": "", "rarity": "Common", "category": "", "tiers": []}
+        return {
+            "id": item["id"],
+            "name": item["name"],
+            "rarity": item["rarity"],
+            "category": item["category"],
+            "tiers": catalog.tier_costs(item["id"]),
+        }
+
+    @rx.event
+    def set_item_grid_viewport(self, viewport: GridViewport):
+        """Updates the item grid window from the grid's scroll position and size.
+
+        Only whole-row changes are stored, so scrolling within a row sends no update.
+        """
+        columns = max(1, (viewport["width"] - ITEM_GRID_PADDING + ITEM_GRID_GAP) // (ITEM_CARD_MIN_WIDTH + ITEM_GRID_GAP))
+        rows = -(-viewport["height"] // ITEM_GRID_ROW_HEIGHT) + 1
+        first_row = max(0, viewport["scroll_top"]) // ITEM_GRID_ROW_HEIGHT
+        if columns != self.item_grid_columns:
+            self.item_grid_columns = columns
+        if rows != self.item_grid_rows:
+            self.item_grid_rows = rows
+        if first_row != self.item_grid_first_row:
+            self.item_grid_first_row = first_row
+            # The hovered card may have scrolled out of the window without a mouse leave
+            self.hovered_item = ""
 
     @rx.event
     def set_weapon_tier(self, item_id: str, tier: int):
@@ -126,6 +358,187 @@ class CalculatorState(rx.State):
         elif slot == "backpack" and index is not None and index < len(self.loadout_backpack):
             self.loadout_backpack[index]["tier"] = tier
 
+    @rx.event
+    def set_loadout_weapon_from_tier(self, slot: str, from_tier: str, index: int | None = None):
+        """Sets the tier a weapon in the loadout is already owned at, so only the upgrade is priced."""
+        owned_tier = int(from_tier) if from_tier.isdigit() else 0
+        if slot == "weapon_1" and self.loadout_weapon_1:
+            self.loadout_weapon_1["from_tier"] = owned_tier
+        elif slot == "weapon_2" and self.loadout_weapon_2:
+            self.loadout_weapon_2["from_tier"] = owned_tier
+        elif slot == "backpack" and index is not None and index < len(self.loadout_backpack):
+            self.loadout_backpack[index]["from_tier"] = owned_tier
+
+    @rx.event
+    def attach_weapon_mod(self, slot: str, mod_slot: str, mod_id: str):
+        """Attaches a mod to a weapon's mod slot, or detaches it if mod_id is empty."""
+        weapon = self.loadout_weapon_1 if slot == "weapon_1" else self.loadout_weapon_2 if slot == "weapon_2" else None
+        if not weapon:
+            return
+        catalog = get_catalog(self.catalog_version)
+        item = catalog.item_by_id.get(weapon["item_id"])
+        if not item or mod_slot not in (item.get("weapon_mod_slots") or []):
+            return
+        if mod_id and mod_id not in catalog.mods_by_type.get(mod_slot, ()):
+            return
+
+        mods = dict(weapon.get("mods") or {})
+        if mod_id:
+            mods[mod_slot] = mod_id
+        else:
+            mods.pop(mod_slot, None)
+        if slot == "weapon_1":
+            self.loadout_weapon_1 = {**weapon, "mods": mods}
+        else:
+            self.loadout_weapon_2 = {**weapon, "mods": mods}
+
+    @rx.event
+    def detach_weapon_mod(self, slot: str, mod_slot: str):
+        """Removes the mod from a weapon's mod slot."""
+        return CalculatorState.attach_weapon_mod(slot, mod_slot, "")
+
+    def _squad_key(self) -> str:
+        """Identifies the catalog the stored squad cost vectors were priced with."""
+        return f"{self.catalog_version}:{get_catalog(self.catalog_version).revision}"
+
+    def _squad_member_costs(self, index: int) -> list[int]:
+        """Returns an inactive member's stored cost vector, repricing it if the catalog changed."""
+        member = self.squad[index]
+        if self.squad_costs_key == self._squad_key():
+            return member["costs"]
+        return self._loadout_vector(member["loadout"])
+
+    def _squad_others(self) -> list[int]:
+        """Returns the summed cost vector of every inactive member."""
+        if self.squad_costs_key == self._squad_key():
+            return self.squad_others_costs
+        # The catalog changed since the vectors were stored, so reprice every member
+        width = len(get_catalog(self.catalog_version).resource_ids)
+        others = [0] * width
+        for index, member in enumerate(self.squad):
+            if index != self.squad_active:
+                others = [a + b for a, b in zip(others, self._loadout_vector(member["loadout"]))]
+        return others
+
+    def _store_active_member(self) -> None:
+        """Saves the active member's loadout and cost vector into the squad."""
+        if self.squad_costs_key != self._squad_key():
+            # Reprice the stored members once so the running sum matches the catalog again
+            self.squad_others_costs = self._squad_others()
+            for index, member in enumerate(self.squad):
+                if index != self.squad_active:
+                    member["costs"] = self._loadout_vector(member["loadout"])
+            self.squad_costs_key = self._squad_key()
+        member = self.squad[self.squad_active]
+        member["loadout"] = copy.deepcopy(self._loadout_snapshot())
+        member["costs"] = self._loadout_costs()
+
+    def _load_member(self, index: int) -> None:
+        """Makes a member active, moving its vector out of the inactive sum."""
+        active = self.squad[self.squad_active]["costs"]
+        member = self.squad[index]
+        self.squad_others_costs = [
+            total + active_cost - member_cost
+            for total, active_cost, member_cost in zip(self.squad_others_costs, active, member["costs"])
+        ]
+        self.squad_active = index
+        for field, value in copy.deepcopy(member["loadout"]).items():
+            setattr(self, field, value)
+
+    @rx.event
+    def start_squad(self):
+        """Turns the current loadout into the first member of a squad."""
+        if self.squad:
+            return
+        self.squad = [{"name": "Player 1", "loadout": {}, "costs": []}]
+        self.squad_active = 0
+        self.squad_others_costs = [0] * len(get_catalog(self.catalog_version).resource_ids)
+        self.squad_costs_key = self._squad_key()
+        self._store_active_member()
+
+    @rx.event
+    def add_squad_member(self):
+        """Adds a member with an empty loadout and switches to it."""
+        if not self.squad:
+            return
+        self._store_active_member()
+        self.squad.append({"name": f"Player {len(self.squad) + 1}", "loadout": {}, "costs": []})
+        self.campaign_raids = [self._raids(index) for index in range(len(self.squad))]
+        self.squad_others_costs = [
+            total + cost for total, cost in zip(self.squad_others_costs, self.squad[self.squad_active]["costs"])
+        ]
+        self.squad_active = len(self.squad) - 1
+        self.clear_selection()
+        self._store_active_member()
+
+    @rx.event
+    def switch_squad_member(self, index: int):
+        """Switches the loadout being edited to another member."""
+        if index == self.squad_active or not 0 <= index < len(self.squad):
+            return
+        self._store_active_member()
+        self._load_member(index)
+
+    @rx.event
+    def remove_squad_member(self, index: int):
+        """Removes a member, leaving squad mode when only one would remain."""
+        if not 0 <= index < len(self.squad):
+            return
+        if len(self.squad) == 1:
+            self.leave_squad()
+            return
+        self._store_active_member()
+        raids = [self._raids(member) for member in range(len(self.squad)) if member != index]
+        if len(self.squad) == 2:
+            if index == self.squad_active:
+                self._load_member(1 - index)
+            self.leave_squad()
+            self.campaign_raids = raids
+            return
+        self.campaign_raids = raids
+        if index == self.squad_active:
+            self._load_member(index - 1 if index else 1)
+        removed = self.squad.pop(index)
+        self.squad_others_costs = [total - cost for total, cost in zip(self.squad_others_costs, removed["costs"])]
+        if index < self.squad_active:
+            self.squad_active -= 1
+
+    @rx.event
+    def rename_squad_member(self, index: int, name: str):
+        """Renames a squad member."""
+        if 0 <= index < len(self.squad) and name.strip():
+            self.squad[index]["name"] = name.strip()
+
+    @rx.event
+    def leave_squad(self):
+        """Leaves squad mode, keeping the active member's loadout."""
+        self.campaign_raids = [self._raids(self.squad_active)]
+        self.squad = []
+        self.squad_active = 0
+        self.squad_others_costs = []
+        self.squad_costs_key = ""
+
+    def _raids(self, index: int) -> int:
+        """Returns the raids planned for a campaign loadout, one unless set."""
+        return self.campaign_raids[index] if index < len(self.campaign_raids) else 1
+
+    @rx.event
+    def set_campaign_raids(self, index: int, raids: str):
+        """Sets how many raids a loadout is planned for."""
+        count = max(len(self.squad), 1)
+        if not 0 <= index < count:
+            return
+        self.campaign_raids = [
+            (int(raids) if raids.isdigit() else 0) if loadout == index else self._raids(loadout)
+            for loadout in range(count)
+        ]
+
+    @rx.event
+    def set_campaign_loss_rate(self, group: str, rate: str):
+        """Sets the percentage of a slot group expected to be lost per raid."""
+        if group in SLOT_GROUPS:
+            self.campaign_loss_rates[group] = min(int(rate), 100) if rate.isdigit() else 0
+
     @rx.event
     def clear_selection(self):
         """Clears all loadout items."""
@@ -149,11 +562,109 @@ class CalculatorState(rx.State):
     @rx.event
     def decompose_all_resources(self):
         """Decomposes all refined resources in the current total."""
-        for resource_id, _ in self.total_resources.items():
-            resource = RESOURCE_BY_ID.get(resource_id)
-            if resource and resource["resource_type"] == "refined":
+        catalog = get_catalog(self.catalog_version)
+        for resource_id in self.total_resources:
+            if resource_id in catalog.decomposition:
                 self.decomposed_resources.add(resource_id)
 
+    @rx.event
+    def set_owned_quantity(self, resource_id: str, quantity: str):
+        """Sets how many of a resource are in the stash."""
+        if resource_id not in get_catalog(self.catalog_version).resource_index:
+            return
+        owned = int(quantity) if quantity.isdigit() else 0
+        if owned:
+            self.inventory[resource_id] = owned
+        else:
+            self.inventory.pop(resource_id, None)
+
+    @rx.event
+    def import_inventory(self, form_data: dict):
+        """Replaces the stash contents with a pasted inventory list."""
+        inventory, errors = get_catalog(self.catalog_version).parse_inventory(form_data.get("inventory", ""))
+        self.inventory = inventory
+        self.inventory_import_errors = errors
+
+    @rx.event
+    def set_salvage_quantity(self, node_id: str, quantity: str):
+        """Sets how many of an item or refined resource will be scrapped."""
+        if node_id not in get_recipe_graph(self.catalog_version).reverse:
+            return
+        count = int(quantity) if quantity.isdigit() else 0
+        if count:
+            self.salvage[node_id] = count
+        else:
+            self.salvage.pop(node_id, None)
+
+    @rx.event
+    def clear_inventory(self):
+        """Empties the stash."""
+        self.inventory = {}
+        self.inventory_import_errors = []
+
+    @rx.event(background=True)
+    async def optimize_loadout(self):
+        """Replaces the loadout with the best one the stash can craft.
+
+        Keeps the equipped augment if there is one, otherwise picks the augment too.
+        Runs in the background and streams its progress until done or cancelled.
+        """
+        from arc.optimizer import optimize_loadout
+
+        async with self:
+            owner = self.router.session.client_token
+            job = start_job(owner, "optimizer")
+            if job is None:
+                return
+
+        async def on_progress(job: Job):
+            async with self:
+                self.optimizer_progress = job.percent
+                if job.partial:
+                    tier_total, units, _ = job.partial["score"]
+                    self.optimizer_status = f"Best so far: tier total {tier_total}, {units} quick-use items"
+
+        try:
+            async with self:
+                self.optimizer_running = True
+                self.optimizer_progress = 0
+                self.optimizer_status = "Searching..."
+                args = (self._owned_vector(), self.catalog_version, self.loadout_augment)
+            best, complete = await run_job(owner, "optimizer", job, optimize_loadout, *args, on_progress=on_progress)
+        except BrokenProcessPool:
+            # A search worker died; the next search starts a fresh pool
+            async with self:
+                self.optimizer_status = "The search failed, please try again."
+            return
+        finally:
+            # run_job releases the job itself, but not if the setup above raised
+            finish_job(owner, "optimizer")
+            async with self:
+                self.optimizer_running = False
+
+        async with self:
+            if best is None:
+                self.optimizer_status = "Cancelled." if job.cancelled.is_set() else "The stash cannot craft any loadout."
+                return
+            self.loadout_augment = best["augment"]
+            self.loadout_shield = best["shield"]
+            self.loadout_weapon_1 = best["weapon_1"]
+            self.loadout_weapon_2 = best["weapon_2"]
+            self.loadout_quick_use = best["quick_use"]
+            self.loadout_backpack = []
+            self.loadout_safe_pocket = []
+            if complete:
+                self.optimizer_status = ""
+            elif job.cancelled.is_set():
+                self.optimizer_status = "Cancelled, showing the best loadout found."
+            else:
+                self.optimizer_status = "Time limit reached, showing the best loadout found."
+
+    @rx.event
+    def cancel_optimizer(self):
+        """Stops a running optimizer search."""
+        cancel_job(self.router.session.client_token, "optimizer")
+
     @rx.event
     def reset_decomposition(self):
         """Resets all decomposed resources to their original state."""
@@ -189,7 +700,7 @@ class CalculatorState(rx.State):
     @rx.event
     def auto_equip_item(self, item_id: str):
         """Automatically equips an item to the best available slot based on its category."""
-        item = next((i for i in self.all_items if i["id"] == item_id), None)
+        item = get_catalog(self.catalog_version).item_by_id.get(item_id)
         if not item:
             return
         
@@ -225,7 +736,7 @@ class CalculatorState(rx.State):
     @rx.event
     def equip_to_loadout(self, item_id: str, slot: str):
         """Equips an item to a specific loadout slot."""
-        item = next((i for i in self.all_items if i["id"] == item_id), None)
+        item = get_catalog(self.catalog_version).item_by_id.get(item_id)
         if not item:
             return
         
@@ -281,7 +792,7 @@ class CalculatorState(rx.State):
         
         if loadout_list is not None and index < len(loadout_list):
             loadout_item = loadout_list[index]
-            item = next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), None)
+            item = get_catalog(self.catalog_version).item_by_id.get(loadout_item["item_id"])
             if item and loadout_item["quantity"] < item["stack_size"]:
                 loadout_list[index] = {"item_id": loadout_item["item_id"], "quantity": loadout_item["quantity"] + 1}
     
@@ -301,75 +812,127 @@ class CalculatorState(rx.State):
             if loadout_item["quantity"] > 1:
                 loadout_list[index] = {"item_id": loadout_item["item_id"], "quantity": loadout_item["quantity"] - 1}
 
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def loadout_augment_item(self) -> Item | None:
         """Returns the augment item object if equipped."""
         if self.loadout_augment:
-            return next((i for i in self.all_items if i["id"] == self.loadout_augment), None)
+            return get_catalog(self.catalog_version).item_by_id.get(self.loadout_augment)
         return None
     
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def loadout_shield_item(self) -> Item | None:
         """Returns the shield item object if equipped."""
         if self.loadout_shield:
-            return next((i for i in self.all_items if i["id"] == self.loadout_shield), None)
+            return get_catalog(self.catalog_version).item_by_id.get(self.loadout_shield)
         return None
     
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def loadout_weapon_1_item(self) -> Item | None:
         """Returns weapon 1 item object if equipped."""
         if self.loadout_weapon_1:
-            return next((i for i in self.all_items if i["id"] == self.loadout_weapon_1["item_id"]), None)
+            return get_catalog(self.catalog_version).item_by_id.get(self.loadout_weapon_1["item_id"])
         return None
     
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def loadout_weapon_2_item(self) -> Item | None:
         """Returns weapon 2 item object if equipped."""
         if self.loadout_weapon_2:
-            return next((i for i in self.all_items if i["id"] == self.loadout_weapon_2["item_id"]), None)
+            return get_catalog(self.catalog_version).item_by_id.get(self.loadout_weapon_2["item_id"])
         return None
     
-    @rx.var
-    def loadout_backpack_items(self) -> list[Item]:
-        """Returns list of item objects in backpack."""
-        return [next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), {"id": "", "name": "", "category": "Weapon", "icon": "", "image": None, "symbol": None, "resources": [], "tier_resources": {}, "rarity": "Common", "backpack_slots": None, "safe_pocket_slots": None, "quick_use_slots": None, "max_shield": None, "stack_size": 1})
-                for loadout_item in self.loadout_backpack]
-    
-    @rx.var
-    def loadout_quick_use_items(self) -> list[Item]:
-        """Returns list of item objects in quick use."""
-        return [next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), {"id": "", "name": "", "category": "Weapon", "icon": "", "image": None, "symbol": None, "resources": [], "tier_resources": {}, "rarity": "Common", "backpack_slots": None, "safe_pocket_slots": None, "quick_use_slots": None, "max_shield": None, "stack_size": 1})
-                for loadout_item in self.loadout_quick_use]
-    
-    @rx.var
-    def loadout_safe_pocket_items(self) -> list[Item]:
-        """Returns list of item objects in safe pocket."""
-        return [next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), {"id": "", "name": "", "category": "Weapon", "icon": "", "image": None, "symbol": None, "resources": [], "tier_resources": {}, "rarity": "Common", "backpack_slots": None, "safe_pocket_slots": None, "quick_use_slots": None, "max_shield": None, "stack_size": 1})
-                for loadout_item in self.loadout_safe_pocket]
+    def _weapon_mod_sockets(self, weapon: dict | None) -> list[WeaponModSocket]:
+        """Returns the mod slots of an equipped weapon with the mods that fit each one."""
+        if not weapon:
+            return []
+        catalog = get_catalog(self.catalog_version)
+        item = catalog.item_by_id.get(weapon["item_id"])
+        if not item:
+            return []
+        attached = weapon.get("mods") or {}
+        return [
+            {
+                "mod_slot": mod_slot,
+                "label": mod_slot.replace("_", " ").title(),
+                "mod_id": attached.get(mod_slot, ""),
+                "options": [
+                    {"id": mod_id, "name": catalog.item_by_id[mod_id]["name"]}
+                    for mod_id in catalog.mods_by_type.get(mod_slot, ())
+                ],
+            }
+            for mod_slot in item.get("weapon_mod_slots") or []
+        ]
 
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
+    def loadout_weapon_1_mod_sockets(self) -> list[WeaponModSocket]:
+        """Returns the mod slots of weapon 1."""
+        return self._weapon_mod_sockets(self.loadout_weapon_1)
+
+    @rx.var(deps=["catalog_revision"])
+    def loadout_weapon_2_mod_sockets(self) -> list[WeaponModSocket]:
+        """Returns the mod slots of weapon 2."""
+        return self._weapon_mod_sockets(self.loadout_weapon_2)
+
+    def _slot_views(self, entries: list[dict[str, int | str | None]]) -> list[SlotView]:
+        """Returns the display payload of each entry in a slot group."""
+        item_by_id = get_catalog(self.catalog_version).item_by_id
+        views: list[SlotView] = []
+        for entry in entries:
+            item = item_by_id.get(entry["item_id"])
+            if item is None:
+                views.append({"item_id": "", "name": "", "category": "", "rarity": "Common", "image": None,
+                              "symbol": None, "quantity": 0, "tier": None, "from_tier": 0})
+                continue
+            views.append({
+                "item_id": item["id"],
+                "name": item["name"],
+                "category": item["category"],
+                "rarity": item["rarity"],
+                "image": item["image"],
+                "symbol": item["symbol"],
+                "quantity": entry["quantity"],
+                "tier": entry.get("tier"),
+                "from_tier": entry.get("from_tier") or 0,
+            })
+        return views
+
+    @rx.var(deps=["catalog_revision"])
+    def backpack_slot_views(self) -> list[SlotView]:
+        """Returns the payload of each backpack slot."""
+        return self._slot_views(self.loadout_backpack)
+
+    @rx.var(deps=["catalog_revision"])
+    def quick_use_slot_views(self) -> list[SlotView]:
+        """Returns the payload of each quick use slot."""
+        return self._slot_views(self.loadout_quick_use)
+
+    @rx.var(deps=["catalog_revision"])
+    def safe_pocket_slot_views(self) -> list[SlotView]:
+        """Returns the payload of each safe pocket slot."""
+        return self._slot_views(self.loadout_safe_pocket)
+
+    @rx.var(deps=["catalog_revision"])
     def max_backpack_slots(self) -> int:
         """Returns the max backpack slots based on equipped augment."""
         if self.loadout_augment:
-            augment = next((i for i in self.all_items if i["id"] == self.loadout_augment), None)
+            augment = get_catalog(self.catalog_version).item_by_id.get(self.loadout_augment)
             if augment and augment.get("backpack_slots"):
                 return augment["backpack_slots"]
         return 14
     
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def max_quick_use_slots(self) -> int:
         """Returns the max quick use slots based on equipped augment."""
         if self.loadout_augment:
-            augment = next((i for i in self.all_items if i["id"] == self.loadout_augment), None)
+            augment = get_catalog(self.catalog_version).item_by_id.get(self.loadout_augment)
             if augment and augment.get("quick_use_slots"):
                 return augment["quick_use_slots"]
         return 4
     
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def max_safe_pocket_slots(self) -> int:
         """Returns the max safe pocket slots based on equipped augment."""
         if self.loadout_augment:
-            augment = next((i for i in self.all_items if i["id"] == self.loadout_augment), None)
+            augment = get_catalog(self.catalog_version).item_by_id.get(self.loadout_augment)
             if augment and augment.get("safe_pocket_slots"):
                 return augment["safe_pocket_slots"]
         return 0
@@ -377,12 +940,12 @@ class CalculatorState(rx.State):
     @staticmethod
     def get_resource_name(resource_id: str) -> str:
         """Returns the resource name from the resource ID."""
-        resource = RESOURCE_BY_ID.get(resource_id)
+        resource = get_catalog().resource_by_id.get(resource_id)
         return resource["name"] if resource else resource_id
     
     def get_weapon_tier_resources(self, item_id: str, tier: int) -> list:
         """Returns the resources for a weapon at a specific tier."""
-        item = next((i for i in self.all_items if i["id"] == item_id), None)
+        item = get_catalog(self.catalog_version).item_by_id.get(item_id)
         if item and item["category"] == "Weapon":
             return item["tier_resources"].get(tier, [])
         return []
@@ -391,7 +954,7 @@ class CalculatorState(rx.State):
         """Returns an item by its ID."""
         if not item_id:
             return None
-        return next((i for i in self.all_items if i["id"] == item_id), None)
+        return get_catalog(self.catalog_version).item_by_id.get(item_id)
     
     def _is_valid_drop(self, item_category: str, slot_type: str) -> bool:
         """Validates if an item category can be dropped into a slot type."""
@@ -456,10 +1019,12 @@ class CalculatorState(rx.State):
         if tier is None:
             tier = self.selected_weapon_tiers.get(item_id, 1)
         
+        from_tier = item_data.get("from_tier") or 0
+
         if position == 0:
-            self.loadout_weapon_1 = {"item_id": item_id, "quantity": 1, "tier": tier}
+            self.loadout_weapon_1 = {"item_id": item_id, "quantity": 1, "tier": tier, "from_tier": from_tier}
         elif position == 1:
-            self.loadout_weapon_2 = {"item_id": item_id, "quantity": 1, "tier": tier}
+            self.loadout_weapon_2 = {"item_id": item_id, "quantity": 1, "tier": tier, "from_tier": from_tier}
     
     def _drop_to_multi_slot(self, slot_type: str, position: int, item_id: str, item_data: dict):
         """Drops an item to a multi-item slot (backpack, quick_use, safe_pocket)."""
@@ -477,13 +1042,15 @@ class CalculatorState(rx.State):
         
         quantity = item_data.get("quantity", 1)
         tier = item_data.get("tier")
+        from_tier = item_data.get("from_tier") or 0
         
         item = self.get_item_by_id(item_id)
         if item and item["category"] != "Weapon":
             tier = None
+            from_tier = 0
         
         # Set the item at the specific position
-        loadout_list[position] = {"item_id": item_id, "quantity": quantity, "tier": tier}
+        loadout_list[position] = {"item_id": item_id, "quantity": quantity, "tier": tier, "from_tier": from_tier}
         
         # Clean up trailing None entries to avoid blank slots
         while loadout_list and loadout_list[-1]["item_id"] is None:
@@ -518,121 +1085,302 @@ class CalculatorState(rx.State):
             if position < len(loadout_list):
                 del loadout_list[position]
 
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def filtered_items(self) -> list[Item]:
         """Returns a list of items filtered by category and search query."""
-        items = self.all_items
-        if self.active_category != "All":
-            items = [item for item in items if item["category"] == self.active_category]
-        if self.search_query.strip():
-            query = self.search_query.lower().strip()
-            items = [item for item in items if query in item["name"].lower()]
-        return items
+        return get_catalog(self.catalog_version).search(self.search_query, self.active_category)
 
-    @rx.var
+    def _item_grid_window(self) -> tuple[int, int, int]:
+        """Returns the first and last mounted row of the item grid, and its total rows."""
+        total_rows = -(-len(self.filtered_items) // self.item_grid_columns)
+        # A stale scroll position past the end still shows the last rows
+        first_visible = min(self.item_grid_first_row, max(0, total_rows - self.item_grid_rows))
+        first = max(0, first_visible - ITEM_GRID_OVERSCAN_ROWS)
+        last = min(first_visible + self.item_grid_rows + ITEM_GRID_OVERSCAN_ROWS, total_rows)
+        return first, last, total_rows
+
+    @rx.var(deps=["catalog_revision"])
+    def visible_items(self) -> list[Item]:
+        """Returns the items in the mounted rows of the item grid."""
+        first, last, _ = self._item_grid_window()
+        catalog = get_catalog(self.catalog_version)
+        return [
+            {**item, "picture": catalog.picture(item["image"])}
+            for item in self.filtered_items[first * self.item_grid_columns:last * self.item_grid_columns]
+        ]
+
+    @rx.var(deps=["catalog_revision"])
+    def item_grid_offsets(self) -> ItemGridOffsets:
+        """Returns the height of the unmounted rows above and below the window, in pixels."""
+        first, last, total_rows = self._item_grid_window()
+        return {"top": first * ITEM_GRID_ROW_HEIGHT, "bottom": (total_rows - last) * ITEM_GRID_ROW_HEIGHT}
+
+    def _loadout_snapshot(self) -> dict:
+        """Returns the current loadout slots as a plain dict."""
+        return {
+            "loadout_augment": self.loadout_augment,
+            "loadout_shield": self.loadout_shield,
+            "loadout_weapon_1": self.loadout_weapon_1,
+            "loadout_weapon_2": self.loadout_weapon_2,
+            "loadout_backpack": self.loadout_backpack,
+            "loadout_quick_use": self.loadout_quick_use,
+            "loadout_safe_pocket": self.loadout_safe_pocket,
+        }
+
+    @rx.var(deps=["catalog_revision"])
+    def _loadout_group_costs(self) -> dict[str, list[int]]:
+        """Returns the cost vector of each slot group of the loadout, keyed like SLOT_GROUPS.
+
+        Backend only, and priced once per loadout edit; every cost var reads it
+        instead of repricing the loadout itself.
+        """
+        return self._loadout_group_vectors(self._loadout_snapshot())
+
+    @rx.var(deps=["catalog_revision"])
+    def _loadout_cost_vector(self) -> list[int]:
+        """Returns the cost vector of the loadout before any decomposition."""
+        return [sum(costs) for costs in zip(*self._loadout_group_costs.values())]
+
+    def _loadout_costs(self) -> list[int]:
+        """Returns a copy of the loadout cost vector, safe to decompose in place."""
+        return list(self._loadout_cost_vector)
+
+    def _loadout_vector(self, loadout: dict) -> list[int]:
+        """Returns the cost vector of a loadout snapshot before any decomposition."""
+        return [sum(costs) for costs in zip(*self._loadout_group_vectors(loadout).values())]
+
+    def _loadout_group_vectors(self, loadout: dict) -> dict[str, list[int]]:
+        """Returns the cost vector of each slot group of a loadout snapshot, keyed like SLOT_GROUPS."""
+        catalog = get_catalog(self.catalog_version)
+        groups = {group: [0] * len(catalog.resource_ids) for group in SLOT_GROUPS}
+
+        def add_item(group: str, item_id: str | None, tier: int | None, quantity: int, from_tier: int = 0) -> None:
+            # Weapons already owned at a lower tier only cost the upgrade
+            vector = catalog.upgrade_cost(item_id, from_tier, tier) if from_tier else catalog.item_cost(item_id, tier)
+            totals = groups[group]
+            for index, cost in enumerate(vector):
+                if cost:
+                    totals[index] += cost * quantity
+
+        # Equipment slots hold a single item each
+        add_item("equipment", loadout["loadout_augment"], None, 1)
+        add_item("equipment", loadout["loadout_shield"], None, 1)
+        for weapon in (loadout["loadout_weapon_1"], loadout["loadout_weapon_2"]):
+            if weapon:
+                add_item("equipment", weapon["item_id"], weapon["tier"], 1, weapon.get("from_tier") or 0)
+                for mod_id in (weapon.get("mods") or {}).values():
+                    add_item("equipment", mod_id, None, 1)
+
+        # Multi-slot sections carry quantities (and tiers for weapons in the backpack)
+        for group in ("backpack", "quick_use", "safe_pocket"):
+            for loadout_item in loadout[f"loadout_{group}"]:
+                add_item(group, loadout_item["item_id"], loadout_item.get("tier"), loadout_item["quantity"], loadout_item.get("from_tier") or 0)
+
+        return groups
+
+    @rx.var(deps=["catalog_revision"])
     def total_resources(self) -> dict[str, int]:
         """Calculates the total resources required for the selected items and loadout items with quantities."""
-        totals: dict[str, int] = {}
-        
-        # Helper function to decompose resources (not a method to avoid recursion tracking issues)
-        def add_resource(resource_id: str, quantity: int) -> None:
-            resource = RESOURCE_BY_ID.get(resource_id)
-            if not resource:
-                return
-            
-            # If this resource should be decomposed and it's refined, decompose it
-            if resource_id in self.decomposed_resources and resource["resource_type"] == "refined":
-                for component in resource["resources"]:
-                    component_id = component["resource"]
-                    component_quantity = component["quantity"] * quantity
-                    # Recursively decompose
-                    add_resource(component_id, component_quantity)
-            else:
-                # Don't decompose, just add to totals
-                totals[resource_id] = totals.get(resource_id, 0) + quantity
-        
-        # Process loadout items (augment, shield, weapons)
-        if self.loadout_augment:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_augment), None)
-            if item:
-                for cost in item["resources"]:
-                    add_resource(cost["resource"], cost["quantity"])
-        
-        if self.loadout_shield:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_shield), None)
-            if item:
-                for cost in item["resources"]:
-                    add_resource(cost["resource"], cost["quantity"])
-        
-        if self.loadout_weapon_1:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_weapon_1["item_id"]), None)
-            if item:
-                tier = self.loadout_weapon_1["tier"] or 1
-                for t in range(1, tier + 1):
-                    tier_costs = item["tier_resources"].get(t, [])
-                    for cost in tier_costs:
-                        add_resource(cost["resource"], cost["quantity"])
-        
-        if self.loadout_weapon_2:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_weapon_2["item_id"]), None)
-            if item:
-                tier = self.loadout_weapon_2["tier"] or 1
-                for t in range(1, tier + 1):
-                    tier_costs = item["tier_resources"].get(t, [])
-                    for cost in tier_costs:
-                        add_resource(cost["resource"], cost["quantity"])
-        
-        # Process loadout items with quantities (backpack, quick_use, safe_pocket)
-        for loadout_item in self.loadout_backpack:
-            item = next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), None)
-            if item:
-                item_quantity = loadout_item["quantity"]
-                if item["category"] == "Weapon":
-                    tier = loadout_item.get("tier") or 1
-                    for t in range(1, tier + 1):
-                        tier_costs = item["tier_resources"].get(t, [])
-                        for cost in tier_costs:
-                            add_resource(cost["resource"], cost["quantity"] * item_quantity)
-                else:
-                    for cost in item["resources"]:
-                        add_resource(cost["resource"], cost["quantity"] * item_quantity)
-        
-        for loadout_item in self.loadout_quick_use:
-            item = next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), None)
-            if item:
-                item_quantity = loadout_item["quantity"]
-                for cost in item["resources"]:
-                    add_resource(cost["resource"], cost["quantity"] * item_quantity)
-        
-        for loadout_item in self.loadout_safe_pocket:
-            item = next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), None)
-            if item:
-                item_quantity = loadout_item["quantity"]
-                for cost in item["resources"]:
-                    add_resource(cost["resource"], cost["quantity"] * item_quantity)
-        
-        return totals
+        catalog = get_catalog(self.catalog_version)
+        totals = catalog.decompose(self._loadout_costs(), self.decomposed_resources, self._owned_vector())
+        return catalog.to_resource_dict(totals)
+
+    def _owned_vector(self) -> list[int]:
+        """Returns the stash contents plus salvage yields as a vector, or an empty one if both are empty."""
+        if not self.inventory and not self.salvage:
+            return []
+        catalog = get_catalog(self.catalog_version)
+        owned = self._salvage_vector() or [0] * len(catalog.resource_ids)
+        for resource_id, quantity in self.inventory.items():
+            # The stash may hold resources that another game version does not have
+            if resource_id in catalog.resource_index:
+                owned[catalog.resource_index[resource_id]] += quantity
+        return owned
+
+    def _salvage_vector(self) -> list[int]:
+        """Returns what scrapping the salvage list yields, or an empty vector if it is empty.
+
+        Entries with unverified yields recover nothing, so they never cover a shortfall.
+        """
+        if not self.salvage:
+            return []
+        return get_recipe_graph(self.catalog_version).salvage_vector(self.salvage)
+
+    @rx.var(deps=["catalog_revision"])
+    def salvage_yields(self) -> dict[str, int]:
+        """Returns the resources recovered from the salvage list."""
+        return get_catalog(self.catalog_version).to_resource_dict(self._salvage_vector())
+
+    @rx.var(deps=["catalog_revision"])
+    def salvage_options(self) -> list[SalvageOption]:
+        """Returns everything that can be scrapped, with the planned quantity and its yields."""
+        catalog = get_catalog(self.catalog_version)
+        graph = get_recipe_graph(self.catalog_version)
+        options: list[SalvageOption] = []
+        for node_id, yields in graph.reverse.items():
+            node = catalog.item_by_id.get(node_id) or catalog.resource_by_id[node_id]
+            options.append({
+                "id": node_id,
+                "name": node["name"],
+                "quantity": self.salvage.get(node_id, 0),
+                "yields": ", ".join(
+                    f"{quantity} {catalog.resource_by_id[resource_id]['name']}" for resource_id, quantity in yields.items()
+                ),
+                "verified": node_id not in graph.unverified,
+            })
+        return sorted(options, key=lambda x: x["name"])
+
+    @rx.var(deps=["catalog_revision"])
+    def craftable_items(self) -> list[CraftableItem]:
+        """Returns the items and weapon tiers that can be crafted from the stash and salvage."""
+        if not self.inventory and not self.salvage:
+            return []
+        catalog = get_catalog(self.catalog_version)
+        craftable: list[CraftableItem] = []
+        for item_id, counts in catalog.max_craftable(self._owned_vector()).items():
+            item = catalog.item_by_id[item_id]
+            is_weapon = item["category"] == "Weapon"
+            for tier_index, count in enumerate(counts):
+                if count:
+                    craftable.append({
+                        "id": item_id,
+                        "name": item["name"],
+                        "tier": tier_index + 1 if is_weapon else None,
+                        "count": count,
+                    })
+        return sorted(craftable, key=lambda x: (x["name"], x["tier"] or 0))
+
+    @rx.var(deps=["catalog_revision"])
+    def loadout_craftable_count(self) -> int:
+        """Returns how many copies of the whole loadout can be crafted from the stash and salvage."""
+        if not self.inventory and not self.salvage:
+            return 0
+        catalog = get_catalog(self.catalog_version)
+        return catalog.craftable_count(self._loadout_cost_vector, self._owned_vector())
+
+    @rx.var
+    def has_inventory(self) -> bool:
+        """Returns whether any resources are in the stash."""
+        return len(self.inventory) > 0 or len(self.salvage) > 0
 
     @rx.var
     def sorted_total_resources(self) -> list[ResourceDisplay]:
         """Returns the total resources with full display information, sorted by rarity."""
+        return self._resource_display(self.total_resources)
+    
+    @rx.var(deps=["catalog_revision"])
+    def storage_footprint(self) -> StorageFootprint:
+        """Returns how many stash slots the totals fill, before and after decomposition."""
+        catalog = get_catalog(self.catalog_version)
+        after = sum(resource["slots"] for resource in self.sorted_total_resources)
+        if not self.decomposed_resources:
+            return {"before": after, "after": after}
+        return {"before": sum(catalog.stash_slots(self._loadout_cost_vector)), "after": after}
+
+    @rx.var(deps=["catalog_revision"])
+    def squad_total_resources(self) -> list[ResourceDisplay]:
+        """Returns the whole squad's resources, with the stash applied to the squad as a whole."""
+        if not self.squad:
+            return []
+        catalog = get_catalog(self.catalog_version)
+        # The active member comes from the cached loadout vector, everyone else from the running sum
+        costs = [a + b for a, b in zip(self._squad_others(), self._loadout_cost_vector)]
+        totals = catalog.to_resource_dict(catalog.decompose(costs, self.decomposed_resources, self._owned_vector()))
+        return self._resource_display(totals)
+
+    @rx.var(deps=["catalog_revision"])
+    def squad_member_totals(self) -> list[SquadMemberTotal]:
+        """Returns each squad member's resources, using the shared decomposition set."""
+        catalog = get_catalog(self.catalog_version)
+        members: list[SquadMemberTotal] = []
+        for index, member in enumerate(self.squad):
+            active = index == self.squad_active
+            # Copies, since decompose() works in place on the cached and stored vectors
+            costs = list(self._loadout_cost_vector if active else self._squad_member_costs(index))
+            totals = catalog.to_resource_dict(catalog.decompose(costs, self.decomposed_resources))
+            members.append({
+                "index": index,
+                "name": member["name"],
+                "active": active,
+                "resources": self._resource_display(totals, with_stash=False),
+            })
+        return members
+
+    def _resource_display(self, totals: dict[str, int], with_stash: bool = True) -> list[ResourceDisplay]:
+        """Returns resource totals with display information, sorted by rarity."""
         items: list[ResourceDisplay] = []
-        for resource_id, quantity in self.total_resources.items():
-            resource = RESOURCE_BY_ID.get(resource_id)
-            if resource:
-                items.append({
-                    "id": resource_id,
-                    "name": resource["name"],
-                    "quantity": quantity,
-                    "resource_type": resource["resource_type"],
-                    "rarity": resource["rarity"],
-                    "image": resource["image"],
-                })
-        # Define rarity order (highest rarity first)
+        resource_by_id = get_catalog(self.catalog_version).resource_by_id
+        for resource_id, quantity in totals.items():
+            resource = resource_by_id[resource_id]
+            slots = -(-quantity // resource["stack_size"])
+            owned = self.inventory.get(resource_id, 0) if with_stash else 0
+            salvaged = self.salvage_yields.get(resource_id, 0) if with_stash else 0
+            items.append({
+                "id": resource_id,
+                "name": resource["name"],
+                "quantity": quantity,
+                "owned": owned,
+                "salvaged": salvaged,
+                "missing": max(quantity - owned - salvaged, 0) if with_stash else 0,
+                "slots": slots,
+                "resource_type": resource["resource_type"],
+                "rarity": resource["rarity"],
+                "image": resource["image"],
+            })
         rarity_order = {"Legendary": 0, "Epic": 1, "Rare": 2, "Uncommon": 3, "Common": 4}
-        # Sort by rarity (then by name for same rarity)
         return sorted(items, key=lambda x: (rarity_order.get(x["rarity"], 999), x["name"]))
-    
+
+    @rx.var(deps=["catalog_revision"])
+    def _campaign_matrix(self) -> list[list[int]]:
+        """Returns one cost vector per campaign loadout and slot group.
+
+        Backend only, and rebuilt only when a loadout changes, so editing raid
+        counts or loss rates just recomputes the product in `campaign_resources`.
+        """
+        rows: list[list[int]] = []
+        for index, member in enumerate(self.squad or [None]):
+            # The active loadout is live in the loadout fields, not in its snapshot
+            if member is None or index == self.squad_active:
+                groups = self._loadout_group_costs
+            else:
+                groups = self._loadout_group_vectors(member["loadout"])
+            rows.extend(groups[group] for group in SLOT_GROUPS)
+        return rows
+
+    @rx.var
+    def campaign_rows(self) -> list[CampaignRow]:
+        """Returns the campaign loadouts with their planned raid counts."""
+        names = [member["name"] for member in self.squad] or ["Current loadout"]
+        return [{"index": index, "name": name, "raids": self._raids(index)} for index, name in enumerate(names)]
+
+    @rx.var(deps=["catalog_revision"])
+    def campaign_resources(self) -> list[ResourceDisplay]:
+        """Returns the resources needed for the whole raid schedule.
+
+        Each loadout is crafted once, then every further raid replaces the lost
+        share of each slot group. That is the product of the cost matrix with a
+        coefficient per (loadout, slot group) row, rounded up per resource.
+        """
+        catalog = get_catalog(self.catalog_version)
+        # Coefficients are in percent so the sums stay exact integers until rounding
+        needs = [0] * len(catalog.resource_ids)
+        for row_index, row in enumerate(self._campaign_matrix):
+            loadout, group = divmod(row_index, len(SLOT_GROUPS))
+            raids = self._raids(loadout)
+            if not raids:
+                continue
+            coefficient = 100 + (raids - 1) * self.campaign_loss_rates[SLOT_GROUPS[group]]
+            for index, cost in enumerate(row):
+                if cost:
+                    needs[index] += coefficient * cost
+        totals = catalog.decompose([-(-need // 100) for need in needs], self.decomposed_resources, self._owned_vector())
+        return self._resource_display(catalog.to_resource_dict(totals))
+
+    @rx.var(deps=["catalog_revision"])
+    def catalog_versions(self) -> list[str]:
+        """Returns the names of the game versions a loadout can be priced against."""
+        return catalog_versions()
+
     @rx.var
     def has_decomposed_resources(self) -> bool:
         """Returns whether any resources have been decomposed."""
@@ -651,84 +1399,31 @@ class CalculatorState(rx.State):
             or len(self.loadout_safe_pocket) > 0
         )
     
-    @rx.var
+    @rx.var(deps=["catalog_revision"])
     def decomposed_resources_display(self) -> list[ResourceDisplay]:
         """Returns a list of decomposed refined resources with their original quantities for display."""
         items: list[ResourceDisplay] = []
         
-        # Calculate original resource requirements before decomposition from loadout
-        original_totals: dict[str, int] = {}
-        
-        # Helper function to add resource costs
-        def add_to_original(resource_id: str, quantity: int) -> None:
-            original_totals[resource_id] = original_totals.get(resource_id, 0) + quantity
-        
-        # Process all loadout items
-        if self.loadout_augment:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_augment), None)
-            if item:
-                for cost in item["resources"]:
-                    add_to_original(cost["resource"], cost["quantity"])
-        
-        if self.loadout_shield:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_shield), None)
-            if item:
-                for cost in item["resources"]:
-                    add_to_original(cost["resource"], cost["quantity"])
-        
-        if self.loadout_weapon_1:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_weapon_1["item_id"]), None)
-            if item:
-                tier = self.loadout_weapon_1["tier"] or 1
-                for t in range(1, tier + 1):
-                    for cost in item["tier_resources"].get(t, []):
-                        add_to_original(cost["resource"], cost["quantity"])
-        
-        if self.loadout_weapon_2:
-            item = next((i for i in self.all_items if i["id"] == self.loadout_weapon_2["item_id"]), None)
-            if item:
-                tier = self.loadout_weapon_2["tier"] or 1
-                for t in range(1, tier + 1):
-                    for cost in item["tier_resources"].get(t, []):
-                        add_to_original(cost["resource"], cost["quantity"])
-        
-        for loadout_item in self.loadout_backpack:
-            item = next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), None)
-            if item:
-                if item["category"] == "Weapon":
-                    tier = loadout_item.get("tier") or 1
-                    for t in range(1, tier + 1):
-                        for cost in item["tier_resources"].get(t, []):
-                            add_to_original(cost["resource"], cost["quantity"] * loadout_item["quantity"])
-                else:
-                    for cost in item["resources"]:
-                        add_to_original(cost["resource"], cost["quantity"] * loadout_item["quantity"])
-        
-        for loadout_item in self.loadout_quick_use:
-            item = next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), None)
-            if item:
-                for cost in item["resources"]:
-                    add_to_original(cost["resource"], cost["quantity"] * loadout_item["quantity"])
-        
-        for loadout_item in self.loadout_safe_pocket:
-            item = next((i for i in self.all_items if i["id"] == loadout_item["item_id"]), None)
-            if item:
-                for cost in item["resources"]:
-                    add_to_original(cost["resource"], cost["quantity"] * loadout_item["quantity"])
+        # Original resource requirements before decomposition
+        catalog = get_catalog(self.catalog_version)
+        original_totals = catalog.to_resource_dict(self._loadout_cost_vector)
         
         # Only include resources that are in decomposed_resources
         for resource_id in self.decomposed_resources:
             if resource_id in original_totals:
-                resource = RESOURCE_BY_ID.get(resource_id)
-                if resource:
-                    items.append({
-                        "id": resource_id,
-                        "name": resource["name"],
-                        "quantity": original_totals[resource_id],
-                        "resource_type": resource["resource_type"],
-                        "rarity": resource["rarity"],
-                        "image": resource["image"],
-                    })
+                resource = catalog.resource_by_id[resource_id]
+                items.append({
+                    "id": resource_id,
+                    "name": resource["name"],
+                    "quantity": original_totals[resource_id],
+                    "owned": self.inventory.get(resource_id, 0),
+                    "salvaged": 0,
+                    "missing": 0,
+                    "slots": -(-original_totals[resource_id] // resource["stack_size"]),
+                    "resource_type": resource["resource_type"],
+                    "rarity": resource["rarity"],
+                    "image": resource["image"],
+                })
         
         # Define rarity order (highest rarity first)
         rarity_order = {"Legendary": 0, "Epic": 1, "Rare": 2, "Uncommon": 3, "Common": 4}
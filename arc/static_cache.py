@@ -0,0 +1,43 @@
+"""Long-lived cache headers for content-hashed static files.
+
+`arc.build_images` and `arc.build_fonts` name every file under `/img/` and `/fonts/`
+after a hash of its content, and the frontend bundler does the same for `/assets/`. The bytes behind such a URL
+never change, so browsers may keep them for a year without revalidating, and a
+repeat visit fetches none of them.
+
+The headers are added by an ASGI middleware around the backend, so they apply
+when the backend also serves the compiled frontend
+(`REFLEX_MOUNT_FRONTEND_COMPILED_APP=1`). A separate static host or CDN needs the
+same rule for these paths.
+"""
+
+from __future__ import annotations
+
+from reflex.config import get_config
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Paths whose files are content-hashed, relative to the frontend path
+IMMUTABLE_PREFIXES = ("/img/", "/fonts/", "/assets/")
+
+IMMUTABLE_CACHE_CONTROL = b"public, max-age=31536000, immutable"
+
+
+def immutable_assets(app: ASGIApp) -> ASGIApp:
+    """Wraps an ASGI app so successful responses for hashed files are cacheable forever."""
+    prefixes = tuple(get_config().prepend_frontend_path(prefix) for prefix in IMMUTABLE_PREFIXES)
+
+    async def with_cache_headers(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(prefixes):
+            await app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message: Message) -> None:
+            # Errors must stay uncached, or a file published late would be missing for a year
+            if message["type"] == "http.response.start" and message["status"] in (200, 304):
+                headers = [(name, value) for name, value in message.get("headers", []) if name.lower() != b"cache-control"]
+                message = {**message, "headers": [*headers, (b"cache-control", IMMUTABLE_CACHE_CONTROL)]}
+            await send(message)
+
+        await app(scope, receive, send_with_cache_control)
+
+    return with_cache_headers
@@ -10,7 +10,7 @@ WEAPON_MODS: list[Item] = [
         "symbol": "/symbols/s_muzzle.webp",
         "resources": [
             {"resource": "r_metal_parts", "quantity": 6},
-            {"resource": "r_wire", "quantity": 1},
+            {"resource": "r_wires", "quantity": 1},
         ],
         "tier_resources": {},
         "rarity": "Common",
@@ -31,7 +31,7 @@ WEAPON_MODS: list[Item] = [
         "symbol": "/symbols/s_muzzle.webp",
         "resources": [
             {"resource": "r_metal_parts", "quantity": 6},
-            {"resource": "r_wire", "quantity": 1},
+            {"resource": "r_wires", "quantity": 1},
         ],
         "tier_resources": {},
         "rarity": "Common",
@@ -52,7 +52,7 @@ WEAPON_MODS: list[Item] = [
         "symbol": "/symbols/s_shotgun_muzzle.webp",
         "resources": [
             {"resource": "r_metal_parts", "quantity": 6},
-            {"resource": "r_wire", "quantity": 1},
+            {"resource": "r_wires", "quantity": 1},
         ],
         "tier_resources": {},
         "rarity": "Common",
@@ -0,0 +1,99 @@
+/* Offline support. Registers the service worker from `python -m arc.build_offline`,
+   and while the backend is unreachable, renders the cached catalog into
+   #offline-grid, filtered by the search box and the category buttons. Events
+   queued meanwhile, such as loadout edits, are sent once the websocket reconnects. */
+(() => {
+  if ("serviceWorker" in navigator) {
+    navigator.serviceWorker.register("/sw.js").then(() => navigator.serviceWorker.ready).then((registration) => {
+      // The bundles of this first visit loaded before the worker was active, so hand them over
+      const urls = performance.getEntriesByType("resource")
+        .map((entry) => entry.name)
+        .filter((url) => new URL(url).origin === location.origin && !new URL(url).pathname.startsWith("/_"));
+      registration.active.postMessage({ cache: [location.pathname, ...urls] });
+    }).catch((error) => console.warn("Service worker registration failed", error));
+  }
+
+  let catalog = null;
+  // Set from the grid's data-active-category whenever a new offline grid mounts
+  let category = "All";
+
+  const loadCatalog = () => {
+    catalog ??= fetch("/catalog.json").then((response) => response.json());
+    return catalog;
+  };
+
+  // Same markup and classes as item_card, without the state-bound tier selector and tooltip
+  const card = (item) => {
+    const root = document.createElement("div");
+    root.dataset.rarity = item.rarity;
+    root.title = item.name;
+    root.className = "rounded-xl border-2 rarity-border bg-[#1a1a1a] shadow-sm flex flex-col h-40 overflow-hidden";
+    const content = document.createElement("div");
+    content.className = "flex items-center justify-center flex-1 min-h-0 p-2 sm:p-3";
+    if (item.image) {
+      const image = document.createElement("img");
+      image.src = item.image;
+      image.alt = item.name;
+      image.loading = "lazy";
+      image.className = "w-full h-full object-contain";
+      content.append(image);
+    } else {
+      content.textContent = item.name;
+      content.classList.add("text-sm", "text-white");
+    }
+    const bar = document.createElement("div");
+    bar.className = "h-[20%] bg-black flex items-center justify-between w-full flex-shrink-0";
+    if (item.symbol) {
+      const symbol = document.createElement("span");
+      symbol.dataset.sprite = item.symbol;
+      symbol.setAttribute("role", "img");
+      symbol.setAttribute("aria-label", "symbol");
+      symbol.className = "sprite block h-full aspect-square p-1";
+      bar.append(symbol);
+    }
+    root.append(content, bar);
+    return root;
+  };
+
+  const render = async () => {
+    const grid = document.getElementById("offline-grid");
+    if (!grid) return;
+    if (!grid.dataset.rendered) {
+      grid.dataset.rendered = "true";
+      category = grid.dataset.activeCategory || "All";
+    }
+    let items;
+    try {
+      items = await loadCatalog();
+    } catch {
+      catalog = null;
+      grid.replaceChildren("The catalog is not cached yet. It will be after one online visit.");
+      return;
+    }
+    // Same rule as Catalog.search
+    const query = (document.getElementById("search-input")?.value ?? "").toLowerCase().trim();
+    const matches = items.filter(
+      (item) => (category === "All" || item.category === category) && item.search.includes(query),
+    );
+    grid.replaceChildren(...matches.map(card));
+    const status = document.getElementById("offline-status");
+    if (status) {
+      status.textContent = `Offline: showing ${matches.length} ${category === "All" ? "" : `${category} `}items from the saved catalog`;
+    }
+  };
+
+  document.addEventListener("input", (event) => {
+    if (event.target.id === "search-input") render();
+  });
+  document.addEventListener("click", (event) => {
+    const button = event.target.closest("[data-category]");
+    if (!button) return;
+    category = button.dataset.category;
+    render();
+  });
+  // The grid mounts whenever the connection drops, so fill each new one
+  new MutationObserver(() => {
+    const grid = document.getElementById("offline-grid");
+    if (grid && !grid.dataset.rendered) render();
+  }).observe(document.documentElement, { childList: true, subtree: true });
+})();
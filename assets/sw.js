@@ -0,0 +1,93 @@
+// Generated by `python -m arc.build_offline`; do not edit.
+const CACHE = "arc-54d951291a1b-d513b5d4";
+const PRECACHE = [
+  "/",
+  "/offline.js",
+  "/catalog.json",
+  "/favicon.ico",
+  "/img/resources-atlas.09b7c6d75a38.webp",
+  "/img/resources-atlas.102e4b6655ac.avif",
+  "/img/symbols-atlas.4807f8629384.avif",
+  "/img/symbols-atlas.8dcfd224a0eb.webp",
+  "/fonts/roboto-400.1a3bfd2d3dcf.woff2",
+  "/fonts/roboto-500.dcf05715d9ff.woff2",
+  "/fonts/roboto-700.a9a26fd49f4d.woff2",
+  "/img/items/a_combat_mk_1-140w.76fbd5d53ee3.webp",
+  "/img/items/a_looting_mk_1-140w.4e2c8f253706.webp",
+  "/img/items/a_tactical_mk_1-140w.92285003a92e.webp",
+  "/img/items/h_bandage-140w.49ed3c3ad3cf.webp",
+  "/img/items/sh_light_shield-140w.ad3503166eb9.webp",
+  "/img/items/t_jolt_mine-140w.e56a36dafcb0.webp",
+  "/img/items/w_anvil-140w.1aac0aa713cb.webp",
+  "/img/items/w_arpeggio-140w.aabc5f0977ef.webp",
+  "/img/items/w_bettina-140w.f4ca7828cf3d.webp",
+  "/img/items/w_bobcat-140w.7cc8639c00ba.webp",
+  "/img/items/w_burletta-140w.e688995ce686.webp",
+  "/img/items/w_ferro-140w.fa453e0a6a1e.webp",
+  "/img/items/w_hairpin-140w.c230930e7d4d.webp",
+  "/img/items/w_hullcracker-140w.f41b7849d965.webp",
+  "/img/items/w_il_toro-140w.271880bca856.webp",
+  "/img/items/w_kettle-140w.8f15441efd1f.webp",
+  "/img/items/w_osprey-140w.809cc23ff9de.webp",
+  "/img/items/w_rattler-140w.c30fba74445b.webp",
+  "/img/items/w_renegade-140w.336c457d532f.webp",
+  "/img/items/w_stitcher-140w.cee71bf9ce15.webp",
+  "/img/items/w_tempest-140w.457002c5eda2.webp",
+  "/img/items/w_torrente-140w.0ca7de41183c.webp",
+  "/img/items/w_venator-140w.73859ff37dfc.webp",
+  "/img/items/w_vulcano-140w.333ab7dc1022.webp"
+];
+// Content-hashed, so a cached copy is always current
+const IMMUTABLE = ["/img/", "/fonts/", "/assets/"];
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches.open(CACHE)
+      .then((cache) => cache.addAll(PRECACHE.map((url) => new Request(url, { cache: "reload" }))))
+      .then(() => self.skipWaiting()),
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches.keys()
+      .then((keys) => Promise.all(keys.filter((key) => key.startsWith("arc-") && key !== CACHE).map((key) => caches.delete(key))))
+      .then(() => self.clients.claim()),
+  );
+});
+
+// The page sends the URLs it loaded before this worker controlled it
+self.addEventListener("message", (event) => {
+  if (Array.isArray(event.data?.cache)) {
+    event.waitUntil(caches.open(CACHE).then((cache) => Promise.all(event.data.cache.map(
+      (url) => cache.match(url).then((cached) => cached || cache.add(url).catch(() => undefined)),
+    ))));
+  }
+});
+
+const fetchAndCache = (request, cache) => fetch(request).then((response) => {
+  if (response.ok) cache.put(request, response.clone());
+  return response;
+});
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  const url = new URL(request.url);
+  // Leave the backend's event, upload and health endpoints to the network
+  if (request.method !== "GET" || url.origin !== location.origin || url.pathname.startsWith("/_") || url.pathname === "/ping") {
+    return;
+  }
+  const key = request.mode === "navigate" ? "/" : request;
+  event.respondWith(caches.open(CACHE).then((cache) => cache.match(key).then((cached) => {
+    if (cached && IMMUTABLE.some((prefix) => url.pathname.startsWith(prefix))) {
+      return cached;
+    }
+    // Serve the cached copy at once and refresh it in the background
+    const refreshed = fetchAndCache(request.mode === "navigate" ? "/" : request, cache);
+    if (cached) {
+      event.waitUntil(refreshed.catch(() => undefined));
+      return cached;
+    }
+    return refreshed;
+  })));
+});
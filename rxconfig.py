@@ -2,6 +2,8 @@ import reflex as rx
 
 config = rx.Config(
     app_name="arc",
+    # Precompressed sidecars of the exported frontend and assets, served by content negotiation
+    frontend_compression_formats=["gzip", "brotli"],
     plugins=[
         rx.plugins.SitemapPlugin(),
         rx.plugins.TailwindV4Plugin(),
@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+# Keep the compiled catalog store out of the shared temp dir; set before arc.catalog is imported
+os.environ.setdefault("ARC_CATALOG_STORE_DIR", tempfile.mkdtemp(prefix="arc_catalog_test_"))
+
+import pytest
+
+from arc.state import CalculatorState
+
+
+@pytest.fixture
+def state() -> CalculatorState:
+    """A fresh calculator state, outside of any app or client."""
+    return CalculatorState(_reflex_internal_init=True)
+
+
+def run(state: CalculatorState, event, *args):
+    """Runs an event handler directly against a state."""
+    return event.fn(state, *args)
+
+
+@pytest.fixture
+def verified_salvage(monkeypatch):
+    """Counts every salvage yield, as if the placeholder yields had been checked in game."""
+    from arc import recipe_graph, salvage_data
+
+    monkeypatch.setattr(salvage_data, "UNVERIFIED_SALVAGE", frozenset())
+    monkeypatch.setattr(recipe_graph, "_graphs", {})
@@ -0,0 +1,82 @@
+from arc.catalog import get_catalog
+from arc.state import CalculatorState
+from tests.conftest import run
+
+
+def _vector(catalog, **quantities):
+    vector = [0] * len(catalog.resource_ids)
+    for resource_id, quantity in quantities.items():
+        vector[catalog.resource_index[resource_id]] = quantity
+    return vector
+
+
+def test_decompose_expands_refined_resources_to_components():
+    catalog = get_catalog()
+    vector = _vector(catalog, r_advanced_mechanical_components=1, r_fabric=2)
+
+    catalog.decompose(vector, {"r_advanced_mechanical_components", "r_mechanical_components"})
+
+    assert catalog.to_resource_dict(vector) == {
+        "r_metal_parts": 14, "r_rubber_parts": 6, "r_steel_spring": 2, "r_fabric": 2,
+    }
+
+
+def test_decompose_uses_owned_refined_resources_first():
+    catalog = get_catalog()
+    vector = _vector(catalog, r_mechanical_components=3)
+    owned = _vector(catalog, r_mechanical_components=1)
+
+    catalog.decompose(vector, {"r_mechanical_components"}, owned)
+
+    assert catalog.to_resource_dict(vector) == {"r_mechanical_components": 1, "r_metal_parts": 14, "r_rubber_parts": 6}
+
+
+def test_craftable_count_crafts_missing_refined_resources():
+    catalog = get_catalog()
+    cost = catalog.item_cost("w_burletta", 1)
+    # Three mechanical components and the parts for six more
+    owned = _vector(catalog, r_simple_gun_parts=9, r_mechanical_components=3, r_metal_parts=42, r_rubber_parts=18)
+
+    assert catalog.can_craft(cost, owned, 3)
+    assert not catalog.can_craft(cost, owned, 4)
+    assert catalog.craftable_count(cost, owned) == 3
+    assert catalog.craftable_count((), owned) == 0
+
+
+def test_max_craftable_counts_every_weapon_tier():
+    catalog = get_catalog()
+    owned = _vector(catalog, r_fabric=12)
+
+    craftable = catalog.max_craftable(owned)
+
+    assert craftable["h_bandage"] == (2,)
+    assert all(count == 0 for count in craftable["w_kettle"])
+    assert len(craftable["w_kettle"]) == len(catalog.tier_costs("w_kettle"))
+    assert catalog.max_craftable(list(owned)) is craftable
+
+
+def test_salvage_alone_counts_toward_craftable_items(state, verified_salvage):
+    # Two mechanical components salvage into 6 metal and 2 rubber parts, enough for one Ferro
+    run(state, CalculatorState.set_salvage_quantity, "r_mechanical_components", "2")
+    run(state, CalculatorState.auto_equip_item, "w_ferro")
+
+    assert state.inventory == {}
+    assert {"id": "w_ferro", "name": "Ferro", "tier": 1, "count": 1} in state.craftable_items
+    assert state.loadout_craftable_count == 1
+
+
+def test_unverified_salvage_does_not_count_toward_craftable_items(state):
+    run(state, CalculatorState.set_salvage_quantity, "r_mechanical_components", "2")
+    run(state, CalculatorState.auto_equip_item, "w_ferro")
+
+    assert state.craftable_items == []
+    assert state.loadout_craftable_count == 0
+
+
+def test_an_empty_stash_vector_counts_as_zeros():
+    catalog = get_catalog()
+    cost = catalog.item_cost("h_bandage")
+
+    assert not catalog.can_craft(cost, [])
+    assert catalog.craftable_count(cost, []) == 0
+    assert catalog.max_craftable([])["h_bandage"] == (0,)
@@ -0,0 +1,49 @@
+import copy
+
+from arc.catalog import Catalog
+from arc.items_data import ITEMS
+from arc.resource_data import RESOURCES
+from arc.weapon_mods_data import WEAPON_MODS
+
+
+def _with_bandage_cost(items, quantity):
+    items = copy.deepcopy(items)
+    bandage = next(item for item in items if item["id"] == "h_bandage")
+    bandage["resources"] = [{"resource": "r_fabric", "quantity": quantity}]
+    return items
+
+
+def test_update_rebuilds_only_changed_items():
+    catalog = Catalog(ITEMS, RESOURCES, WEAPON_MODS)
+
+    updated = catalog.updated(_with_bandage_cost(ITEMS, 7), RESOURCES, WEAPON_MODS)
+
+    assert updated.revision == catalog.revision + 1
+    assert updated.to_resource_dict(updated.item_cost("h_bandage")) == {"r_fabric": 7}
+    assert catalog.to_resource_dict(catalog.item_cost("h_bandage")) == {"r_fabric": 5}
+    # Unchanged items share their bill of materials with the previous revision
+    assert updated.item_bom["w_kettle"] is catalog.item_bom["w_kettle"]
+    assert updated.item_bom["h_bandage"] is not catalog.item_bom["h_bandage"]
+
+
+def test_update_moves_reverse_index_postings():
+    catalog = Catalog(ITEMS, RESOURCES, WEAPON_MODS)
+    items = copy.deepcopy(ITEMS)
+    bandage = next(item for item in items if item["id"] == "h_bandage")
+    bandage["resources"] = [{"resource": "r_oil", "quantity": 1}]
+
+    updated = catalog.updated(items, RESOURCES, WEAPON_MODS)
+
+    assert "h_bandage" in updated.items_by_resource["r_oil"]
+    assert "h_bandage" not in updated.items_by_resource.get("r_fabric", frozenset())
+    assert "h_bandage" in catalog.items_by_resource["r_fabric"]
+
+
+def test_update_with_new_resources_rebuilds_everything():
+    catalog = Catalog(ITEMS, RESOURCES, WEAPON_MODS)
+    resources = [*RESOURCES, {**RESOURCES[0], "id": "r_scrap", "name": "Scrap"}]
+
+    updated = catalog.updated(ITEMS, resources, WEAPON_MODS)
+
+    assert len(updated.resource_ids) == len(catalog.resource_ids) + 1
+    assert len(updated.item_cost("w_kettle", 1)) == len(resources)
@@ -0,0 +1,107 @@
+import os
+import stat
+
+import pytest
+
+from arc import catalog_store
+from arc.catalog import DATA_MODULES, Catalog
+from arc.catalog_store import CatalogStore, catalog_fingerprint, catalog_store_path, write_catalog_store
+from arc.items_data import ITEMS
+from arc.resource_data import RESOURCES
+from arc.weapon_mods_data import WEAPON_MODS
+
+
+@pytest.fixture(scope="module")
+def built() -> Catalog:
+    return Catalog(ITEMS, RESOURCES, WEAPON_MODS)
+
+
+def test_store_round_trip(built, tmp_path):
+    path = tmp_path / "catalog.bin"
+    write_catalog_store(built, path)
+
+    mapped = Catalog.from_store(ITEMS, RESOURCES, WEAPON_MODS, CatalogStore(path))
+
+    assert mapped.resource_ids == built.resource_ids
+    assert mapped.decomposition_order == built.decomposition_order
+    assert mapped.search_keys == built.search_keys
+    assert mapped.items_by_resource == built.items_by_resource
+    for item_id, bom in built.item_bom.items():
+        assert [list(row) for row in mapped.item_bom[item_id]] == [list(row) for row in bom]
+    for resource_id, vector in built.decomposition.items():
+        assert list(mapped.decomposition[resource_id]) == list(vector)
+    assert list(mapped.item_cost("w_kettle", 3)) == list(built.item_cost("w_kettle", 3))
+
+
+def test_store_rows_are_read_only(built, tmp_path):
+    path = tmp_path / "catalog.bin"
+    write_catalog_store(built, path)
+
+    row = CatalogStore(path).row(0)
+
+    with pytest.raises(TypeError):
+        row[0] = 1
+
+
+def test_store_rejects_other_files(tmp_path):
+    path = tmp_path / "catalog.bin"
+    path.write_bytes(b"not a catalog store")
+
+    with pytest.raises(ValueError):
+        CatalogStore(path)
+
+
+def test_store_rejects_other_resources(built, tmp_path):
+    path = tmp_path / "catalog.bin"
+    write_catalog_store(built, path)
+
+    with pytest.raises(ValueError, match="different resources"):
+        Catalog.from_store(ITEMS, RESOURCES[:-1], WEAPON_MODS, CatalogStore(path))
+
+
+def test_fingerprint_tracks_the_data_modules():
+    fingerprint = catalog_fingerprint(DATA_MODULES)
+
+    assert catalog_fingerprint(DATA_MODULES) == fingerprint
+    assert catalog_fingerprint(DATA_MODULES[:-1]) != fingerprint
+    assert catalog_store_path(fingerprint).name == f"arc_catalog_{fingerprint[:16]}.bin"
+
+
+def test_fingerprint_covers_the_slot_config():
+    assert "arc.dnd_config" in catalog_store._SOURCE_MODULES
+
+
+def test_store_path_defaults_to_the_user_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv("ARC_CATALOG_STORE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    path = catalog_store_path("0" * 64)
+
+    assert path.parent == tmp_path / "arc"
+    assert path.parent.is_dir()
+
+
+def test_written_store_is_private(built, tmp_path):
+    path = tmp_path / "catalog.bin"
+    write_catalog_store(built, path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_store_others_can_write_is_refused(built, tmp_path):
+    path = tmp_path / "catalog.bin"
+    write_catalog_store(built, path)
+    path.chmod(0o666)
+
+    with pytest.raises(ValueError, match="not owned by and private"):
+        CatalogStore(path)
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="needs root to give the file away")
+def test_store_owned_by_another_user_is_refused(built, tmp_path):
+    path = tmp_path / "catalog.bin"
+    write_catalog_store(built, path)
+    os.chown(path, 65534, -1)
+
+    with pytest.raises(ValueError, match="not owned by and private"):
+        CatalogStore(path)
@@ -0,0 +1,24 @@
+import asyncio
+import importlib
+import sys
+
+import arc
+from arc import catalog
+
+
+def test_importing_a_data_module_later_is_not_an_edit(monkeypatch):
+    # Some data modules are only imported on first use, after the watcher took its baseline
+    monkeypatch.delitem(sys.modules, "arc.salvage_data", raising=False)
+    monkeypatch.delattr(arc, "salvage_data", raising=False)
+    revision = catalog.get_catalog().revision
+
+    async def watch_then_import() -> None:
+        watcher = asyncio.create_task(catalog.watch_catalog(interval=0.01))
+        await asyncio.sleep(0.05)
+        importlib.import_module("arc.salvage_data")
+        await asyncio.sleep(0.05)
+        watcher.cancel()
+
+    asyncio.run(watch_then_import())
+
+    assert catalog.get_catalog().revision == revision
@@ -0,0 +1,80 @@
+import asyncio
+import functools
+import threading
+
+from arc import jobs
+
+
+def _work(steps: int, *, job: jobs.Job, release: threading.Event | None = None) -> int:
+    done = 0
+    for done in range(1, steps + 1):
+        if job.cancelled.is_set():
+            break
+        job.report(done, steps, partial=done)
+        if release:
+            release.wait(1)
+    return done
+
+
+def test_one_job_per_owner_and_name():
+    job = jobs.start_job("client", "optimizer")
+    try:
+        assert job is not None
+        assert jobs.start_job("client", "optimizer") is None
+        other = jobs.start_job("other client", "optimizer")
+        assert other is not None
+    finally:
+        jobs._jobs.clear()
+
+
+def test_percent():
+    job = jobs.Job()
+    assert job.percent == 0
+    job.report(1, 4)
+    assert job.percent == 25
+
+
+def test_run_job_reports_progress_and_unregisters():
+    job = jobs.start_job("client", "count")
+    updates = []
+
+    async def on_progress(job: jobs.Job) -> None:
+        updates.append((job.done, job.total, job.partial))
+
+    result = asyncio.run(jobs.run_job("client", "count", job, _work, 3, on_progress=on_progress, interval=0.01))
+
+    assert result == 3
+    assert updates[-1] == (3, 3, 3)
+    assert ("client", "count") not in jobs._jobs
+
+
+def test_cancel_stops_the_worker():
+    job = jobs.start_job("client", "count")
+    release = threading.Event()
+
+    async def on_progress(job: jobs.Job) -> None:
+        if job.done == 1:
+            jobs.cancel_job("client", "count")
+            release.set()
+
+    result = asyncio.run(
+        jobs.run_job(
+            "client", "count", job, functools.partial(_work, release=release), 100,
+            on_progress=on_progress, interval=0.01,
+        )
+    )
+
+    assert job.cancelled.is_set()
+    assert result < 100
+    assert ("client", "count") not in jobs._jobs
+
+
+def test_finish_job_releases_the_name():
+    assert jobs.start_job("client", "optimizer") is not None
+
+    jobs.finish_job("client", "optimizer")
+    jobs.finish_job("client", "optimizer")
+
+    job = jobs.start_job("client", "optimizer")
+    assert job is not None
+    jobs.finish_job("client", "optimizer")
@@ -0,0 +1,74 @@
+from arc.catalog import get_catalog
+from arc.state import CalculatorState
+from tests.conftest import run
+
+COST_VARS = (
+    "total_resources",
+    "sorted_total_resources",
+    "loadout_craftable_count",
+    "storage_footprint",
+    "decomposed_resources_display",
+    "campaign_resources",
+)
+
+
+def _count_pricing(monkeypatch) -> list[dict]:
+    calls = []
+    price = CalculatorState._loadout_group_vectors
+
+    def spy(self, loadout):
+        calls.append(loadout)
+        return price(self, loadout)
+
+    monkeypatch.setattr(CalculatorState, "_loadout_group_vectors", spy)
+    return calls
+
+
+def test_the_loadout_is_priced_once_per_edit(state, monkeypatch):
+    state.inventory = {"r_metal_parts": 5}
+    calls = _count_pricing(monkeypatch)
+
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    for name in COST_VARS:
+        getattr(state, name)
+
+    assert len(calls) == 1
+
+
+def test_the_cached_costs_follow_every_edit(state):
+    catalog = get_catalog(state.catalog_version)
+
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    assert state.total_resources == catalog.to_resource_dict(catalog.item_cost("w_kettle", 1))
+
+    state.loadout_weapon_1 = None
+    assert state.total_resources == {}
+
+
+def test_the_squad_totals_reuse_the_active_loadout_price(state, monkeypatch):
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.start_squad)
+    run(state, CalculatorState.add_squad_member)
+    calls = _count_pricing(monkeypatch)
+
+    run(state, CalculatorState.auto_equip_item, "w_ferro")
+    state.squad_total_resources
+    state.squad_member_totals
+    state.total_resources
+
+    assert len(calls) == 1
+    active = state.squad_member_totals[1]
+    assert active["active"]
+    assert {resource["id"]: resource["quantity"] for resource in active["resources"]} == state.total_resources
+
+
+def test_decomposing_the_squad_totals_leaves_the_cached_vector_alone(state):
+    run(state, CalculatorState.auto_equip_item, "w_anvil")
+    run(state, CalculatorState.start_squad)
+    state.decomposed_resources = {"r_mechanical_components"}
+    priced = list(state._loadout_cost_vector)
+
+    state.squad_member_totals
+    state.squad_total_resources
+
+    assert state._loadout_cost_vector == priced
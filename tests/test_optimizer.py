@@ -0,0 +1,62 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from arc import optimizer
+from arc.catalog import get_catalog
+
+
+def test_quick_use_stacks_are_separate_entries():
+    catalog = get_catalog()
+    bandage = catalog.item_by_id["h_bandage"]
+    owned = [0] * len(catalog.resource_ids)
+    owned[catalog.resource_index["r_fabric"]] = 1000
+
+    units, stacks = optimizer._best_quick_use(catalog, [0] * len(owned), owned, [bandage], 3)
+
+    assert units == 3 * bandage["stack_size"]
+    assert len(stacks) == 3
+    stacks[0]["quantity"] = 1
+    assert [stack["quantity"] for stack in stacks[1:]] == [bandage["stack_size"]] * 2
+
+
+def test_worker_pool_is_replaced_after_a_catalog_reload(monkeypatch):
+    monkeypatch.setattr(optimizer, "_executor", None)
+    monkeypatch.setattr(optimizer, "_executor_revision", 0)
+    pool = optimizer._get_executor(0)
+    try:
+        assert optimizer._get_executor(0) is pool
+        reloaded = optimizer._get_executor(1)
+        assert reloaded is not pool
+        assert optimizer._get_executor(1) is reloaded
+    finally:
+        optimizer._executor.shutdown()
+        pool.shutdown()
+
+
+def test_a_large_stash_gets_two_top_tier_weapons():
+    catalog = get_catalog()
+    best, complete = optimizer.optimize_loadout([200] * len(catalog.resource_ids), time_limit=30)
+
+    assert complete
+    assert best["score"][0] == 2 * max(optimizer.WEAPON_TIERS)
+    assert best["weapon_1"]["tier"] == best["weapon_2"]["tier"] == max(optimizer.WEAPON_TIERS)
+
+
+def test_an_empty_stash_crafts_nothing():
+    assert optimizer.optimize_loadout([], time_limit=30) == (None, True)
+
+
+def test_a_broken_pool_is_shut_down(monkeypatch):
+    pool = ProcessPoolExecutor()
+    monkeypatch.setattr(optimizer, "_executor", pool)
+    future = Future()
+    future.set_exception(BrokenProcessPool("worker died"))
+
+    with pytest.raises(BrokenProcessPool):
+        optimizer._merge([future])
+
+    assert optimizer._executor is None
+    with pytest.raises(RuntimeError):
+        pool.submit(print)
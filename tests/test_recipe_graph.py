@@ -0,0 +1,109 @@
+import pytest
+
+from arc import recipe_graph
+from arc.catalog import CatalogError, get_catalog
+from arc.recipe_graph import RecipeGraph, find_cycle, get_recipe_graph
+from arc.salvage_data import SALVAGE_YIELDS
+from arc.state import CalculatorState
+from tests.conftest import run
+
+
+def _vector(catalog, **quantities):
+    vector = [0] * len(catalog.resource_ids)
+    for resource_id, quantity in quantities.items():
+        vector[catalog.resource_index[resource_id]] = quantity
+    return tuple(vector)
+
+
+def test_find_cycle():
+    assert find_cycle({"a": {"b": 1}, "b": {"c": 1}, "c": {}}) is None
+    assert find_cycle({"a": {"b": 1}, "b": {"c": 1}, "c": {"a": 1}}) == ["a", "b", "c", "a"]
+    assert find_cycle({"a": {"a": 1}}) == ["a", "a"]
+    # A node reached twice without a cycle is not one
+    assert find_cycle({"a": {"b": 1, "c": 1}, "b": {"c": 1}, "c": {}}) is None
+
+
+def test_salvage_cycle_is_rejected():
+    salvage = {
+        "r_mechanical_components": [{"resource": "r_advanced_mechanical_components", "quantity": 1}],
+        "r_advanced_mechanical_components": [{"resource": "r_mechanical_components", "quantity": 1}],
+    }
+    with pytest.raises(CatalogError, match="salvage cycle"):
+        RecipeGraph(get_catalog(), salvage)
+
+
+def test_salvage_yielding_more_than_its_cost_is_rejected():
+    salvage = {"r_light_gun_parts": [{"resource": "r_simple_gun_parts", "quantity": 5}]}
+    with pytest.raises(CatalogError, match="r_light_gun_parts: yields 5 r_simple_gun_parts, crafting costs 4"):
+        RecipeGraph(get_catalog(), salvage)
+
+
+def test_unknown_salvage_node_is_rejected():
+    with pytest.raises(CatalogError, match="unknown item or resource"):
+        RecipeGraph(get_catalog(), {"r_unobtainium": []})
+
+
+def test_expand_forward_recurses_to_basic_resources():
+    catalog = get_catalog()
+    graph = RecipeGraph(catalog, SALVAGE_YIELDS)
+
+    assert graph.expand("r_advanced_mechanical_components", "forward", recursive=False) == _vector(
+        catalog, r_mechanical_components=2, r_steel_spring=2
+    )
+    assert graph.expand("r_advanced_mechanical_components", "forward") == _vector(
+        catalog, r_metal_parts=14, r_rubber_parts=6, r_steel_spring=2
+    )
+
+
+def test_expand_reverse_follows_salvage_yields():
+    catalog = get_catalog()
+    graph = RecipeGraph(catalog, SALVAGE_YIELDS)
+
+    assert graph.expand("r_advanced_mechanical_components", "reverse") == _vector(
+        catalog, r_metal_parts=3, r_rubber_parts=1, r_steel_spring=1
+    )
+    # Memoized per node, direction and depth
+    assert graph.expand("r_advanced_mechanical_components", "reverse") is graph.expand(
+        "r_advanced_mechanical_components", "reverse"
+    )
+
+
+def test_salvage_vector_counts_direct_yields_only():
+    catalog = get_catalog()
+    graph = RecipeGraph(catalog, SALVAGE_YIELDS)
+
+    vector = graph.salvage_vector({"r_advanced_mechanical_components": 2, "r_light_gun_parts": 3, "r_wires": 4})
+
+    assert tuple(vector) == _vector(catalog, r_mechanical_components=2, r_steel_spring=2, r_simple_gun_parts=6)
+
+
+def test_salvage_vector_skips_unverified_yields():
+    catalog = get_catalog()
+    graph = RecipeGraph(catalog, SALVAGE_YIELDS, frozenset({"r_light_gun_parts"}))
+
+    vector = graph.salvage_vector({"r_advanced_mechanical_components": 2, "r_light_gun_parts": 3})
+
+    assert tuple(vector) == _vector(catalog, r_mechanical_components=2, r_steel_spring=2)
+
+
+def test_patched_version_drops_salvage_of_removed_items(monkeypatch, state, verified_salvage):
+    from arc import patches_data, salvage_data
+
+    monkeypatch.setattr(patches_data, "CATALOG_PATCHES", {
+        "Before Bandages": {"items": [], "resources": [], "removed_items": ["h_bandage"]},
+    })
+    monkeypatch.setattr(salvage_data, "SALVAGE_YIELDS", {
+        **SALVAGE_YIELDS, "h_bandage": [{"resource": "r_fabric", "quantity": 2}],
+    })
+    monkeypatch.setattr(recipe_graph, "_graphs", {})
+
+    assert "h_bandage" in get_recipe_graph().reverse
+    assert "h_bandage" not in get_recipe_graph("Before Bandages").reverse
+    assert "r_mechanical_components" in get_recipe_graph("Before Bandages").reverse
+
+    state.catalog_version = "Before Bandages"
+    run(state, CalculatorState.set_salvage_quantity, "h_bandage", "2")
+    run(state, CalculatorState.set_salvage_quantity, "r_light_gun_parts", "2")
+    assert state.salvage == {"r_light_gun_parts": 2}
+    assert "h_bandage" not in [option["id"] for option in state.salvage_options]
+    assert state.salvage_yields == {"r_simple_gun_parts": 4}
@@ -0,0 +1,36 @@
+from arc.state import CalculatorState
+from tests.conftest import run
+
+# The memoized slots render again only when their own SlotView entry changes, so these
+# count the slots whose props an edit touches.
+
+
+def _changed(before, after):
+    return [index for index, (old, new) in enumerate(zip(before, after)) if old != new]
+
+
+def _loadout(state):
+    run(state, CalculatorState.auto_equip_item, "a_looting_mk_1")
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    for item_id in ("h_bandage", "t_jolt_mine", "w_ferro", "w_ferro", "w_ferro"):
+        run(state, CalculatorState.equip_to_loadout, item_id, "backpack")
+    run(state, CalculatorState.auto_equip_item, "h_bandage")
+
+
+def test_stack_edit_changes_one_backpack_slot(state):
+    _loadout(state)
+    before = list(state.backpack_slot_views)
+
+    run(state, CalculatorState.increase_item_quantity, "backpack", 0)
+
+    assert _changed(before, state.backpack_slot_views) == [0]
+
+
+def test_weapon_tier_change_leaves_the_slot_groups_alone(state):
+    _loadout(state)
+    before = [list(state.backpack_slot_views), list(state.quick_use_slot_views)]
+
+    run(state, CalculatorState.set_loadout_weapon_tier, "weapon_1", 3)
+
+    assert state.loadout_weapon_1["tier"] == 3
+    assert [list(state.backpack_slot_views), list(state.quick_use_slot_views)] == before
@@ -0,0 +1,55 @@
+from arc.state import CalculatorState
+from tests.conftest import run
+
+
+def _add_member_with(state, item_id):
+    run(state, CalculatorState.add_squad_member)
+    run(state, CalculatorState.auto_equip_item, item_id)
+
+
+def test_removing_the_last_member_leaves_squad_mode(state):
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.start_squad)
+
+    run(state, CalculatorState.remove_squad_member, 0)
+
+    assert state.squad == []
+    assert state.squad_others_costs == []
+    assert state.loadout_weapon_1["item_id"] == "w_kettle"
+
+
+def test_removing_the_active_member_of_two_loads_the_other(state):
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.start_squad)
+    _add_member_with(state, "w_ferro")
+    assert state.squad_active == 1
+
+    run(state, CalculatorState.remove_squad_member, 1)
+
+    assert state.squad == []
+    assert state.loadout_weapon_1["item_id"] == "w_kettle"
+
+
+def test_removing_an_inactive_member_of_two_keeps_the_active_loadout(state):
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.start_squad)
+    _add_member_with(state, "w_ferro")
+
+    run(state, CalculatorState.remove_squad_member, 0)
+
+    assert state.squad == []
+    assert state.loadout_weapon_1["item_id"] == "w_ferro"
+
+
+def test_running_sum_matches_the_inactive_members(state):
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.start_squad)
+    _add_member_with(state, "w_ferro")
+    _add_member_with(state, "w_stitcher")
+    run(state, CalculatorState.switch_squad_member, 1)
+    run(state, CalculatorState.remove_squad_member, 1)
+
+    assert [member["name"] for member in state.squad] == ["Player 1", "Player 3"]
+    assert state.loadout_weapon_1["item_id"] == "w_kettle"
+    inactive = state._loadout_vector(state.squad[1]["loadout"])
+    assert state.squad_others_costs == inactive
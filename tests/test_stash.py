@@ -0,0 +1,42 @@
+from arc.state import CalculatorState
+from tests.conftest import run
+
+
+def _display(state):
+    return {resource["id"]: resource for resource in state.sorted_total_resources}
+
+
+def test_missing_counts_subtract_stash_and_salvage(state, verified_salvage):
+    # Kettle costs 6 metal parts and 8 rubber parts
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.set_owned_quantity, "r_metal_parts", "2")
+    run(state, CalculatorState.set_salvage_quantity, "r_mechanical_components", "1")
+
+    resources = _display(state)
+
+    assert resources["r_metal_parts"]["owned"] == 2
+    assert resources["r_metal_parts"]["salvaged"] == 3
+    assert resources["r_metal_parts"]["missing"] == 1
+    assert resources["r_rubber_parts"]["missing"] == 7
+
+
+def test_unverified_salvage_does_not_cover_missing_counts(state):
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.set_owned_quantity, "r_metal_parts", "2")
+    run(state, CalculatorState.set_salvage_quantity, "r_mechanical_components", "1")
+
+    resources = _display(state)
+
+    assert state.salvage == {"r_mechanical_components": 1}
+    assert state.salvage_yields == {}
+    assert resources["r_metal_parts"]["salvaged"] == 0
+    assert resources["r_metal_parts"]["missing"] == 4
+    option = next(option for option in state.salvage_options if option["id"] == "r_mechanical_components")
+    assert not option["verified"]
+
+
+def test_missing_counts_are_zero_once_covered(state):
+    run(state, CalculatorState.auto_equip_item, "w_kettle")
+    run(state, CalculatorState.set_owned_quantity, "r_metal_parts", "50")
+
+    assert _display(state)["r_metal_parts"]["missing"] == 0
@@ -0,0 +1,15 @@
+import inspect
+
+from arc.state import CalculatorState
+
+
+def test_catalog_backed_vars_depend_on_the_catalog_revision():
+    # A hot reload only bumps catalog_revision, so any var reading the catalog must depend on it
+    dependents = {var for _, var in CalculatorState._var_dependencies["catalog_revision"]}
+    reads_catalog = {
+        name for name, var in CalculatorState.computed_vars.items()
+        if "get_catalog(" in inspect.getsource(var._fget) or "catalog_versions(" in inspect.getsource(var._fget)
+    }
+
+    assert reads_catalog
+    assert reads_catalog <= dependents, sorted(reads_catalog - dependents)
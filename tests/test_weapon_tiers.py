@@ -0,0 +1,27 @@
+from arc.catalog import get_catalog
+from arc.state import CalculatorState
+from tests.conftest import run
+
+
+def test_backpack_weapon_prices_only_the_upgrade_from_its_owned_tier(state):
+    catalog = get_catalog()
+    run(state, CalculatorState.equip_to_loadout, "w_kettle", "backpack")
+    run(state, CalculatorState.set_loadout_weapon_tier, "backpack", 3, 0)
+    full = state._loadout_costs()
+
+    run(state, CalculatorState.set_loadout_weapon_from_tier, "backpack", "2", 0)
+
+    assert state.loadout_backpack[0]["from_tier"] == 2
+    assert full == list(catalog.item_cost("w_kettle", 3))
+    assert state._loadout_costs() == catalog.upgrade_cost("w_kettle", 2, 3)
+    assert state.backpack_slot_views[0]["from_tier"] == 2
+
+
+def test_upgrade_cost_is_the_difference_of_cumulative_tiers():
+    catalog = get_catalog()
+    upgrade = catalog.upgrade_cost("w_kettle", 1, 4)
+
+    assert [low + step for low, step in zip(catalog.item_cost("w_kettle", 1), upgrade)] == list(
+        catalog.item_cost("w_kettle", 4)
+    )
+    assert catalog.upgrade_cost("w_kettle", 0, 2) == catalog.item_cost("w_kettle", 2)